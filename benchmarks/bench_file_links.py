@@ -0,0 +1,149 @@
+# benchmarks/bench_file_links.py
+"""
+AnnouncementParser.extract_file_links (일반 탐색) 마이크로벤치마크.
+
+- 기존: link_patterns 4개마다 문서 전체 탐색, 링크마다 확장자 7개 any() 검사, 끝에서 dict로 중복 제거
+- 현재: <a> 한 번 순회, 미리 컴파일한 정규식, 순회하면서 바로 중복 제거
+
+첨부파일이 많은 합성 공지(일반 파일 링크, p.file "내려받기" 버튼, onclick 다운로드, 중복 링크 섞음)와
+저장된 상세 페이지(<pages>/<SOURCE>/detail/*.html)로 시간과 결과 일치 여부를 출력한다.
+
+사용:
+    python benchmarks/bench_file_links.py --pages ./output/saved_pages
+"""
+
+import os
+import sys
+import time
+import glob
+import random
+import argparse
+import logging
+from urllib.parse import urljoin, urlparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bs4 import BeautifulSoup
+
+from modules.announcement_parser import AnnouncementParser
+
+
+def old_extract_file_links(soup, base_url):
+    """기존 일반 탐색 (비교용 사본)"""
+    files = []
+    excluded_urls = ["https://che.yonsei.ac.kr/che/reunion/download.do"]
+    link_patterns = [
+        ('a', {'href': True}),
+        ('a', {'onclick': lambda x: 'download' in x.lower() if x else False}),
+        ('p.file a', {}),
+        ('span[data-ellipsis="true"]', {}),
+    ]
+    for selector, attrs in link_patterns:
+        for element in soup.select(selector) if selector.find('.') >= 0 else soup.find_all(selector, attrs):
+            href = element.get('href', '')
+            if element.get_text(strip=True) == "내려받기":
+                parent_p = element.find_parent('p', class_='file')
+                if parent_p:
+                    file_name_span = parent_p.find('span', attrs={'data-ellipsis': 'true'})
+                    if file_name_span:
+                        file_name = file_name_span.get_text(strip=True)
+                        file_url = urljoin(base_url, href)
+                        if file_url not in excluded_urls:
+                            files.append({"name": file_name, "url": file_url})
+                continue
+            if any(ext in href.lower() for ext in ['.pdf', '.doc', '.docx', '.xls', '.xlsx', '.zip', '.hwp']) or 'download' in href.lower():
+                file_url = urljoin(base_url, href)
+                parsed = urlparse(file_url)
+                if file_url in excluded_urls:
+                    continue
+                if parsed.scheme in ['http', 'https']:
+                    title_attr = element.get('title', '')
+                    if title_attr:
+                        file_name = title_attr.replace('다운로드', '').strip()
+                    else:
+                        file_name = element.get_text(strip=True)
+                    if not file_name:
+                        file_name = os.path.basename(parsed.path)
+                    files.append({"name": file_name, "url": file_url})
+    unique_files = {}
+    for file_info in files:
+        if file_info['url'] not in unique_files:
+            unique_files[file_info['url']] = file_info
+    return list(unique_files.values())
+
+
+def attachment_page(rng, attachments, noise_links):
+    """첨부파일 링크와 일반 링크가 섞인 공지 페이지"""
+    parts = []
+    for i in range(noise_links):
+        parts.append(f'<li><a href="/board/view.do?id={i}">공지 {i}</a></li>')
+    for i in range(attachments):
+        kind = rng.randrange(7)
+        n = rng.randrange(max(1, attachments // 2))  # 일부러 중복 URL이 생기게
+        if kind == 0:
+            parts.append(f'<a href="/files/{n}.PDF">첨부{n}.pdf</a>')
+        elif kind == 1:
+            parts.append(f'<a href="/download.do?fileNo={n}" title="첨부{n}.hwp 다운로드"><img src="/i.png"></a>')
+        elif kind == 2:
+            parts.append(f'<p class="file"><span data-ellipsis="true">자료{n}.xlsx</span>'
+                         f'<a href="/attach/{n}">내려받기</a></p>')
+        elif kind == 3:
+            parts.append(f'<p class="file"><span data-ellipsis="true">버튼{n}.zip</span>'
+                         f'<a onclick="Download({n})">내려받기</a></p>')
+        elif kind == 4:
+            parts.append(f'<a onclick="fnDownload({n})">다운로드</a>')
+        elif kind == 5:
+            parts.append(f'<a href="javascript:download({n})"></a>')
+        else:
+            parts.append('<a href="https://che.yonsei.ac.kr/che/reunion/download.do">동문회</a>')
+    rng.shuffle(parts)
+    return f"<html><body><div class='view'>{''.join(parts)}</div></body></html>"
+
+
+def bench(func, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--pages", default="./output/saved_pages")
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument("--random", type=int, default=300, help="일치 확인용 무작위 페이지 개수")
+    args = arg_parser.parse_args()
+
+    parser = AnnouncementParser("", logging.getLogger("bench"))
+    base_url = "https://www.yonsei.ac.kr/"
+
+    rng = random.Random(0)
+    mismatches = 0
+    for _ in range(args.random):
+        soup = BeautifulSoup(attachment_page(rng, rng.randint(0, 12), rng.randint(0, 5)), "html.parser")
+        if old_extract_file_links(soup, base_url) != parser.extract_file_links(soup, base_url):
+            mismatches += 1
+    print(f"무작위 페이지 {args.random}개: 불일치 {mismatches}개")
+
+    samples = [
+        (f"synthetic files={n} links={m}", BeautifulSoup(attachment_page(rng, n, m), "html.parser"))
+        for n, m in ((10, 50), (100, 300), (1000, 1000))
+    ]
+    for path in sorted(glob.glob(os.path.join(args.pages, "*", "detail", "*.html"))):
+        with open(path, "rb") as f:
+            samples.append((os.path.relpath(path, args.pages), BeautifulSoup(f.read(), "html.parser")))
+
+    print(f"{'page':40} {'files':>6} {'old ms':>9} {'new ms':>9} same")
+    for name, soup in samples:
+        old_time, old_files = bench(lambda: old_extract_file_links(soup, base_url), args.repeat)
+        new_time, new_files = bench(lambda: parser.extract_file_links(soup, base_url), args.repeat)
+        same = "=" if old_files == new_files else "≠"
+        print(f"{name[:40]:40} {len(new_files):>6} {old_time * 1000:>9.2f} {new_time * 1000:>9.2f} {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# benchmarks/bench_index_sink.py
+"""
+원격 적재(ISSAC POST)를 크롤러 스레드에서 바로 기다리는 방식 vs sink 단계(PipelineStage)로 넘기는 방식.
+
+가짜 크롤러가 사이트별로 공지를 저장하면서 index_to_issac을 부른다 (POST 한 번에 --latency 초 sleep).
+크롤러 스레드가 저장을 끝내기까지 걸린 시간, 모든 전송이 끝나기까지 걸린 시간,
+사이트별 전송 순서가 저장 순서와 같은지를 출력한다. 실제 네트워크 요청은 보내지 않는다.
+
+사용:
+    python benchmarks/bench_index_sink.py --sites 40 --docs 10 --latency 0.2
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from modules.pipeline import PipelineStage, _index_document
+
+
+class FakeCrawler:
+    def __init__(self, source, latency, sent):
+        self.source = source
+        self.latency = latency
+        self.sent = sent
+
+    def index_to_issac(self, doc):
+        time.sleep(self.latency)
+        self.sent.setdefault(self.source, []).append(doc["no"])
+
+
+def run(crawlers, docs, sink):
+    def crawl(crawler):
+        for no in range(docs):
+            doc = {"no": no}
+            if sink:
+                sink.put(crawler.source, (crawler, doc))
+            else:
+                crawler.index_to_issac(doc)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(crawlers)) as executor:
+        list(executor.map(crawl, crawlers))
+    crawled = time.perf_counter() - start
+    if sink:
+        sink.join()
+    return crawled, time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--sites", type=int, default=40)
+    arg_parser.add_argument("--docs", type=int, default=10, help="사이트당 공지 수")
+    arg_parser.add_argument("--latency", type=float, default=0.2, help="POST 한 번 걸리는 시간(초)")
+    arg_parser.add_argument("--workers", type=int, default=32, help="sink 전송 스레드 수")
+    arg_parser.add_argument("--queue", type=int, default=512, help="sink 큐 크기")
+    args = arg_parser.parse_args()
+
+    print(f"사이트 {args.sites}개 x 공지 {args.docs}건, POST {args.latency}s, sink 스레드 {args.workers}개 / 큐 {args.queue}")
+    for label, sink in (("inline", None), ("sink", PipelineStage("bench_sink", _index_document, args.workers, args.queue))):
+        sent = {}
+        crawlers = [FakeCrawler(f"SITE{i}", args.latency, sent) for i in range(args.sites)]
+        crawled, finished = run(crawlers, args.docs, sink)
+        ordered = all(sent[c.source] == list(range(args.docs)) for c in crawlers)
+        print(f"{label:7} 크롤러 스레드 {crawled:6.2f}s, 전송 완료 {finished:6.2f}s, 사이트별 순서 {'유지' if ordered else '깨짐'}")
+        if sink:
+            sink.close()
+
+
+if __name__ == "__main__":
+    main()
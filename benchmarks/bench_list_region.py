@@ -0,0 +1,87 @@
+# benchmarks/bench_list_region.py
+"""
+목록 페이지 부분 파싱(list_region) 전후 비교.
+
+SITES에 list_region이 있는 사이트의 저장된 목록 페이지로
+전체 파싱 / 영역만 파싱 각각의 시간, 최대 메모리(tracemalloc), 목록 핸들러 결과 일치 여부를 출력한다.
+
+페이지 배치는 bench_parse_backends.py와 같다: <pages>/<SOURCE>/list/*.html
+
+사용:
+    python benchmarks/bench_list_region.py --pages ./output/saved_pages
+    python benchmarks/bench_list_region.py --pages ./output/saved_pages --backend html.parser
+"""
+
+import os
+import sys
+import time
+import glob
+import argparse
+import logging
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from config.site_config import SITES
+from modules.html_backend import make_soup, parser_for, list_region_for
+from bench_parse_backends import build_crawler, parse_list
+
+
+def measure(func, repeat):
+    """(최소 시간, 최대 메모리, 결과)"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--pages", default="./output/saved_pages")
+    arg_parser.add_argument("--backend", help="파서 백엔드 (기본: 사이트 설정)")
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    logger = logging.getLogger("bench")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+
+    sources = [source for source in sorted(SITES) if list_region_for(source)]
+
+    print(f"{'source':40} {'pages':>5} {'full ms':>9} {'region ms':>9} {'full KB':>9} {'region KB':>9} same")
+    for source in sources:
+        files = sorted(glob.glob(os.path.join(args.pages, source, "list", "*.html")))
+        if not files:
+            continue
+        pages = []
+        for path in files:
+            with open(path, "rb") as f:
+                pages.append(f.read())
+
+        crawler = build_crawler(source, logger)
+        backend = args.backend or parser_for(source, "list")
+        region = list_region_for(source)
+
+        def run(use_region):
+            return [parse_list(crawler, make_soup(content, backend, region=region if use_region else None)) for content in pages]
+
+        full_time, full_peak, full_result = measure(lambda: run(False), args.repeat)
+        region_time, region_peak, region_result = measure(lambda: run(True), args.repeat)
+        same = "=" if full_result == region_result else "≠"
+        print(f"{source:40} {len(pages):>5} {full_time * 1000:>9.2f} {region_time * 1000:>9.2f} "
+              f"{full_peak / 1024:>9.1f} {region_peak / 1024:>9.1f} {same}")
+
+    print("(≠ 인 사이트는 list_region이 핸들러가 읽는 범위를 다 포함하지 않으므로 설정을 고칠 것)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+# benchmarks/bench_merge_text.py
+"""
+Parser.extract_and_merge_text 처리량 비교.
+
+- 기존: 항상 html5lib + prettify 후 BoilerPy3, 병합은 5단어 창마다 순수 파이썬 KMP로 전체 검색 (O(n·m))
+- 현재: BoilerPy3를 원본 HTML로 먼저 시도(실패/빈 결과일 때만 html5lib 정제), 병합은 앞쪽 몇 개 창만 str.find, 나머지는 단어 묶음 해시 인덱스 (O(n + m))
+
+<pages> 아래의 모든 *.html을 코퍼스로 쓰고, 단계별 시간과 초당 페이지 수,
+기존/현재 결과가 같은 페이지 수를 출력한다. 코퍼스가 없으면 합성 페이지만 돈다.
+
+사용:
+    python benchmarks/bench_merge_text.py --pages ./output/saved_pages
+"""
+
+import os
+import sys
+import time
+import glob
+import argparse
+import logging
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import trafilatura
+from bs4 import BeautifulSoup
+from boilerpy3 import extractors as boilerpy_extractors
+
+from modules.parser import Parser
+
+
+def kmp_search(text, pattern):
+    m = len(pattern)
+    pi = [0] * m
+    j = 0
+    for i in range(1, m):
+        while j > 0 and pattern[i] != pattern[j]:
+            j = pi[j - 1]
+        if pattern[i] == pattern[j]:
+            j += 1
+            pi[i] = j
+    j = 0
+    for i in range(len(text)):
+        while j > 0 and text[i] != pattern[j]:
+            j = pi[j - 1]
+        if text[i] == pattern[j]:
+            if j == m - 1:
+                return i - m + 1
+            j += 1
+    return -1
+
+
+def old_merge(trafilatura_text, boilerpy_text, window_size=5):
+    trafilatura_words = trafilatura_text.split()
+    boilerpy_text_str = " ".join(boilerpy_text.split())
+    for i in range(len(trafilatura_words) - window_size + 1):
+        pattern = " ".join(trafilatura_words[i:i + window_size])
+        pattern_pos = kmp_search(boilerpy_text_str, pattern)
+        if pattern_pos != -1:
+            trafilatura_words.insert(i, boilerpy_text_str[:pattern_pos].strip())
+            break
+    return " ".join(trafilatura_words)
+
+
+def old_boilerpy(parser, text):
+    try:
+        cleaned_html = BeautifulSoup(text, 'html5lib').prettify()
+        return parser.clean_text(boilerpy_extractors.ArticleExtractor().get_content(cleaned_html))
+    except Exception:
+        return ""
+
+
+def synthetic_page(paragraphs):
+    """메뉴/푸터 사이에 긴 본문이 있는 공지 페이지"""
+    menu = "".join(f"<li><a href='/m{i}'>메뉴 {i}</a></li>" for i in range(30))
+    body = "".join(
+        f"<p>{i}번째 문단입니다. 학생 여러분께 일정 변경 사항을 안내드립니다. "
+        f"신청 기간은 3월 {i % 28 + 1}일부터이며 자세한 내용은 학과 사무실로 문의 바랍니다.</p>"
+        for i in range(paragraphs)
+    )
+    return (f"<html><head><title>공지</title></head><body><ul class='nav'>{menu}</ul>"
+            f"<article><h1>공지사항 제목</h1>{body}</article>"
+            f"<footer>서울특별시 서대문구 연세로 50 Copyright</footer></body></html>").encode("utf-8")
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--pages", default="./output/saved_pages")
+    args = arg_parser.parse_args()
+
+    logger = logging.getLogger("bench")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    parser = Parser("", logger)
+
+    corpus = [(f"synthetic p={n}", synthetic_page(n)) for n in (20, 200, 1000)]
+    for path in sorted(glob.glob(os.path.join(args.pages, "**", "*.html"), recursive=True)):
+        with open(path, "rb") as f:
+            corpus.append((os.path.relpath(path, args.pages), f.read()))
+
+    totals = {"old boilerpy": 0.0, "new boilerpy": 0.0, "old merge": 0.0, "new merge": 0.0}
+    same = 0
+    print(f"{'page':40} {'trafil ms':>9} {'old bp ms':>9} {'new bp ms':>9} {'old mg ms':>9} {'new mg ms':>9} same")
+    for name, content in corpus:
+        text = content.decode("utf-8", errors="replace")
+        traf_time, traf_text = timed(lambda: parser.clean_text(trafilatura.extract(text)))
+
+        old_bp_time, old_bp_text = timed(lambda: old_boilerpy(parser, text))
+        new_bp_time, new_bp_text = timed(lambda: parser.extract_boilerpy_text(text, name))
+        old_mg_time, old_text = timed(lambda: old_merge(traf_text, old_bp_text) if old_bp_text else traf_text)
+        new_mg_time, new_text = timed(
+            lambda: parser.sliding_window_search_optimized(traf_text, new_bp_text) if new_bp_text else traf_text
+        )
+
+        totals["old boilerpy"] += old_bp_time
+        totals["new boilerpy"] += new_bp_time
+        totals["old merge"] += old_mg_time
+        totals["new merge"] += new_mg_time
+        same += old_text == new_text
+        print(f"{name[:40]:40} {traf_time * 1000:>9.2f} {old_bp_time * 1000:>9.2f} {new_bp_time * 1000:>9.2f} "
+              f"{old_mg_time * 1000:>9.2f} {new_mg_time * 1000:>9.2f} {'=' if old_text == new_text else '≠'}")
+
+    old_total = totals["old boilerpy"] + totals["old merge"]
+    new_total = totals["new boilerpy"] + totals["new merge"]
+    print()
+    print(" ".join(f"{k}={v * 1000:.1f}ms" for k, v in totals.items()))
+    print(f"boilerpy+merge 처리량: 기존 {len(corpus) / old_total:.1f} pages/s, 현재 {len(corpus) / new_total:.1f} pages/s "
+          f"(trafilatura 제외), 결과 동일 {same}/{len(corpus)}")
+
+    # 병합 최악 경우: 두 결과가 본문 끝에서야 겹침 (기존은 창마다 전체 KMP 검색)
+    words = [f"w{i}" for i in range(3000)]
+    trafilatura_text = " ".join(words)
+    boilerpy_text = " ".join(f"v{i}" for i in range(3000)) + " " + " ".join(words[-10:])
+    old_time, old_text = timed(lambda: old_merge(trafilatura_text, boilerpy_text))
+    new_time, new_text = timed(lambda: parser.sliding_window_search_optimized(trafilatura_text, boilerpy_text))
+    print(f"병합 최악 경우(3000단어, 끝에서 일치): 기존 {old_time * 1000:.1f}ms, 현재 {new_time * 1000:.1f}ms "
+          f"{'=' if old_text == new_text else '≠'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+# benchmarks/bench_parse_backends.py
+"""
+HTML 파서 백엔드 비교 (html.parser / lxml / html5lib / selectolax).
+
+저장해 둔 페이지로 사이트별 목록 파싱(_parse_list_page_* / get_next_notice_url)과
+상세 파싱(parse_notice)을 백엔드마다 돌려 시간과 결과 일치 여부(html.parser 기준)를 출력한다.
+config/parse_config.py나 SITES의 list_parser / detail_parser를 바꾸기 전에 돌려볼 것.
+
+페이지 배치:
+    <pages>/<SOURCE>/list/*.html     목록 페이지 (AnnouncementCrawler 계열은 상세 페이지 = 다음 글 링크 추출용, detail_parser 대상)
+    <pages>/<SOURCE>/detail/*.html   상세 페이지
+
+사용:
+    python benchmarks/bench_parse_backends.py --pages ./output/saved_pages
+    python benchmarks/bench_parse_backends.py --pages ./output/saved_pages --save   # 사이트별 현재 페이지를 먼저 저장
+"""
+
+import os
+import sys
+import time
+import glob
+import argparse
+import logging
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from config.site_config import SITES
+from modules.announcement_crawler import AnnouncementCrawler
+from modules.announcement_crawler_for_notice_list import ListAnnouncementCrawler
+from modules.announcement_crawler_for_ARCHITECTURE_ENGINEERING import ARCHITECTURE_ENGINEERING_AnnouncementCrawler
+from modules.html_backend import make_soup, LexborHTMLParser
+
+BACKENDS = ["html.parser", "lxml", "html5lib", "selectolax"]
+
+# parse_notice 결과 중 비교할 필드 (rawContent는 직렬화 방식이 백엔드마다 달라 제외)
+COMPARED_FIELDS = ["title", "createdDate", "author", "subCategory", "content", "files"]
+
+
+def build_crawler(source, logger):
+    """main.py와 같은 규칙으로 사이트 크롤러 생성"""
+    config = SITES[source]
+    kwargs = dict(
+        source=source,
+        base_url=config["base_url"],
+        start_url=config["start_url"],
+        url_number=config["url_number"],
+        sub_category_selector=config["sub_category_selector"],
+        next_page_selector=config["next_page_selector"],
+        title_selector=config["title_selector"],
+        date_selector=config["date_selector"],
+        author_selector=config["author_selector"],
+        content_selector=config["content_selector"],
+        logger=logger,
+    )
+    if source == "ARCHITECTURE_ENGINEERING":
+        return ARCHITECTURE_ENGINEERING_AnnouncementCrawler(**kwargs)
+    if config["next_page_selector"] == "null":
+        return ListAnnouncementCrawler(**kwargs)
+    return AnnouncementCrawler(**kwargs)
+
+
+def parse_list(crawler, soup):
+    if isinstance(crawler, (ListAnnouncementCrawler, ARCHITECTURE_ENGINEERING_AnnouncementCrawler)):
+        return crawler.parse_list_page(soup)
+    return crawler.get_next_notice_url(soup)
+
+
+def parse_detail(crawler, soup, url):
+    data = crawler.parser.parse_notice(
+        soup=soup,
+        base_domain=crawler.parser.extract_domain(url),
+        url=url,
+        source=crawler.source,
+        title_selector=crawler.title_selector,
+        date_selector=crawler.date_selector,
+        author_selector=crawler.author_selector,
+        content_selector=crawler.content_selector,
+        sub_category_selector=crawler.sub_category_selector,
+    )
+    return {k: data.get(k) for k in COMPARED_FIELDS}
+
+
+def save_pages(pages_dir, sources, crawlers):
+    """사이트별 첫 목록 페이지(또는 start_url)를 받아 저장"""
+    for source in sources:
+        crawler = crawlers[source]
+        if isinstance(crawler, ListAnnouncementCrawler):
+            page_param = 0 if crawler.is_offset_based else 1
+            url = crawler._build_list_url(page_param)
+        elif isinstance(crawler, ARCHITECTURE_ENGINEERING_AnnouncementCrawler):
+            url = crawler.build_list_url(1)
+        else:
+            url = crawler.start_url
+        if source == "POLITICAL_SCIENCE":
+            content = crawler.fetcher.fetch_with_form_data(url, source=source, page_param=page_param)
+        else:
+            content = crawler.fetcher.fetch_page_content(url, source=source)
+        if not content:
+            print(f"[{source}] 저장 실패: {url}")
+            continue
+        out_dir = os.path.join(pages_dir, source, "list")
+        os.makedirs(out_dir, exist_ok=True)
+        # Fetcher는 디코딩한 str을 돌려주므로 UTF-8로 저장
+        with open(os.path.join(out_dir, "page1.html"), "w", encoding="utf-8") as f:
+            f.write(content)
+        print(f"[{source}] 저장: {url}")
+
+
+def bench(func, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--pages", default="./output/saved_pages")
+    arg_parser.add_argument("--sources", nargs="*", help="비교할 사이트 (기본: 페이지가 있는 모든 사이트)")
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument("--save", action="store_true", help="비교 전에 사이트별 첫 목록 페이지를 받아 저장")
+    args = arg_parser.parse_args()
+
+    logger = logging.getLogger("bench")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+
+    sources = args.sources or sorted(SITES)
+    crawlers = {source: build_crawler(source, logger) for source in sources}
+    if args.save:
+        save_pages(args.pages, sources, crawlers)
+
+    backends = [b for b in BACKENDS if b != "selectolax" or LexborHTMLParser is not None]
+    totals = {(kind, b): 0.0 for kind in ("list", "detail") for b in backends}
+
+    print(f"{'source':40} {'kind':6} {'pages':>5} " + " ".join(f"{b:>18}" for b in backends))
+    for source in sources:
+        crawler = crawlers[source]
+        for kind in ("list", "detail"):
+            files = sorted(glob.glob(os.path.join(args.pages, source, kind, "*.html")))
+            if not files:
+                continue
+            pages = []
+            for path in files:
+                with open(path, "rb") as f:
+                    pages.append(f.read())
+
+            baseline = None
+            cells = []
+            for backend in backends:
+                if kind == "detail" and backend == "selectolax":
+                    # 상세 파싱은 BeautifulSoup 전체 API가 필요해 selectolax 대상이 아님
+                    cells.append(f"{'-':>18}")
+                    continue
+
+                def run():
+                    out = []
+                    for content in pages:
+                        soup = make_soup(content, backend)
+                        if kind == "list":
+                            out.append(parse_list(crawler, soup))
+                        else:
+                            out.append(parse_detail(crawler, soup, crawler.base_url))
+                    return out
+
+                try:
+                    elapsed, result = bench(run, args.repeat)
+                except Exception as e:
+                    cells.append(f"{'error':>18}")
+                    print(f"  [{source}/{kind}/{backend}] {type(e).__name__}: {e}")
+                    continue
+                if backend == "html.parser":
+                    baseline = result
+                same = "=" if result == baseline else "≠"
+                totals[(kind, backend)] += elapsed
+                cells.append(f"{elapsed * 1000:>15.2f}ms{same}")
+            print(f"{source:40} {kind:6} {len(pages):>5} " + " ".join(cells))
+
+    print()
+    for kind in ("list", "detail"):
+        print(f"합계 {kind:6} " + " ".join(f"{b}={totals[(kind, b)] * 1000:.1f}ms" for b in backends))
+    print("(= : html.parser와 결과 동일, ≠ : 다름 → 해당 사이트는 html.parser 유지)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# benchmarks/bench_parse_pool.py
+"""
+상세 페이지 파싱 처리량: 크롤러 스레드에서 직접 파싱 vs 파싱 프로세스 풀(ParsePool).
+
+main.py처럼 여러 스레드가 동시에 상세 페이지를 파싱할 때 걸린 시간을 비교한다.
+스레드 직접 파싱은 GIL 때문에 스레드를 늘려도 빨라지지 않고, 풀은 코어 수만큼 나눠진다.
+
+페이지: <pages>/<SOURCE>/detail/*.html (없으면 표/첨부파일이 많은 합성 공지를 ACADEMIC_NOTICE 선택자로)
+
+사용:
+    python benchmarks/bench_parse_pool.py --pages ./output/saved_pages --threads 8 --jobs 200
+"""
+
+import os
+import sys
+import time
+import glob
+import argparse
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from config.site_config import SITES
+from modules.parse_pool import ParsePool
+from bench_parse_backends import build_crawler
+
+
+def synthetic_detail(rows=300):
+    cells = "".join(
+        f"<tr><td>{r}</td><td>장학금 {r}</td><td><a href='/files/{r}.pdf'>신청서{r}.pdf</a></td><td>{'내용 ' * 10}</td></tr>"
+        for r in range(rows)
+    )
+    return (f"<html><body><div class='title'>합성 공지</div><div class='fr-view'>"
+            f"<table>{cells}</table>{'<p>본문 문단입니다. </p>' * 200}</div></body></html>")
+
+
+def run(pool, jobs, threads):
+    def parse(job):
+        crawler, html, url = job
+        return pool.parse(crawler.parser, html, crawler.detail_parser, url, crawler.source, crawler.plan)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(parse, jobs))
+    return time.perf_counter() - start, results
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--pages", default="./output/saved_pages")
+    arg_parser.add_argument("--threads", type=int, default=8)
+    arg_parser.add_argument("--jobs", type=int, default=200)
+    arg_parser.add_argument("--workers", type=int, help="풀 워커 수 (기본: CPU 코어 수)")
+    args = arg_parser.parse_args()
+
+    logger = logging.getLogger("bench")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+
+    pages = []
+    for source in sorted(SITES):
+        files = sorted(glob.glob(os.path.join(args.pages, source, "detail", "*.html")))
+        if not files:
+            continue
+        crawler = build_crawler(source, logger)
+        for path in files:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                pages.append((crawler, f.read(), crawler.base_url))
+    if not pages:
+        crawler = build_crawler("ACADEMIC_NOTICE", logger)
+        pages.append((crawler, synthetic_detail(), crawler.base_url))
+
+    jobs = [pages[i % len(pages)] for i in range(args.jobs)]
+
+    local = ParsePool(enabled=False)
+    pool = ParsePool(workers=args.workers)
+    # 워커 기동(spawn + import) 시간은 제외
+    run(pool, jobs[:pool.workers], pool.workers)
+
+    local_time, local_results = run(local, jobs, args.threads)
+    pool_time, pool_results = run(pool, jobs, args.threads)
+    pool.shutdown()
+
+    same = "=" if local_results == pool_results else "≠"
+    print(f"상세 페이지 {len(jobs)}건, 스레드 {args.threads}개, 풀 워커 {pool.workers}개")
+    print(f"스레드에서 직접 파싱: {local_time:.2f}s ({len(jobs) / local_time:.1f} pages/s)")
+    print(f"파싱 풀:              {pool_time:.2f}s ({len(jobs) / pool_time:.1f} pages/s) {same}")
+
+
+if __name__ == "__main__":
+    main()
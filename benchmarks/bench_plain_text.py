@@ -0,0 +1,95 @@
+# benchmarks/bench_plain_text.py
+"""
+parse_notice의 본문 평문(content) 추출 비교.
+
+- 기존: content_element.select("*")의 모든 하위 태그마다 get_text() → 깊이만큼 같은 텍스트가 반복(O(깊이 x 텍스트))
+- 현재: Parser.extract_plain_text() 한 번의 순회
+
+저장된 상세 페이지(<pages>/<SOURCE>/detail/*.html)와, 표가 깊게 중첩된 합성 공지로
+시간과 결과 길이를 출력한다.
+
+사용:
+    python benchmarks/bench_plain_text.py
+    python benchmarks/bench_plain_text.py --pages ./output/saved_pages --depth 12
+"""
+
+import os
+import sys
+import time
+import glob
+import argparse
+import logging
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bs4 import BeautifulSoup
+
+from config.site_config import SITES
+from modules.parser import Parser
+from modules.site_plan import get_site_plan, select_one
+
+
+def old_plain_text(content_element):
+    plain_text = ""
+    for element in content_element.select("*"):
+        text_content = element.get_text(strip=True)
+        if text_content:
+            plain_text += text_content + " "
+    return plain_text
+
+
+def nested_notice(depth, rows=6):
+    """표 안에 표가 depth단계로 중첩된 공지 본문"""
+    inner = "<p>세부 일정 <b>안내</b>: 2024년 3월 4일</p>"
+    for level in range(depth):
+        cells = "".join(
+            f"<tr><td><span>{level}-{r} 항목</span></td><td><div>{inner if r == 0 else '내용 ' * 20}</div></td></tr>"
+            for r in range(rows)
+        )
+        inner = f"<table><tbody>{cells}</tbody></table>"
+    return f"<html><body><div class='fr-view'>{inner}</div></body></html>"
+
+
+def bench(func, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--pages", default="./output/saved_pages")
+    arg_parser.add_argument("--depth", type=int, default=8, help="합성 공지의 표 중첩 깊이")
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    parser = Parser("", logging.getLogger("bench"))
+
+    samples = []
+    for depth in sorted({2, args.depth // 2, args.depth}):
+        soup = BeautifulSoup(nested_notice(depth), "html.parser")
+        samples.append((f"synthetic depth={depth}", soup.select_one(".fr-view")))
+
+    for source in sorted(SITES):
+        plan = get_site_plan(source)
+        for path in sorted(glob.glob(os.path.join(args.pages, source, "detail", "*.html"))):
+            with open(path, "rb") as f:
+                soup = BeautifulSoup(f.read(), "html.parser")
+            element = select_one(soup, plan.content)
+            if element is not None:
+                samples.append((f"{source}/{os.path.basename(path)}", element))
+
+    print(f"{'page':45} {'old ms':>9} {'new ms':>9} {'old chars':>10} {'new chars':>10}")
+    for name, element in samples:
+        old_time, old_text = bench(lambda: old_plain_text(element), args.repeat)
+        new_time, new_text = bench(lambda: parser.extract_plain_text(element), args.repeat)
+        print(f"{name[:45]:45} {old_time * 1000:>9.2f} {new_time * 1000:>9.2f} {len(old_text):>10} {len(new_text):>10}")
+
+
+if __name__ == "__main__":
+    main()
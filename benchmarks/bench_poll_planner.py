@@ -0,0 +1,129 @@
+# benchmarks/bench_poll_planner.py
+"""
+기존 시간표(get_next_run_time) vs 게시 이력으로 학습한 사이트별 폴링 간격(PollPlanner) 시뮬레이션.
+
+사이트별로 합성 게시 이력을 만든다 (평일 업무 시간에 몰리는 포아송 도착):
+하루 여러 건 올라오는 게시판부터 한 달에 한두 건 올라오는 게시판까지 섞는다.
+앞 --train-weeks 주는 이력으로 넣고(createdDate처럼 날짜만 / 감지 시각처럼 시간까지 섞어서),
+마지막 한 주 동안 두 방식으로 확인했을 때의 요청 수와 감지 지연(게시 → 다음 확인)을 비교한다.
+학습 방식은 평가 주간에도 감지한 글의 게시 시각을 이력에 계속 넣는다 (observe가 createdDate를 쓰는 것처럼).
+
+사용:
+    python benchmarks/bench_poll_planner.py --sites 79 --train-weeks 6
+"""
+
+import os
+import sys
+import random
+import argparse
+import tempfile
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from main import get_next_run_time, KST
+from modules import poll_planner
+from modules.poll_planner import PollPlanner, WEEK_SECONDS
+
+DAY = 86400
+
+
+def arrivals(rng, start, end, posts_per_week):
+    """평일 09~18시에 80%, 나머지 시간에 20%가 올라오는 포아송 도착"""
+    out = []
+    hour = start
+    busy_rate = posts_per_week * 0.8 / 45
+    quiet_rate = posts_per_week * 0.2 / (168 - 45)
+    while hour < end:
+        moment = datetime.fromtimestamp(hour, KST)
+        busy = moment.weekday() < 5 and 9 <= moment.hour < 18
+        rate = busy_rate if busy else quiet_rate
+        # 한 시간 안의 도착 수 (작은 rate라 베르누이 여러 번으로 근사)
+        for _ in range(20):
+            if rng.random() < rate / 20:
+                out.append(hour + rng.random() * 3600)
+        hour += 3600
+    return sorted(out)
+
+
+def timetable(now):
+    return get_next_run_time(datetime.fromtimestamp(now, KST)).timestamp()
+
+
+def simulate(posts, start, end, next_due, on_detect=None):
+    """(확인 횟수, 감지 지연 리스트)"""
+    polls = 0
+    latencies = []
+    index = 0
+    now = start
+    while now < end:
+        now = next_due(now)
+        polls += 1
+        found = []
+        while index < len(posts) and posts[index] <= now:
+            found.append(posts[index])
+            index += 1
+        latencies += [now - p for p in found]
+        if on_detect and found:
+            on_detect(now, found)
+    return polls, latencies
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--sites", type=int, default=79)
+    arg_parser.add_argument("--train-weeks", type=int, default=6)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--target", type=float, help="POLL_TARGET_POSTS 대신 쓸 값")
+    args = arg_parser.parse_args()
+    if args.target:
+        poll_planner.POLL_TARGET_POSTS = args.target
+
+    rng = random.Random(args.seed)
+    # 월요일 00:00 KST 기준
+    origin = KST.localize(datetime(2025, 3, 3)).timestamp()
+    eval_start = origin + args.train_weeks * WEEK_SECONDS
+    eval_end = eval_start + WEEK_SECONDS
+
+    rows = {"busy": [0, 0, [], []], "medium": [0, 0, [], []], "quiet": [0, 0, [], []]}
+    with tempfile.TemporaryDirectory() as tmp:
+        planner = PollPlanner(path=os.path.join(tmp, "poll.json"))
+        for i in range(args.sites):
+            posts_per_week = rng.choice([30, 15, 5, 2, 1, 0.5, 0.25])
+            group = "busy" if posts_per_week >= 15 else "medium" if posts_per_week >= 2 else "quiet"
+            source = f"SITE{i:02d}"
+            history = arrivals(rng, origin, eval_start, posts_per_week)
+            future = arrivals(rng, eval_start, eval_end, posts_per_week)
+
+            # createdDate(날짜만)와 감지 시각(시간까지)이 반씩 섞인 이력
+            planner.record(source, [], now=origin)
+            planner.record(source, [t for t in history if rng.random() < 0.5], exact=True, now=eval_start)
+            planner.record(source, [t - (t - origin) % DAY for t in history if rng.random() < 0.5], exact=False, now=eval_start)
+
+            old_polls, old_lat = simulate(future, eval_start, eval_end, timetable)
+            new_polls, new_lat = simulate(
+                future, eval_start, eval_end,
+                lambda now: planner.next_due(source, lambda: timetable(now), now=now),
+                lambda now, found: planner.record(source, found, now=now),
+            )
+            row = rows[group]
+            row[0] += old_polls
+            row[1] += new_polls
+            row[2] += old_lat
+            row[3] += new_lat
+
+    def mean_minutes(values):
+        return sum(values) / len(values) / 60 if values else float("nan")
+
+    print(f"사이트 {args.sites}개, 학습 {args.train_weeks}주, 평가 1주, 목표 예상 게시 수 {poll_planner.POLL_TARGET_POSTS}")
+    print(f"{'group':8} {'posts':>6} {'old polls':>10} {'new polls':>10} {'old lat(min)':>13} {'new lat(min)':>13}")
+    for group, (old_polls, new_polls, old_lat, new_lat) in rows.items():
+        print(f"{group:8} {len(old_lat):>6} {old_polls:>10} {new_polls:>10} "
+              f"{mean_minutes(old_lat):>13.1f} {mean_minutes(new_lat):>13.1f}")
+    total_old = sum(row[0] for row in rows.values())
+    total_new = sum(row[1] for row in rows.values())
+    print(f"전체 요청: {total_old} → {total_new} ({total_new / total_old:.2f}배)")
+
+
+if __name__ == "__main__":
+    main()
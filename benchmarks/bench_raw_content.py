@@ -0,0 +1,107 @@
+# benchmarks/bench_raw_content.py
+"""
+parse_notice의 rawContent 생성 비교.
+
+- 기존: str(content_element) 후 문자열 전체에 replace 1번 + re.sub 2번 (본문 크기만큼 복사 3번)
+- 현재: Parser.render_content_html() - 트리에서 src/href를 고치고 한 번만 직렬화
+
+저장된 상세 페이지(<pages>/<SOURCE>/detail/*.html)와 링크/이미지가 많은 합성 공지로
+시간, 최대 메모리(tracemalloc), 결과 일치 여부를 출력한다.
+
+사용:
+    python benchmarks/bench_raw_content.py --pages ./output/saved_pages
+"""
+
+import os
+import re
+import sys
+import time
+import glob
+import argparse
+import logging
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bs4 import BeautifulSoup
+
+from config.site_config import SITES
+from modules.parser import Parser
+from modules.site_plan import get_site_plan, select_one
+
+
+def old_raw_content(content_element, base_domain):
+    content_html = str(content_element)
+    content_html = content_html.replace('\\"', "'")
+    if base_domain.endswith('/'):
+        base_domain = base_domain[:-1]
+    content_html = re.sub(r'src="(\/[^"]+)"', fr'src="{base_domain}\1"', content_html)
+    content_html = re.sub(r'href="(?!http[s]?://)((?!javascript:)[^"]+)"', fr'href="{base_domain}\1"', content_html)
+    return content_html
+
+
+def synthetic_notice(paragraphs):
+    """상대/절대 링크, 이미지, data-src, javascript: 링크가 섞인 긴 본문"""
+    rows = []
+    for i in range(paragraphs):
+        rows.append(
+            f'<p>안내 {i} <a href="/board/view.do?id={i}&amp;mode=view">상대 링크</a> '
+            f'<a href="https://other.example.com/{i}">절대 링크</a> '
+            f'<a href="javascript:download({i})">다운로드</a> <a href="#top">맨 위</a> '
+            f'<img src="/upload/{i}.png" data-src="/upload/{i}_large.png"> '
+            f'<img src="https://cdn.example.com/{i}.png"> {"본문 내용 " * 30}</p>'
+        )
+    return f"<html><body><div class='fr-view'>{''.join(rows)}</div></body></html>"
+
+
+def measure(func, repeat):
+    """(최소 시간, 최대 메모리, 결과)"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--pages", default="./output/saved_pages")
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    parser = Parser("", logging.getLogger("bench"))
+    base_domain = "https://www.yonsei.ac.kr/"
+
+    samples = []
+    for paragraphs in (10, 100, 1000):
+        soup = BeautifulSoup(synthetic_notice(paragraphs), "html.parser")
+        samples.append((f"synthetic p={paragraphs}", soup.select_one(".fr-view"), base_domain))
+
+    for source in sorted(SITES):
+        plan = get_site_plan(source)
+        for path in sorted(glob.glob(os.path.join(args.pages, source, "detail", "*.html"))):
+            with open(path, "rb") as f:
+                soup = BeautifulSoup(f.read(), "html.parser")
+            element = select_one(soup, plan.content)
+            if element is not None:
+                samples.append((f"{source}/{os.path.basename(path)}", element, SITES[source]["base_url"]))
+
+    print(f"{'page':40} {'old ms':>9} {'new ms':>9} {'old KB':>9} {'new KB':>9} same")
+    for name, element, domain in samples:
+        old_time, old_peak, old_html = measure(lambda: old_raw_content(element, domain), args.repeat)
+        new_time, new_peak, new_html = measure(lambda: parser.render_content_html(element, domain), args.repeat)
+        same = "=" if old_html == new_html else "≠"
+        print(f"{name[:40]:40} {old_time * 1000:>9.2f} {new_time * 1000:>9.2f} "
+              f"{old_peak / 1024:>9.1f} {new_peak / 1024:>9.1f} {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# benchmarks/bench_scheduler.py
+"""
+사이클(barrier) 방식 vs 연속 스케줄러(SiteScheduler)의 사이트별 확인 간격 비교.
+
+사이트 확인 시간을 가짜 작업(sleep)으로 흉내 낸다: 대부분은 짧고, 몇 개는 매우 느리다
+(전체 역순 크롤링, 재시도 중인 호스트). 시간표 간격(--period)마다 확인한다.
+
+- 사이클: 모든 사이트를 제출 → 전부 끝날 때까지 대기 → 다음 시간표 칸까지 sleep
+- 연속: 사이트마다 끝난 뒤 다음 시간표 칸에 다시 due
+
+빠른 사이트의 평균/최대 확인 간격(= 새 공지 감지 지연의 상한)과 실행 횟수를 출력한다.
+시간은 초 단위로 축소해서 돌린다.
+
+사용:
+    python benchmarks/bench_scheduler.py --sites 40 --slow 2 --period 1 --slow-time 2.5 --duration 10
+"""
+
+import os
+import sys
+import time
+import math
+import random
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from modules.scheduler import SiteScheduler
+
+
+def next_slot(origin, period):
+    """origin 기준 period 간격 시간표에서 지금 이후 첫 칸"""
+    now = time.time()
+    return origin + (math.floor((now - origin) / period) + 1) * period
+
+
+def make_sites(args, rng):
+    return {
+        f"site{i:02d}": (args.slow_time if i < args.slow else rng.uniform(0.01, args.fast_time))
+        for i in range(args.sites)
+    }
+
+
+def record(checks, lock, name):
+    with lock:
+        checks.setdefault(name, []).append(time.time())
+
+
+def run_barrier(sites, args):
+    checks, lock = {}, threading.Lock()
+    origin = time.time()
+    deadline = origin + args.duration
+
+    def work(name, cost):
+        time.sleep(cost)
+        record(checks, lock, name)
+
+    with ThreadPoolExecutor(max_workers=len(sites)) as executor:
+        while time.time() < deadline:
+            list(executor.map(lambda item: work(*item), sites.items()))
+            time.sleep(max(0, next_slot(origin, args.period) - time.time()))
+    return checks
+
+
+def run_continuous(sites, args):
+    checks, lock = {}, threading.Lock()
+    origin = time.time()
+    scheduler = SiteScheduler(workers=len(sites))
+
+    def work(name, cost):
+        time.sleep(cost)
+        record(checks, lock, name)
+
+    for name, cost in sites.items():
+        scheduler.add(name, lambda name=name, cost=cost: work(name, cost), lambda: next_slot(origin, args.period))
+    scheduler.start()
+    time.sleep(args.duration)
+    scheduler.stop()
+    return checks
+
+
+def summarize(label, sites, checks, args):
+    fast = [name for name in sites if name >= f"site{args.slow:02d}"]
+    gaps = []
+    for name in fast:
+        times = checks.get(name, [])
+        gaps += [b - a for a, b in zip(times, times[1:])]
+    runs = sum(len(checks.get(name, [])) for name in fast)
+    mean_gap = sum(gaps) / len(gaps) if gaps else float("nan")
+    max_gap = max(gaps) if gaps else float("nan")
+    print(f"{label:6} 빠른 사이트 확인 {runs:>5}회, 확인 간격 평균 {mean_gap:.2f}s / 최대 {max_gap:.2f}s")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--sites", type=int, default=40)
+    arg_parser.add_argument("--slow", type=int, default=2, help="느린 사이트 수")
+    arg_parser.add_argument("--period", type=float, default=1.0, help="시간표 간격(초)")
+    arg_parser.add_argument("--fast-time", type=float, default=0.2, help="빠른 사이트 확인 시간 상한(초)")
+    arg_parser.add_argument("--slow-time", type=float, default=2.5, help="느린 사이트 확인 시간(초)")
+    arg_parser.add_argument("--duration", type=float, default=10.0)
+    args = arg_parser.parse_args()
+
+    sites = make_sites(args, random.Random(0))
+    print(f"사이트 {args.sites}개 (느린 사이트 {args.slow}개 x {args.slow_time}s), 시간표 간격 {args.period}s, {args.duration}s 동안")
+    summarize("사이클", sites, run_barrier(sites, args), args)
+    summarize("연속", sites, run_continuous(sites, args), args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+# benchmarks/bench_table.py
+"""
+Parser.parse_table 비교.
+
+- 기존: 행 x 열 cell_matrix + 셀마다 dict (이미지/링크 리스트 포함)
+- 현재: parse_table_columnar() → ColumnarTable (열 배열 + 공유 문자열 테이블, 병합은 열별 busy_until)
+
+큰 일정표/장학금 표 모양의 합성 표와 저장된 상세 페이지(<pages>/<SOURCE>/detail/*.html)의 모든 표로
+시간, 결과를 들고 있는 동안의 메모리(tracemalloc), 기존 JSON과의 일치 여부를 출력한다.
+rowspan/colspan이 뒤섞인 무작위 표로 일치 여부도 먼저 확인한다.
+
+사용:
+    python benchmarks/bench_table.py --pages ./output/saved_pages
+"""
+
+import os
+import sys
+import time
+import glob
+import random
+import argparse
+import logging
+import tracemalloc
+from urllib.parse import urljoin
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bs4 import BeautifulSoup
+
+from modules.parser import Parser
+
+
+def old_parse_table(parser, table_element, base_url):
+    """기존 구현 (비교용 사본)"""
+    cells_array = []
+    rows = table_element.select("tr")
+    max_col_count = 0
+    for row in rows:
+        col_count = 0
+        for col in row.find_all(['td', 'th'], recursive=False):
+            col_count += int(col.get('colspan', 1))
+        max_col_count = max(max_col_count, col_count)
+
+    cell_matrix = [[None for _ in range(max_col_count)] for _ in range(len(rows))]
+    current_row = 0
+    for row in rows:
+        cols = row.find_all(['td', 'th'], recursive=False)
+        current_col = 0
+        for col in cols:
+            while current_col < max_col_count and cell_matrix[current_row][current_col] is not None:
+                current_col += 1
+            if current_col >= max_col_count:
+                break
+            cell_object = {"text": parser.clean_text(col.get_text())}
+            colspan = int(col.get('colspan', 1))
+            rowspan = int(col.get('rowspan', 1))
+            if colspan > 1:
+                cell_object["colspan"] = colspan
+            if rowspan > 1:
+                cell_object["rowspan"] = rowspan
+            img_elements = col.select("img")
+            if img_elements:
+                cell_object["img_links"] = [urljoin(base_url, img.get('src')) for img in img_elements if img.get('src')]
+            link_elements = col.select("a")
+            if link_elements:
+                cell_object["links"] = [
+                    {"href": urljoin(base_url, link.get('href')), "text": parser.clean_text(link.get_text())}
+                    for link in link_elements if link.get('href')
+                ]
+            cell_object["row"] = current_row
+            cell_object["col"] = current_col
+            for i in range(rowspan):
+                for j in range(colspan):
+                    if current_row + i < len(rows) and current_col + j < max_col_count:
+                        cell_matrix[current_row + i][current_col + j] = cell_object
+            cells_array.append(cell_object)
+            current_col += colspan
+        current_row += 1
+    return {"table": cells_array}
+
+
+def random_table(rng, rows, cols):
+    """rowspan/colspan, 이미지, 링크가 섞인 무작위 표"""
+    out = []
+    for r in range(rows):
+        cells = []
+        for c in range(rng.randint(0, cols)):
+            attrs = ""
+            if rng.random() < 0.2:
+                attrs += f' rowspan="{rng.randint(0, 4)}"'
+            if rng.random() < 0.2:
+                attrs += f' colspan="{rng.randint(0, 3)}"'
+            body = f"{r}-{c}"
+            if rng.random() < 0.1:
+                body += f'<img src="/i/{r}.png"><img>'
+            if rng.random() < 0.1:
+                body += f'<a href="/f/{c}.hwp">첨부</a><a>없음</a>'
+            cells.append(f"<td{attrs}>{body}</td>")
+        out.append(f"<tr>{''.join(cells)}</tr>")
+    return f"<table>{''.join(out)}</table>"
+
+
+def schedule_table(rows, cols=8):
+    """학사 일정 / 장학금 표 모양: 월 단위 rowspan, 반복되는 값이 많음"""
+    out = ["<tr>" + "".join(f"<th>항목{c}</th>" for c in range(cols)) + "</tr>"]
+    for r in range(rows):
+        first = f'<td rowspan="4">{r // 4 + 1}월</td>' if r % 4 == 0 else ""
+        cells = "".join(
+            f'<td>{"신청" if c % 2 else "마감"} <a href="/scholarship/{r}">{r}번</a></td>' if c == 2 else f"<td>{(r * c) % 7}</td>"
+            for c in range(1, cols)
+        )
+        out.append(f"<tr>{first}{cells}</tr>")
+    return f"<table>{''.join(out)}</table>"
+
+
+def measure(func):
+    """(시간, 결과를 들고 있는 동안의 메모리)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, current, result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--pages", default="./output/saved_pages")
+    arg_parser.add_argument("--random", type=int, default=500, help="일치 확인용 무작위 표 개수")
+    args = arg_parser.parse_args()
+
+    parser = Parser("", logging.getLogger("bench"))
+    base_url = "https://www.yonsei.ac.kr/sc/"
+
+    rng = random.Random(0)
+    mismatches = 0
+    for _ in range(args.random):
+        table = BeautifulSoup(random_table(rng, rng.randint(1, 12), 6), "html.parser").table
+        if old_parse_table(parser, table, base_url) != parser.parse_table(table, base_url):
+            mismatches += 1
+    print(f"무작위 표 {args.random}개: 불일치 {mismatches}개")
+
+    samples = [(f"schedule rows={n}", BeautifulSoup(schedule_table(n), "html.parser")) for n in (100, 1000, 5000)]
+    for path in sorted(glob.glob(os.path.join(args.pages, "*", "detail", "*.html"))):
+        with open(path, "rb") as f:
+            samples.append((os.path.relpath(path, args.pages), BeautifulSoup(f.read(), "html.parser")))
+
+    print(f"{'page':40} {'cells':>7} {'old ms':>9} {'new ms':>9} {'old KB':>9} {'new KB':>9} same")
+    for name, soup in samples:
+        tables = soup.find_all("table")
+        if not tables:
+            continue
+        old_time, old_bytes, old_result = measure(lambda: [old_parse_table(parser, t, base_url) for t in tables])
+        new_time, new_bytes, new_result = measure(lambda: [parser.parse_table_columnar(t, base_url) for t in tables])
+        same = "=" if old_result == [t.to_json() for t in new_result] else "≠"
+        cells = sum(len(t) for t in new_result)
+        print(f"{name[:40]:40} {cells:>7} {old_time * 1000:>9.2f} {new_time * 1000:>9.2f} "
+              f"{old_bytes / 1024:>9.1f} {new_bytes / 1024:>9.1f} {same}")
+
+
+if __name__ == "__main__":
+    main()
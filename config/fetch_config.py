@@ -0,0 +1,142 @@
+# config/fetch_config.py
+
+# ------------------------------
+# 비동기 fetch 엔진 설정
+# ------------------------------
+
+# 엔진 전체에서 동시에 열 수 있는 최대 연결 수
+MAX_CONNECTIONS = 256
+
+# 호스트별 기본 동시 요청 수
+DEFAULT_HOST_CONCURRENCY = 4
+
+# 호스트별 동시 요청 수 (기본값을 덮어쓸 호스트만 기입)
+HOST_CONCURRENCY = {
+    "www.yonsei.ac.kr": 8,
+}
+
+# 유휴 keep-alive 연결을 유지하는 시간(초).
+# 평일 10분 주기 사이에도 연결이 살아 있도록 주기보다 길게 잡는다.
+KEEPALIVE_TIMEOUT = 900
+
+# DNS 조회 결과 캐시 시간(초)
+DNS_CACHE_TTL = 3600
+
+# 응답 본문을 읽는 청크 크기
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# 응답 본문 최대 크기 기본값 (넘으면 읽기 중단). 사이트별로는 SITES[source]["max_body_bytes"]로 덮어쓴다.
+DEFAULT_MAX_BODY_BYTES = 5 * 1024 * 1024
+
+# ------------------------------
+# 호스트별 요청 속도 제한 (토큰 버킷)
+# ------------------------------
+
+# 호스트별 기본 속도: 초당 요청 수, 버스트 크기
+DEFAULT_HOST_RATE = 2.0
+DEFAULT_HOST_BURST = 2
+
+# 호스트별 속도 (기본값을 덮어쓸 호스트만 기입) - host: (초당 요청 수, 버스트)
+HOST_RATES = {
+    "www.yonsei.ac.kr": (4.0, 4),
+}
+
+# 호스트 그룹별 속도 - 그룹에 속한 모든 하위 도메인 요청의 합계를 제한
+# (학과 사이트 대부분이 같은 *.yonsei.ac.kr 서버군을 공유)
+HOST_GROUP_RATES = {
+    "yonsei.ac.kr": (10.0, 10),
+}
+
+# ------------------------------
+# 호스트별 적응형 타임아웃 (지연 히스토그램)
+# ------------------------------
+
+# 히스토그램 버킷 상한(초)
+LATENCY_BUCKETS = [0.025, 0.05, 0.1, 0.2, 0.4, 0.8, 1.6, 3.2, 6.4, 12.8, 25.6]
+
+# 호스트/종류별 표본이 이 수를 넘으면 전체를 절반으로 줄여 최근 값 위주로 유지
+LATENCY_WINDOW = 500
+
+# 이보다 표본이 적으면 타임아웃은 상한값 사용
+LATENCY_MIN_SAMPLES = 20
+
+# 타임아웃 = 이 백분위 지연 x 배수 (아래 범위로 제한)
+LATENCY_PERCENTILE = 0.99
+LATENCY_TIMEOUT_MULTIPLIER = 3
+
+# (하한, 상한) 초
+CONNECT_TIMEOUT_BOUNDS = (2, 10)
+READ_TIMEOUT_BOUNDS = (5, 30)
+
+# 상세 페이지가 재시도 큐로 넘어가면 그 자리에서 결과를 기다리는 최대 시간(초).
+# 넘으면 그 글부터는 이번 실행에서 저장하지 않고(상태도 넘기지 않음) 다음 실행에서 다시 처리한다.
+RETRY_WAIT_TIMEOUT = 30
+
+# ------------------------------
+# 호스트별 서킷 브레이커
+# ------------------------------
+
+# 연속 실패(5xx / 타임아웃 / 연결 오류)가 이 횟수에 도달하면 해당 호스트를 이번 사이클 동안 차단
+BREAKER_FAILURE_THRESHOLD = 5
+
+# ------------------------------
+# 호스트별 문자 인코딩
+# ------------------------------
+
+# <meta charset> 선언을 찾을 본문 앞부분 크기
+CHARSET_META_SCAN_BYTES = 4096
+
+# 선언이 없는 호스트에서 인코딩을 감지할 때 쓰는 본문 앞부분 크기 (호스트당 한 번)
+CHARSET_DETECT_BYTES = 64 * 1024
+
+# ------------------------------
+# 디스크 응답 캐시 (상세 페이지)
+# ------------------------------
+
+# 캐시 전체 최대 크기 (초과 시 LRU로 삭제)
+RESPONSE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# 캐시 유효 기간(초) 기본값. 사이트별로는 SITES[source]["cache_ttl"]로 덮어쓴다.
+DEFAULT_CACHE_TTL = 30 * 24 * 3600
+
+# ------------------------------
+# 원격 적재(ISSAC) 단계
+# ------------------------------
+
+# 전송 스레드 수 (한 사이트의 문서는 한 번에 한 스레드만 보내 순서 유지)
+INDEX_SINK_WORKERS = 32
+
+# 원격 적재(ISSAC / OpenSearch) 세션의 호스트별 커넥션 풀 크기.
+# POST는 sink 전송 스레드만 보내므로 그 수와 맞춘다 (더 크면 쓰이지 않는 연결)
+SINK_POOL_MAXSIZE = INDEX_SINK_WORKERS
+
+# 전송 대기 문서 최대 개수 (가득 차면 저장하는 크롤러 스레드가 기다림)
+INDEX_SINK_QUEUE_SIZE = 512
+
+# main.py 크롤러 스레드 수
+# (스레드는 대부분 엔진의 응답을 기다리기만 하므로 사이트 수만큼 두어도 부담이 적다)
+CRAWLER_WORKERS = 80
+
+# 사이트 실행 시간 지수 이동 평균의 최근 값 가중치 (같은 시각 due인 사이트는 오래 걸리는 것부터 시작)
+DURATION_EWMA_ALPHA = 0.3
+
+# ------------------------------
+# 사이트별 폴링 간격 (게시 이력 학습)
+# ------------------------------
+
+# 게시 이력으로 쓰는 기간(일)과 사이트당 최대 보관 개수
+POLL_HISTORY_DAYS = 56
+POLL_HISTORY_MAX = 2000
+
+# 이력이 이 기간(일)보다 짧으면 기존 시간표(get_next_run_time)를 그대로 쓴다
+POLL_MIN_OBSERVED_DAYS = 7
+
+# 다음 확인까지 예상 새 글 수가 이 값이 되도록 간격을 잡는다 (작을수록 자주 확인)
+POLL_TARGET_POSTS = 0.15
+
+# 요일-시간 칸별 비율을 사이트 평균 쪽으로 당기는 정도 (주 단위 가중치)
+POLL_PRIOR_WEEKS = 1.0
+
+# 확인 간격 범위(초)
+POLL_MIN_INTERVAL = 5 * 60
+POLL_MAX_INTERVAL = 4 * 3600
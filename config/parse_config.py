@@ -0,0 +1,29 @@
+# config/parse_config.py
+
+# ------------------------------
+# HTML 파서 백엔드
+# ------------------------------
+# 사용 가능한 값: "html.parser"(순수 파이썬), "lxml", "html5lib", "selectolax"(목록 페이지 전용, 설치 시)
+# 사이트별로는 SITES[source]["list_parser"] / SITES[source]["detail_parser"]로 덮어쓴다.
+# 바꾸기 전에 benchmarks/bench_parse_backends.py로 해당 사이트 페이지의 결과가 같은지 확인할 것.
+
+# 목록 페이지 (글 링크 / 다음 글 링크 추출): 기본은 기존 파서.
+# lxml은 깨진 표/<tr>를 html.parser와 다르게 고치므로 _parse_list_page_* 결과가 바뀔 수 있다.
+# 빠른 백엔드는 벤치마크로 결과가 같다고 확인한 사이트만 SITES[source]["list_parser"]로 켠다.
+DEFAULT_LIST_PARSER = "html.parser"
+
+# 상세 페이지 (본문 / 표 / 첨부파일 추출): 트리 모양이 결과에 영향을 주므로 기존 파서 유지
+DEFAULT_DETAIL_PARSER = "html.parser"
+
+# ------------------------------
+# 상세 페이지 파싱 프로세스 풀
+# ------------------------------
+# True면 상세 페이지 파싱(parse_notice)을 별도 프로세스에서 실행해 크롤러 스레드는 요청/상태 관리만 한다.
+# (PSYCHOLOGY는 목록 페이지에서 바로 파싱하므로 제외)
+PARSE_POOL_ENABLED = True
+
+# 워커 프로세스 수 (None이면 CPU 코어 수)
+PARSE_POOL_WORKERS = None
+
+# 워커당 최대 대기 작업 수. 넘으면 submit()이 자리가 날 때까지 기다린다 (앞 단계 backpressure)
+PARSE_POOL_PENDING_PER_WORKER = 4
@@ -33,6 +33,7 @@ SITES = {
         "sub_category_selector": "null",
         "content_selector": "#body > div.dcore.dcore-view.dcore-notice > div.wrap-with-aside > div:nth-child(1) > div.post-body",
         "next_page_selector": "null",
+        "list_region": {"name": "table", "class": "board-list"},
     },
     "MATERIALS_SCIENCE_ENGINEERING" : {
         "base_url": "https://mse.yonsei.ac.kr/",
@@ -44,6 +45,7 @@ SITES = {
         "sub_category_selector": "null",
         "content_selector": "#main > div.section.section1 > div > div.con",
         "next_page_selector": "null",
+        "list_region": {"id": "main"},
     },
     "SONGDO_DORM" : {
         "base_url": "https://yicdorm.yonsei.ac.kr/yicdorm/regulations/dormNotice.do",
@@ -88,6 +90,7 @@ SITES = {
         "sub_category_selector": "#mqSub-Data > div > div.board-view > span",
         "content_selector": "#mqSub-Data > div > div.board-view > div.board-view-data",
         "next_page_selector": "null",
+        "list_region": {"name": "table", "class": "table-board"},
     },
     "INTERNATIONAL_OFFICE" : {
         "base_url": "https://oia.yonsei.ac.kr",
@@ -110,6 +113,7 @@ SITES = {
             "sub_category_selector": "null",
             "content_selector": "#BoardContent",
             "next_page_selector": "null",
+            "list_region": {"id": "Board"},
         },
     "INTERNATIONAL_COLLEGE_STUDENT_SERVICES" : {
         "base_url": "https://uic.yonsei.ac.kr",
@@ -121,6 +125,7 @@ SITES = {
         "sub_category_selector": "null",
         "content_selector": "#BoardContent",
         "next_page_selector": "null",
+        "list_region": {"name": "table", "id": "Board"},
     },
     "INTERNATIONAL_COLLEGE_ACADEMIC_AFFAIRS" : {
         "base_url": "https://uic.yonsei.ac.kr",
@@ -132,6 +137,7 @@ SITES = {
         "sub_category_selector": "null",
         "content_selector": "#BoardContent",
         "next_page_selector": "null",
+        "list_region": {"name": "table", "id": "Board"},
     },
     "ATMOSPHERIC_SCIENCE" : {
         "base_url": "https://atmos.yonsei.ac.kr",
@@ -143,6 +149,7 @@ SITES = {
         "sub_category_selector": "null",
         "content_selector": "#post-content",
         "next_page_selector": "null",
+        "list_region": {"name": "div", "id": "blog-listing-medium"},
     },
     "SOCIOLOGY": {
             "base_url": "https://sociology.yonsei.ac.kr",
@@ -847,6 +854,7 @@ SITES = {
         "sub_category_selector": "null",
         "content_selector": "#board-view-default > div.bw_contents.editor_contents",
         "next_page_selector": "null",
+        "list_region": {"name": "table", "class": "bl_list"},
     },
     "POLITICAL_SCIENCE": {
         "base_url": "http://politics.yonsei.ac.kr/",
@@ -857,7 +865,8 @@ SITES = {
         "author_selector": "table.table_com01.board_table_basic > tr:nth-child(1) > td.board_readTitle_td:nth-child(2) > font",
         "sub_category_selector": "null",
         "content_selector": "table > tr > td > div > font.textplain",
-        "next_page_selector": "null"
+        "next_page_selector": "null",
+        "list_region": {"name": "table", "class": "table_com01"},
     },
     "PSYCHOLOGY": {
         "base_url": "https://psychsci.yonsei.ac.kr/",
@@ -868,6 +877,8 @@ SITES = {
         "author_selector": "",
         "sub_category_selector": "null",
         "content_selector": "oKdM2c ZZyype",
-        "next_page_selector": "null"
+        "next_page_selector": "null",
+        # 목록 페이지 soup을 그대로 상세 파싱(parse_psychology_notice)에 쓰므로 상세용 파서와 맞춤
+        "list_parser": "html.parser",
     }
 }
@@ -3,21 +3,36 @@
 
 import logging
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from pytz import timezone 
 from config.site_config import SITES    
+from config.fetch_config import CRAWLER_WORKERS
 from modules.announcement_crawler import AnnouncementCrawler
 from modules.announcement_crawler_for_notice_list import ListAnnouncementCrawler
 from modules.announcement_crawler_for_ARCHITECTURE_ENGINEERING import ARCHITECTURE_ENGINEERING_AnnouncementCrawler
 import os
 from modules.mongo_saver import save_crawler_states_to_mongo, save_psychology_article_ids, save_architecture_engineering_state
 from modules.mongo_loader import save_crawler_states_to_files
+from modules.metrics import METRICS
+from modules.validator_cache import get_validator_cache
+from modules.response_cache import get_response_cache
+from modules.charset_cache import get_charset_cache
+from modules.session_pool import get_session_registry
+from modules.async_fetcher import get_engine
+from modules.site_plan import build_site_plans
+from modules.scheduler import SiteScheduler, PRIORITY_HOUSEKEEPING
+from modules.poll_planner import get_poll_planner
+from modules.duration_history import get_duration_history
+from modules.pipeline import stage_meter
 
 import time  # time 모듈
 from datetime import time as dt_time  # datetime.time을 다른 이름으로 불러오기
 
 KST = timezone('Asia/Seoul')  
 
+# 요약 로그에 찍을 파이프라인 단계 (순서대로)
+PIPELINE_STAGES = ("fetch", "parse", "sink")
+
 def setup_logger():
     logger = logging.getLogger("AnnouncementCrawler")
     logger.setLevel(logging.INFO)
@@ -30,7 +45,7 @@ def setup_logger():
 
 def process_site(source, crawler):
     """
-    스레드 풀에서 실행할 함수.
+    스케줄러 워커 스레드에서 실행할 함수.
     공지사항 목록 페이지와 일반 공지사항 페이지를 구분하여 크롤링을 진행한다.
     """
     try:
@@ -47,9 +62,9 @@ def process_site(source, crawler):
     except Exception as e:
         crawler.logger.error(f"[{source}] Error in process_site: {e}")
 
-def get_next_run_time():
+def get_next_run_time(now=None):
     """다음 실행 시간을 정확히 계산하는 함수"""
-    now = datetime.now(KST)
+    now = now or datetime.now(KST)
     current_weekday = now.weekday()  # 0: 월요일 ~ 6: 일요일
 
     if current_weekday in [5, 6]:  # 주말 (토, 일)
@@ -83,11 +98,135 @@ def get_next_run_time():
     return None  # 혹시 예외가 발생하면 None 반환
 
 
+def next_due_timestamp():
+    """스케줄러용 다음 실행 시각 (epoch 초, 계산 실패 시 None)"""
+    next_run = get_next_run_time()
+    return next_run.timestamp() if next_run else None
+
+
+def notices_file(source, crawler):
+    return os.path.join(crawler.notices_dir, f"notices_{source}.jsonl")
+
+
+def run_site(logger, source, crawler):
+    """
+    사이트 하나 확인 + 걸린 시간 기록 (사이트별 감지 지연 = due 이후 시작 지연 + 이 시간).
+    이번에 저장된 새 공지는 폴링 계획의 게시 이력으로 들어간다.
+    """
+    started = time.time()
+    process_site(source, crawler)
+    elapsed = time.time() - started
+    METRICS.incr("scheduler.site_runs")
+    METRICS.incr("scheduler.site_seconds", elapsed)
+    new_posts = get_poll_planner().observe(source, notices_file(source, crawler))
+    logger.info(f"[{source}] 확인 완료 ({elapsed:.1f}초, 새 공지 {new_posts}건)")
+
+
+def run_housekeeping(logger, crawlers, scheduler):
+    """
+    기존 사이클 끝/시작에 하던 일: 통계 요약, 캐시/상태 저장, 서킷 브레이커 HALF_OPEN 전환.
+    다른 사이트가 크롤링 중일 수 있으므로 커밋 안 된 검증자는 버리지 않는다.
+    """
+    # 스케줄러: 사이트 실행 횟수, due 이후 시작까지 평균 지연, 평균 실행 시간
+    scheduler_stats = METRICS.snapshot(prefix="scheduler.", reset=True)
+    runs = scheduler_stats.get("scheduler.runs", 0)
+    site_runs = scheduler_stats.get("scheduler.site_runs", 0)
+    logger.info(f"=== 스케줄러: 사이트 확인 {site_runs}건, "
+          f"평균 시작 지연 {scheduler_stats.get('scheduler.start_lag', 0) / max(runs, 1):.1f}초, "
+          f"평균 확인 시간 {scheduler_stats.get('scheduler.site_seconds', 0) / max(site_runs, 1):.1f}초 ===")
+
+    # 폴링 계획: 게시 이력으로 정한 확인 간격 (시간표 대비 비율이 작을수록 요청이 줄어든 것)
+    poll_stats = METRICS.snapshot(prefix="poll.", reset=True)
+    planned = poll_stats.get("poll.planned", 0)
+    if planned:
+        logger.info(f"=== 폴링 계획: 학습 간격 {planned}회 (평균 {poll_stats.get('poll.planned_seconds', 0) / planned / 60:.1f}분, "
+              f"같은 시점 시간표 간격의 {poll_stats.get('poll.planned_seconds', 0) / max(poll_stats.get('poll.timetable_seconds', 0), 1):.1f}배), "
+              f"시간표 사용 {poll_stats.get('poll.fallback', 0)}회, 새 공지 {poll_stats.get('poll.arrivals', 0)}건 ===")
+    get_poll_planner().save()
+    get_duration_history().save()
+
+    # 단계별(fetch → parse → sink) 처리량과 대기: 대기 중 작업이 계속 쌓이고 자리 대기가 긴 단계가 병목
+    # (fetch: 속도 제한/호스트 동시성 슬롯, parse: 풀 대기 한도, sink: 전송 큐)
+    for stage in PIPELINE_STAGES:
+        stats = stage_meter(stage).snapshot(reset=True)
+        done = stats["done"]
+        logger.info(f"=== 단계 [{stage}] 처리 {done}건 ({done / max(stats['interval'], 1):.2f}건/초, "
+              f"평균 {stats['busy_seconds'] / max(done, 1):.2f}초), 대기 중 {stats['depth']}건 (최대 {stats['max_depth']}), "
+              f"자리 대기 {stats['blocked_seconds']:.1f}초 ===")
+
+    # 조건부 GET(304) 절약 요약
+    conditional_stats = METRICS.snapshot(prefix="conditional.", reset=True)
+    logger.info(f"=== 조건부 GET: 304 응답 {conditional_stats.get('conditional.not_modified', 0)}건, "
+          f"절약 {conditional_stats.get('conditional.bytes_saved', 0)}바이트, "
+          f"생략된 파싱 {conditional_stats.get('conditional.parse_saved', 0)}회 ===")
+    get_validator_cache().save(discard_pending=False)
+
+    cache_stats = METRICS.snapshot(prefix="cache.", reset=True)
+    logger.info(f"=== 응답 캐시: hit {cache_stats.get('cache.hit', 0)}건, miss {cache_stats.get('cache.miss', 0)}건 ===")
+    get_response_cache().save_index()
+
+    # 인코딩 판별: 선언(헤더/meta) 사용 / 호스트 기억값 사용 / 감지 (감지는 호스트당 처음 한 번이 정상)
+    charset_stats = METRICS.snapshot(prefix="charset.", reset=True)
+    logger.info(f"=== 인코딩: 선언 {charset_stats.get('charset.declared', 0)}건, "
+          f"호스트 기억 {charset_stats.get('charset.cached', 0)}건, "
+          f"감지 {charset_stats.get('charset.detected', 0)}건, "
+          f"불일치 {charset_stats.get('charset.mismatch', 0)}건 ===")
+    get_charset_cache().save()
+
+    # 연결 재사용 통계 (크롤링: 엔진 커넥션 풀 / 원격 적재: 호스트별 세션)
+    pool_stats = METRICS.snapshot(prefix="pool.engine.", reset=True)
+    logger.info(f"=== 엔진 연결: 신규 {pool_stats.get('pool.engine.new_connections', 0)}건, "
+          f"재사용 {pool_stats.get('pool.engine.reused', 0)}건 ===")
+    for host, stats in get_session_registry().stats().items():
+        logger.info(f"=== 세션 [{host}] 요청 {stats['requests']}건, 신규 연결 {stats['new_connections']}건, "
+              f"재사용 {stats['reused']}건 (누적) ===")
+
+    # 스트리밍으로 받지 않고 넘긴 응답
+    stream_stats = METRICS.snapshot(prefix="stream.", reset=True)
+    logger.info(f"=== 응답 스트리밍: 비HTML 스킵 {stream_stats.get('stream.rejected_content_type', 0)}건, "
+          f"크기 초과 중단 {stream_stats.get('stream.aborted_oversize', 0)}건, "
+          f"받지 않은 본문 {stream_stats.get('stream.bytes_skipped', 0)}바이트 ===")
+
+    # 목록 영역(list_region)을 찾지 못해 전체 페이지를 다시 파싱한 횟수 (0이 아니면 사이트 개편 의심)
+    parse_stats = METRICS.snapshot(prefix="parse.", reset=True)
+    if parse_stats.get("parse.region_miss"):
+        logger.warning(f"=== 목록 영역 미발견 {parse_stats['parse.region_miss']}건: list_region 설정 확인 필요 ===")
+
+    # 서킷 브레이커 상태
+    breaker_stats = METRICS.snapshot(prefix="breaker.", reset=True)
+    logger.info(f"=== 서킷 브레이커: 차단 {breaker_stats.get('breaker.tripped', 0)}건, "
+          f"생략된 요청 {breaker_stats.get('breaker.short_circuited', 0)}건, "
+          f"복구 {breaker_stats.get('breaker.recovered', 0)}건 ===")
+    for host, state in get_engine().breakers.snapshot().items():
+        logger.info(f"=== 브레이커 [{host}] {state['state']} (연속 실패 {state['failures']}회, 누적 차단 {state['trips']}회) ===")
+
+    # 호스트별 지연 히스토그램 저장 (재시작 후에도 타임아웃 조정 유지)
+    get_engine().latency.save()
+
+    save_crawler_states_to_mongo(crawlers)
+    save_psychology_article_ids()
+    save_architecture_engineering_state()
+
+    # 차단된 호스트는 이후 요청 하나로 복구 여부 확인
+    half_open_hosts = get_engine().breakers.start_cycle()
+    if half_open_hosts:
+        logger.info(f"=== 서킷 브레이커 HALF_OPEN: {', '.join(half_open_hosts)} ===")
+
+    pending = scheduler.pending()
+    if pending:
+        next_due, next_name = pending[0]
+        logger.info(f"=== 다음 due: [{next_name}] {datetime.fromtimestamp(next_due, KST).strftime('%Y-%m-%d %H:%M:%S')}, "
+              f"대기 중 {len(pending)}개 ===")
+
+
 def main():
     logger = setup_logger()
 
     save_crawler_states_to_files()
 
+    # 사이트별 선택자 컴파일 + 핸들러 연결 (선택자 오류는 여기서 바로 실패)
+    build_site_plans()
+
     # 1) 사이트별 Crawler 인스턴스 생성
     crawlers = {}
 
@@ -140,41 +279,24 @@ def main():
         
         crawlers[source] = crawler
 
-    # 2) 무한 반복(각 사이트 최대 2번 검사 → 병렬 2개까지)
-    while True:
-        logger.info("=== Start checking all sites ===")
-        
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            futures = []
-            
-            for source, crawler in crawlers.items():
-                # 스레드 풀에 작업 제출
-                future = executor.submit(process_site, source, crawler)
-                futures.append((source, future))
-            
-            # 모든 작업 완료 대기
-            for source, future in futures:
-                try:
-                    future.result()
-                except Exception as e:
-                    logger.error(f"[{source}] Future Error: {e}")
-        
-        next_run = get_next_run_time()
-        if not next_run:
-            logger.error("다음 실행 시간을 계산할 수 없습니다.")
-            break
-        
-        sleep_time = (next_run - datetime.now(KST)).total_seconds()
-        sleep_hours = int(sleep_time // 3600)  
-        sleep_minutes = int((sleep_time % 3600) // 60)  
+    # 2) 연속 스케줄링: 사이트마다 자기 다음 실행 시각을 갖고, 워커는 due가 된 사이트부터 꺼내 실행한다
+    #    (느린 사이트가 다른 사이트의 다음 확인을 막지 않음)
+    #    다음 실행 시각은 사이트별 게시 이력으로 정하고, 이력이 부족한 사이트는 기존 시간표를 쓴다
+    #    같은 시각에 due인 사이트(시작 직후, 시간표 칸)는 지난 실행 시간이 긴 것부터 시작한다 (LPT)
+    planner = get_poll_planner()
+    scheduler = SiteScheduler(workers=CRAWLER_WORKERS, logger=logger, durations=get_duration_history())
+    first_due = time.time()
+    for source, crawler in crawlers.items():
+        planner.observe(source, notices_file(source, crawler))
+        scheduler.add(source, partial(run_site, logger, source, crawler), partial(planner.next_due, source, next_due_timestamp),
+                      first_due=first_due)
 
-        save_crawler_states_to_mongo(crawlers)
-        save_psychology_article_ids()
-        save_architecture_engineering_state()
-        logger.info(f"=== Finished checking all sites. Next run at {next_run.strftime('%Y-%m-%d %H:%M:%S')} "
-              f"({sleep_hours}시간 {sleep_minutes}분 후) ===")
-        time.sleep(sleep_time)
+    # 사이클마다 하던 요약/저장/브레이커 복구 확인은 정리 작업으로 같은 시간표에 맞춰 실행
+    scheduler.add("housekeeping", partial(run_housekeeping, logger, crawlers, scheduler), next_due_timestamp,
+                  first_due=next_due_timestamp(), priority=PRIORITY_HOUSEKEEPING)
 
+    logger.info(f"=== 연속 스케줄러 시작: 사이트 {len(crawlers)}개, 워커 {CRAWLER_WORKERS}개 ===")
+    scheduler.run_forever()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
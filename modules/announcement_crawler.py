@@ -3,12 +3,15 @@ import sys
 import os
 import json
 import time
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
 from .json_manager import JsonManager
 from .announcement_parser import AnnouncementParser
-from .fetcher import Fetcher
-import requests
+from .fetcher import Fetcher, NOT_MODIFIED
+from .html_backend import make_soup, parser_for, list_region_for
+from .site_plan import get_site_plan
+from .parse_pool import get_parse_pool, find_next_notice_url
+from .pipeline import get_index_sink
+from .metrics import METRICS
+from .session_pool import get_session
 import os
 from .saver import Saver
 from urllib.parse import parse_qs, urlparse
@@ -63,6 +66,17 @@ class AnnouncementCrawler:
         # Parser, Fetcher, Saver 초기화
         self.parser = AnnouncementParser(self.base_url, self.logger)
         self.fetcher = Fetcher(user_agents=None, logger=self.logger)
+        # 사이트별 HTML 파서 백엔드 (목록 / 상세)
+        self.list_parser = parser_for(self.source, "list")
+        self.detail_parser = parser_for(self.source, "detail")
+        # 목록 페이지에서 트리로 만들 영역 (없으면 전체)
+        self.list_region = list_region_for(self.source)
+        # 미리 컴파일된 선택자 + 사이트별 핸들러 참조
+        self.plan = get_site_plan(self.source)
+        # 상세 페이지 파싱(CPU)은 프로세스 풀에서
+        self.parse_pool = get_parse_pool()
+        # 원격 적재(ISSAC POST)는 sink 단계 스레드에서 (크롤러 스레드는 응답을 기다리지 않음)
+        self.index_sink = get_index_sink()
 
         # Saver를 이용한 로그(또는 배치처리) 저장 경로
         # original_file: 실제로 적재될 파일 이름
@@ -114,8 +128,6 @@ class AnnouncementCrawler:
         신규 공지가 있는지 최대 max_checks번까지 확인하고,
         발견되는 즉시 크롤링 진행.
         """
-        session = requests.Session()
-
         is_first_check = None
 
         # 현재 페이지 URL(초기에는 state 없으면 start_url에서 시작)
@@ -133,32 +145,45 @@ class AnnouncementCrawler:
             new_notice_found = False
 
             # 1) 현재 URL 내용 파싱
-            content = self.fetcher.fetch_page_content(session, current_url, source=self.source)
+            # (state가 있으면 조건부 GET: 지난번과 같은 페이지면 '다음 공지' 링크도 그대로이므로 파싱 생략)
+            content = self.fetcher.fetch_page_content(current_url, source=self.source, conditional=not is_first_check)
+            if content is NOT_MODIFIED:
+                self.logger.info(f"[{self.source}] Not modified since last check: {current_url}")
+                METRICS.incr("conditional.parse_saved")
+                checks_done += 1
+                continue
             if not content:
                 self.logger.warning(f"[{self.source}] Failed to fetch content: {current_url}")
                 break
 
-            soup = BeautifulSoup(content, "html.parser")
-
+            # 새 공지를 찾았는데 저장하지 못하면 False
+            saved = True
             if is_first_check and self.is_new_post(current_url):
                 self.logger.info(f"[{self.source}] New notice found: {current_url}")
-                self.crawl_notices(current_url, session)
+                saved = self.crawl_notices(current_url)
                 new_notice_found = True
             else:
                 self.logger.info(f"[{self.source}] Not first check")
-                next_notice_url = self.get_next_notice_url(soup)
+                # 상세 페이지이므로 crawl_notices(파싱 워커)와 같은 상세용 파서로 '다음 공지' 링크를 찾는다
+                next_notice_url = self.get_next_notice_url(make_soup(content, self.detail_parser))
                 if next_notice_url:
                     # 새 공지인지 확인
                     if self.is_new_post(next_notice_url):
                         self.logger.info(f"[{self.source}] New notice found: {next_notice_url}")
-                        self.crawl_notices(next_notice_url, session)
+                        saved = self.crawl_notices(next_notice_url)
                         new_notice_found = True
                     else:
                         self.logger.info(f"[{self.source}] Next notice is not new.")
                         # 다음 공지가 이미 본 공지라면 => 더 이상 새 공지 없음
                 else:
                     self.logger.info(f"[{self.source}] No next notice link found.")
-            
+
+            if saved:
+                # 페이지 처리를 끝냈으므로 다음 체크부터 조건부 GET 사용
+                self.fetcher.validators.commit(current_url)
+            else:
+                # 새 공지를 저장하지 못함: 다음 체크에서 304로 건너뛰지 않도록 검증자를 버린다
+                self.fetcher.validators.discard(current_url)
             checks_done += 1
 
             # 새 공지를 찾지 못했다면 반복 진행
@@ -173,82 +198,53 @@ class AnnouncementCrawler:
                 # (새 공지가 여러 개 연속으로 있을 수 있으므로)
                 pass
 
-        session.close()
-
 
-    def crawl_notices(self, notice_url, session=None):
+    def crawl_notices(self, notice_url):
         """
         notice_url부터 시작해서 '다음 공지'가 없거나
         새 글이 아닐 때까지 연쇄적으로 크롤링.
+        첫 글(notice_url)을 저장했으면 True.
         """
-        if session is None:
-            session = requests.Session()
-
+        saved_first = False
         url = notice_url
         while True:
             # self.logger.info(f"[{self.source}] Crawling notice: {url}")
-            content = self.fetcher.fetch_page_content(session, url, source=self.source)
+            content = self.fetcher.fetch_page_content(url, source=self.source)
             if not content:
                 self.logger.warning(f"[{self.source}] Failed to fetch content: {url}")
                 break
 
-            soup = BeautifulSoup(content, "html.parser")
-            base_domain = self.parser.extract_domain(url)
-            
-            # (1) HTML -> JSON 변환
-            json_data = self.parser.parse_notice(
-                soup,
-                base_domain,
-                url,
-                self.source,
-                self.title_selector,
-                self.date_selector,
-                self.author_selector,
-                self.content_selector,
-                self.sub_category_selector,
+            # (1) HTML -> JSON 변환 (파싱 풀) - 다음 공지 링크도 워커가 같은 soup에서 찾아 돌려준다
+            json_data, next_notice_url = self.parse_pool.parse(
+                self.parser, content, self.detail_parser, url, self.source, self.plan, next_url_base=self.base_url,
             )
 
             # (2) 로컬 jsonl 저장
             file_path = os.path.join(self.notices_dir, f"notices_{self.source}.jsonl")
             JsonManager.save_to_jsonl(json_data, file_path)
 
-            # (3) 원격 Insert (Opensearch 혹은 ISSAC API)
-            self.index_to_issac(json_data)
+            # (3) 원격 Insert (Opensearch 혹은 ISSAC API) - sink 단계로 넘김
+            self.index_sink.put(self.source, (self, json_data))
 
             # self.index_to_opensearch(json_data)
 
             # (4) state 업데이트
             article_no = self.get_article_no_from_url(url)
             self.save_last_state(url, article_no)
+            saved_first = True
 
             # 다음 공지 확인
-            next_notice_url = self.get_next_notice_url(soup)
             if not next_notice_url or not self.is_new_post(next_notice_url):
                 # 더 이상 새 글이 아니면 stop
                 break
             url = next_notice_url
+        return saved_first
 
     def get_next_notice_url(self, soup):
         """
         다음 페이지/공지 링크를 selector로 찾고, javascript:...이 아닌 실제 URL이면 반환.
         """
-        link = soup.select_one(self.next_page_selector)
-        if not link:
-            return None
-        
-        text = link.get_text(strip=True)
-        # "등록된 글이 없습니다" 같은 문구 필터
-        if "등록된 글이 없습니다" in text or "다음글이 없습니다." in text:
-            return None
-        href = link.get("href")
-        if not href or "javascript" in href.lower():
-            return None
-        
-        if self.source == "RC_EDUCATION":
-            base_url = self.base_url + "/main/"
-            return urljoin(base_url, href)
-
-        return urljoin(self.base_url, href)
+        return find_next_notice_url(soup, self.plan, self.source, self.base_url)
 
 
     def get_article_no_from_url(self, url):
@@ -288,7 +284,8 @@ class AnnouncementCrawler:
         }
         
         try:
-            response = requests.post(
+            # 공유 세션으로 ISSAC 연결을 재사용
+            response = get_session(ISSAC_ENDPOINT).post(
                 ISSAC_ENDPOINT,
                 auth=(ISSAC_USER, ISSAC_PASSWORD),
                 headers=headers,
@@ -325,7 +322,7 @@ class AnnouncementCrawler:
         }
         
         try:
-            response = requests.post(
+            response = get_session(api_url).post(
                 api_url, 
                 auth=(OPENSEARCH_USER, OPENSEARCH_PASSWORD),
                 headers=headers,
@@ -1,6 +1,4 @@
 # /home/ubuntu/multiturn_ver1/new crawler/modules/announcement_crawler_for_ARCHITECTURE_ENGINEERING.py
-import requests
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 import logging
 import os
@@ -15,8 +13,14 @@ from .announcement_parser import AnnouncementParser
 from .announcement_crawler import AnnouncementCrawler
 
 
-from .fetcher import Fetcher
+from .fetcher import Fetcher, FetchSpec, NOT_MODIFIED, RETRY_PENDING
+from .html_backend import make_soup, parser_for, list_region_for
+from .site_plan import get_site_plan
+from .parse_pool import get_parse_pool
+from .pipeline import get_index_sink
+from .metrics import METRICS
 from .json_manager import JsonManager
+from config.fetch_config import RETRY_WAIT_TIMEOUT
 
 
 class ARCHITECTURE_ENGINEERING_AnnouncementCrawler:
@@ -67,6 +71,8 @@ class ARCHITECTURE_ENGINEERING_AnnouncementCrawler:
         # 과거 상태 (중복 체크, last_date_id 등)
         self.last_date_id = 0
         self.seen_title_hashes = set()
+        # 새 글 확인 중 저장하지 못한 글이 있는지 (check_for_new_notices마다 초기화)
+        self._save_gap = False
 
         # 현재 페이지 (for sticky 처리용)
         self.current_page = 0
@@ -94,6 +100,17 @@ class ARCHITECTURE_ENGINEERING_AnnouncementCrawler:
         # 파서, 페처 초기화
         self.parser = AnnouncementParser(self.base_url, self.logger)
         self.fetcher = Fetcher(user_agents=None, logger=self.logger)
+        # 사이트별 HTML 파서 백엔드 (목록 / 상세)
+        self.list_parser = parser_for(self.source, "list")
+        self.detail_parser = parser_for(self.source, "detail")
+        # 목록 페이지에서 트리로 만들 영역 (없으면 전체)
+        self.list_region = list_region_for(self.source)
+        # 미리 컴파일된 선택자 + 사이트별 핸들러 참조
+        self.plan = get_site_plan(self.source)
+        # 상세 페이지 파싱(CPU)은 프로세스 풀에서
+        self.parse_pool = get_parse_pool()
+        # 원격 적재(ISSAC POST)는 sink 단계 스레드에서 (크롤러 스레드는 응답을 기다리지 않음)
+        self.index_sink = get_index_sink()
 
     def load_state(self):
         """이전 상태 불러오기"""
@@ -125,10 +142,15 @@ class ARCHITECTURE_ENGINEERING_AnnouncementCrawler:
         )
 
     def check_for_new_notices(self):
-        session = requests.Session()
         temp_seen_hashes = set()  # 임시 해시 저장용
         
         try:
+            # 지난 실행에서 기다리다 놓친 재시도 결과 정리
+            self._process_retried_details()
+            # 이번 실행에서 새 글을 받지 못하면 True → 그 뒤 글은 저장하지 않음
+            self._save_gap = False
+
+
             if not self.is_first_crawl_done:
                 self.logger.info(f"[{self.source}] 최초 크롤링: {self.max_pages}페이지부터 1페이지까지")
                 
@@ -138,18 +160,20 @@ class ARCHITECTURE_ENGINEERING_AnnouncementCrawler:
                     list_url = self.build_list_url(page_num)
                     
                     try:
-                        html = self.fetcher.fetch_page_content(session, list_url, source=self.source)
+                        html = self.fetcher.fetch_page_content(list_url, source=self.source)
                         if not html:
                             continue
                             
-                        soup = BeautifulSoup(html, "html.parser")
+                        soup = make_soup(html, self.list_parser, region=self.list_region)
                         posts = self.parse_list_page(soup)
                         
+                        targets = []
                         for detail_url, date_id, title, sub_category in posts:
                             title_hash = hash(title)
                             if title_hash not in temp_seen_hashes:
-                                self.crawl_detail(session, detail_url, date_id, title, sub_category)
+                                targets.append((detail_url, date_id, title, sub_category))
                                 temp_seen_hashes.add(title_hash)
+                        self.crawl_details_many(targets, stop_at_gap=False)
                                 
                     except Exception as e:
                         self.logger.error(f"[{self.source}] Error on page {page_num}: {str(e)}")
@@ -159,16 +183,18 @@ class ARCHITECTURE_ENGINEERING_AnnouncementCrawler:
                 self.current_page = 1
                 list_url = self.build_list_url(1)
                 try:
-                    html = self.fetcher.fetch_page_content(session, list_url, source=self.source)
+                    html = self.fetcher.fetch_page_content(list_url, source=self.source)
                     if html:
-                        soup = BeautifulSoup(html, "html.parser")
+                        soup = make_soup(html, self.list_parser, region=self.list_region)
                         posts = self.parse_list_page(soup)
                         
+                        targets = []
                         for detail_url, date_id, title, sub_category in posts:
                             title_hash = hash(title)
                             if title_hash not in self.seen_title_hashes and title_hash not in temp_seen_hashes:
-                                self.crawl_detail(session, detail_url, date_id, title, sub_category)
+                                targets.append((detail_url, date_id, title, sub_category))
                                 self.seen_title_hashes.add(title_hash)  # 첫 페이지 해시만 영구 저장
+                        self.crawl_details_many(targets, stop_at_gap=False)
                 except Exception as e:
                     self.logger.error(f"[{self.source}] Error on page 1: {str(e)}")
                 
@@ -182,23 +208,34 @@ class ARCHITECTURE_ENGINEERING_AnnouncementCrawler:
                 list_url = self.build_list_url(1)
                 
                 try:
-                    html = self.fetcher.fetch_page_content(session, list_url, source=self.source)
-                    if html:
-                        soup = BeautifulSoup(html, "html.parser")
+                    # 조건부 GET: 1페이지가 그대로면 파싱 생략
+                    html = self.fetcher.fetch_page_content(list_url, source=self.source, conditional=True)
+                    if html is NOT_MODIFIED:
+                        self.logger.info(f"[{self.source}] 1페이지 변경 없음")
+                        METRICS.incr("conditional.parse_saved")
+                    elif html:
+                        soup = make_soup(html, self.list_parser, region=self.list_region)
                         posts = self.parse_list_page(soup)
                         
-                        for detail_url, date_id, title, sub_category in posts:
-                            title_hash = hash(title)
-                            if date_id > self.last_date_id and title_hash not in self.seen_title_hashes:
-                                self.crawl_detail(session, detail_url, date_id, title, sub_category)
-                                self.seen_title_hashes.add(title_hash)  # 첫 페이지 해시만 저장
+                        targets = [
+                            (detail_url, date_id, title, sub_category)
+                            for detail_url, date_id, title, sub_category in posts
+                            if date_id > self.last_date_id and hash(title) not in self.seen_title_hashes
+                        ]
+                        # 저장한 글의 해시는 _save_detail에서 seen_title_hashes에 추가 (첫 페이지 해시만 저장)
+                        all_saved = self.crawl_details_many(targets)
+
+                        if all_saved:
+                            self.fetcher.validators.commit(list_url)
+                        else:
+                            # 저장하지 못한 새 글이 있음: 다음 확인에서 304로 건너뛰지 않도록 검증자를 버린다
+                            self.fetcher.validators.discard(list_url)
                                 
                 except Exception as e:
                     self.logger.error(f"[{self.source}] Error on page 1: {str(e)}")
-        
+
         finally:
             self.save_state()
-            session.close()
 
     def build_list_url(self, page_num):
         """건축공학과 공지사항: 1페이지는 '/notice', 2페이지부터는 '/notice/page/N'"""
@@ -293,52 +330,115 @@ class ARCHITECTURE_ENGINEERING_AnnouncementCrawler:
         except Exception:
             return 0
 
-    def crawl_detail(self, session, detail_url, date_id, title, sub_category):
-        """상세 페이지 크롤 -> JSONL 저장 -> 상태 갱신"""
-        try:
-            html = self.fetcher.fetch_page_content(session, detail_url, source=self.source)
-            if not html:
-                self.logger.error(f"[{self.source}] 상세페이지 로드 실패: {detail_url}")
-                return
-
-            soup = BeautifulSoup(html, "html.parser")
-
-            # Parser 사용
-            # (사용자 환경에 따라 필요 필드들 조정)
-            parsed_json = self.parser.parse_notice(
-                soup=soup,
-                base_domain=self.parser.extract_domain(detail_url),
-                url=detail_url,
-                source=self.source,
-                title_selector=self.title_selector,
-                date_selector=self.date_selector,
-                author_selector=self.author_selector,
-                content_selector=self.content_selector,
-                sub_category_selector=self.sub_category_selector
-            )
+    def crawl_details_many(self, targets, stop_at_gap=True):
+        """
+        [(detail_url, date_id, title, sub_category), ...] 상세 페이지를 한꺼번에 요청하고,
+        도착하는 대로 파싱을 공유 파싱 풀에 넘긴다 (ListAnnouncementCrawler.crawl_notices_many와 같은 방식).
+        저장(jsonl 추가) + 상태 갱신은 targets 순서대로 한다.
+        재시도 큐로 넘어간 글은 저장 순서가 되면 RETRY_WAIT_TIMEOUT초까지 결과를 기다린다.
+        받지 못한 글(실패 / 재시도 실패 / 끝내 기다리지 못함)이 있으면:
+        - stop_at_gap=True(1페이지 새 글 확인): 그 글부터 저장하지 않고 last_date_id를 그 글 앞으로 되돌린다
+          (같은 날짜 글을 먼저 저장했어도 다음 실행에서 다시 잡히도록. 중복은 seen_title_hashes로 거름)
+        - stop_at_gap=False(최초 크롤링): 그 글만 건너뛴다 (최초 크롤링에서 놓친 글은 다시 확인하지 않음).
+        모든 글을 저장했으면 True.
+        """
+        if self._save_gap:
+            return False
+
+        specs = [
+            FetchSpec(target[0], source=self.source, use_cache=True, retry_owner=self.source, retry_context=target)
+            for target in targets
+        ]
+        position = {id(spec): i for i, spec in enumerate(specs)}
+        parsing = {}
+        next_index = 0
+        missing = 0
+
+        for spec, html in self.fetcher.fetch_many(specs):
+            index = position[id(spec)]
+            if html is RETRY_PENDING:
+                self.logger.info(f"[{self.source}] 상세페이지 재시도 대기: {spec.url}")
+                parsing[index] = RETRY_PENDING
+            else:
+                parsing[index] = self._submit_detail_parse(html, spec.url)
+            # 앞선 글의 파싱이 끝난 만큼만 순서대로 저장 (기다리지 않음 → 나머지 파싱도 계속 제출)
+            next_index, missing = self._save_parsed_in_order(targets, parsing, next_index, missing, stop_at_gap, wait=False)
+
+        next_index, missing = self._save_parsed_in_order(targets, parsing, next_index, missing, stop_at_gap, wait=True)
+        return missing == 0 and not self._save_gap
 
-            # 목록에서 이미 얻은 정보(날짜, 서브카테고리, 제목) 보정
-            parsed_json["createdDate"] = self.format_date_id(date_id)
-            parsed_json["subCategory"] = sub_category
-            parsed_json["title"] = title
+    def _save_parsed_in_order(self, targets, parsing, next_index, missing, stop_at_gap, wait):
+        """
+        parsing: {targets 인덱스: 파싱 Future / None(못 받은 글) / RETRY_PENDING(재시도 중)}
+        next_index부터 빈틈없이 이어지는 글을 저장하고 (다음 인덱스, 못 받은 글 수)를 반환.
+        """
+        while next_index in parsing and not self._save_gap:
+            future = parsing[next_index]
+            detail_url, date_id, title, sub_category = targets[next_index]
+            if future is RETRY_PENDING:
+                if not wait:
+                    break
+                finished, html = self.fetcher.retry_queue.wait_result(self.source, targets[next_index], RETRY_WAIT_TIMEOUT)
+                if not finished:
+                    self.logger.warning(f"[{self.source}] {RETRY_WAIT_TIMEOUT}초 안에 재시도가 끝나지 않음: {detail_url}")
+                future = self._submit_detail_parse(html, detail_url)
+            elif future is not None and not wait and not future.done():
+                break
+
+            saved = False
+            if future is not None:
+                try:
+                    self._save_detail(future.result(), detail_url, date_id, title, sub_category)
+                    saved = True
+                except Exception as e:
+                    self.logger.error(f"[{self.source}] 상세 페이지 크롤 중 오류: {detail_url}, {str(e)}")
+            if not saved:
+                missing += 1
+                if stop_at_gap:
+                    self.logger.warning(f"[{self.source}] 저장하지 못한 글에서 이번 확인 중단 (다음 실행에서 다시 처리): {detail_url}")
+                    self.last_date_id = min(self.last_date_id, date_id - 1)
+                    self._save_gap = True
+                    break
+            del parsing[next_index]
+            next_index += 1
+        return next_index, missing
+
+    def _submit_detail_parse(self, html, detail_url):
+        """받아온 상세 페이지 파싱을 파싱 풀에 넘기고 Future 반환 (못 받은 글은 None)"""
+        if not html:
+            self.logger.error(f"[{self.source}] 상세페이지 로드 실패: {detail_url}")
+            return None
+        return self.parse_pool.submit(self.parser, html, self.detail_parser, detail_url, self.source, self.plan)
+
+    def _process_retried_details(self):
+        """
+        기다리는 시간이 지난 뒤에 성공한 재시도 결과를 비운다 (순서가 어긋나므로 여기서 저장하지 않음).
+        그 글은 last_date_id가 넘어가지 않았으므로 다음 1페이지 확인에서 다시 잡히고, 본문은 디스크 캐시에서 읽는다.
+        """
+        for (detail_url, _, _, _), _ in self.fetcher.retry_queue.pop_completed(self.source):
+            self.logger.info(f"[{self.source}] 늦게 끝난 재시도 결과 버림 (다음 확인에서 캐시로 다시 처리): {detail_url}")
 
-            # JSONL로 저장
-            out_path = os.path.join(self.notices_dir, f"notices_{self.source}.jsonl")
-            JsonManager.save_to_jsonl(parsed_json, out_path)
+    def _save_detail(self, parsed_json, detail_url, date_id, title, sub_category):
+        """파싱 풀에서 받은 상세 페이지 JSON 보정 -> JSONL 저장 -> 상태 갱신"""
+        # 목록에서 이미 얻은 정보(날짜, 서브카테고리, 제목) 보정
+        parsed_json["createdDate"] = self.format_date_id(date_id)
+        parsed_json["subCategory"] = sub_category
+        parsed_json["title"] = title
 
-            self.index_to_issac(parsed_json)
-            
-            # self.index_to_opensearch(parsed_json)
+        # JSONL로 저장
+        out_path = os.path.join(self.notices_dir, f"notices_{self.source}.jsonl")
+        JsonManager.save_to_jsonl(parsed_json, out_path)
 
-            # 크롤 상태 갱신
-            if date_id > self.last_date_id:
-                self.last_date_id = date_id
-            self.seen_title_hashes.add(hash(title))
+        self.index_sink.put(self.source, (self, parsed_json))
+        
+        # self.index_to_opensearch(parsed_json)
 
-            self.logger.info(f"[{self.source}] 새 공지 저장 완료: {title}")
+        # 크롤 상태 갱신
+        if date_id > self.last_date_id:
+            self.last_date_id = date_id
+        self.seen_title_hashes.add(hash(title))
 
-        except Exception as e:
-            self.logger.error(f"[{self.source}] 상세 페이지 크롤 중 오류: {detail_url}, {str(e)}")
+        self.logger.info(f"[{self.source}] 새 공지 저장 완료: {title}")
 
     def format_date_id(self, date_id):
         """20241230 -> '2024-12-30' 변환"""
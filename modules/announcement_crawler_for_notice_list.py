@@ -1,14 +1,16 @@
 # /home/ubuntu/multiturn_ver1/new crawler/modules/announcement_crawler_for_notice_list.py
 
-import requests
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse, parse_qs, unquote
 import logging
 import os
 import json
 import re
 from .announcement_crawler import AnnouncementCrawler
+from .fetcher import FetchSpec, NOT_MODIFIED, RETRY_PENDING
+from .html_backend import make_soup
+from .metrics import METRICS
 from config.site_config import SITES
+from config.fetch_config import RETRY_WAIT_TIMEOUT
 import time
 
 
@@ -20,6 +22,7 @@ class ListAnnouncementCrawler(AnnouncementCrawler):
       3) _check_only_first_page_for_new: 첫 페이지에서 새 글이 있는지 확인
       4) _process_list_page: 목록 페이지 HTML 파싱 → 상세 페이지 크롤링
       5) crawl_notices: 단일 게시글 상세 페이지 파싱 + 저장 + state 갱신
+         (crawl_notices_many: 목록 페이지의 새 글 상세 페이지를 동시에 요청/파싱하고 저장은 순서대로)
     """
 
     def __init__(self, source, base_url, start_url, url_number, **kwargs):
@@ -27,42 +30,15 @@ class ListAnnouncementCrawler(AnnouncementCrawler):
         self.logger = logging.getLogger("AnnouncementCrawler")
         self.logger.info(f"[{self.source}] Initializing ListAnnouncementCrawler")
         # ------------------------------
-        # 사이트별 URL 빌드/목록 파싱 핸들러
+        # 사이트별 URL 빌드/목록 파싱 핸들러: 시작 시 만든 SitePlan에 들어 있음
+        # (표는 파일 끝의 LIST_URL_BUILDERS / LIST_PAGE_PARSERS, SIT 계열은 날짜 선택자로 자동 매핑)
         # ------------------------------
-        self.build_list_url_handlers = {
-            "MAIN_DORM": self._build_list_url_main_dorm,
-            "MATERIALS_SCIENCE_ENGINEERING": self._build_list_url_mse,
-            "INTERNATIONAL_COLLEGE_STUDENT_SERVICES": self._build_list_url_uic_student_services,
-            "INTERNATIONAL_COLLEGE_ACADEMIC_AFFAIRS": self._build_list_url_uic_academic_affairs,
-            "ATMOSPHERIC_SCIENCE": self._build_list_url_atmospheric_science,
-            "PHYSICS": self._build_list_url_physics,
-            "POLITICAL_SCIENCE": self._build_list_url_political_science,
-            "PSYCHOLOGY": self._build_list_url_psychology,
-            "BUSINESS_COLLEGE" : self._build_list_url_business_college
-        }
-
-        self.parse_list_page_handlers = {
-            "MAIN_DORM": self._parse_list_page_main_dorm,
-            "MATERIALS_SCIENCE_ENGINEERING": self._parse_list_page_mse,
-            "INTERNATIONAL_COLLEGE_STUDENT_SERVICES": self._parse_list_page_uic_student_services,
-            "INTERNATIONAL_COLLEGE_ACADEMIC_AFFAIRS": self._parse_list_page_uic_academic_affairs,
-            "ATMOSPHERIC_SCIENCE": self._parse_list_page_atmospheric_science,
-            "PHYSICS": self._parse_list_page_physics,
-            "POLITICAL_SCIENCE": self._parse_list_page_political_science,
-            "PSYCHOLOGY": self._parse_list_page_psychology,
-            "BUSINESS_COLLEGE" : self._parse_list_page_business_college
-        }
-
-        # SIT 계열 사이트 자동 매핑
-        sit_date_selectors = ("#jwxe_main_content > div > div.board-wrap > div > dl:nth-child(2) > dd" ,"#jwxe_main_content > div > div.board-wrap > div > dl:nth-child(4) > dd" ,"#jwxe_main_content > div > div > div > dl:nth-child(4) > dd")
         print(self.date_selector)
-        if self.date_selector in sit_date_selectors:
-            print("SIT 스타일 매핑")
-            self.build_list_url_handlers[self.source] = self._build_list_url_sit_like
-            self.parse_list_page_handlers[self.source] = self._parse_list_page_sit_like
 
         # offset 기반 사이트인지 핸들러로 판별
-        self.is_offset_based = (self.build_list_url_handlers.get(self.source) == self._build_list_url_sit_like)
+        self.is_offset_based = (self.plan.build_list_url is ListAnnouncementCrawler._build_list_url_sit_like)
+        # 새 글 확인 중 저장하지 못한 글이 있는지 (check_for_new_notices마다 초기화)
+        self._save_gap = False
         
         self.existing_psychology_ids = set()  # 이미 저장된 article_id
         self._load_existing_psychology_ids()  # 초기화 시 한번 로드
@@ -95,6 +71,11 @@ class ListAnnouncementCrawler(AnnouncementCrawler):
             max_pages (int): 전체 크롤링 시 최대 페이지 수 (기본값: 10)
             max_checks (int): 첫 페이지 확인 횟수 (기본값: 2)
         """
+        # 지난 실행에서 기다리다 놓친 재시도 결과 정리
+        self._process_retried_details()
+        # 이번 실행에서 새 글을 받지 못하면 True → 그 뒤 글은 저장하지 않음
+        self._save_gap = False
+
         if self.source == "PSYCHOLOGY" and self.existing_psychology_ids == set():
             self.logger.info(f"[{self.source}] No existing article_ids file found for {self.source}. Starting fresh.")
             self._crawl_full_in_reverse(max_pages)
@@ -118,16 +99,13 @@ class ListAnnouncementCrawler(AnnouncementCrawler):
         각 페이지 내에서는 오래된 글부터 정렬 → JSONL 최종 결과:
         위는 예전글, 아래는 최신글
         """
-        session = requests.Session()
         page_list = self._generate_reverse_page_list(max_pages)
 
         if self.source =="PSYCHOLOGY" :
-            self._process_list_page(session, 0, first_crawl=True)
+            self._process_list_page(0, first_crawl=True)
         else :
             for page_param in page_list:
-                self._process_list_page(session, page_param, first_crawl=True)
-
-        session.close()
+                self._process_list_page(page_param, first_crawl=True)
 
     # --------------------------------------------------
     # C. 첫 페이지에서만 새 글 확인
@@ -140,25 +118,22 @@ class ListAnnouncementCrawler(AnnouncementCrawler):
         Args:
             max_checks (int): 첫 페이지 확인 횟수
         """
-        session = requests.Session()
         if self.source == "BUSINESS_COLLEGE":
             for page_param in range(1, 6):  # 1부터 5페이지까지 확인
                 for check in range(max_checks):
                     self.logger.info(f"[{self.source}] Checking page {page_param} (attempt {check + 1}/{max_checks})")
-                    self._process_list_page(session, page_param, first_crawl=False)
+                    self._process_list_page(page_param, first_crawl=False)
         else :
             first_page_param = 0 if self.is_offset_based else 1
 
             for check in range(max_checks):
                 self.logger.info(f"[{self.source}] Checking first page (attempt {check + 1}/{max_checks})")
-                self._process_list_page(session, first_page_param, first_crawl=False)
-        
-        session.close()
+                self._process_list_page(first_page_param, first_crawl=False)
 
     # --------------------------------------------------
     # D. 목록 페이지 처리
     # --------------------------------------------------
-    def _process_list_page(self, session, page_param, first_crawl=False):
+    def _process_list_page(self, page_param, first_crawl=False):
         """
         1) list_url 빌드
         2) 페이지 가져오기
@@ -170,15 +145,21 @@ class ListAnnouncementCrawler(AnnouncementCrawler):
         # self.logger.info(f"[{self.source}] Fetching list page: {list_url}")
 
         if (self.source=="POLITICAL_SCIENCE") :
-            content = self.fetcher.fetch_with_form_data(session, list_url, source=self.source, page_param=page_param)
+            content = self.fetcher.fetch_with_form_data(list_url, source=self.source, page_param=page_param)
         else : 
-            content = self.fetcher.fetch_page_content(session, list_url, source=self.source)
+            # 새 글 확인(first_crawl=False)은 조건부 GET: 목록이 그대로면 파싱/상세 크롤링 생략
+            content = self.fetcher.fetch_page_content(list_url, source=self.source, conditional=not first_crawl)
+
+        if content is NOT_MODIFIED:
+            self.logger.info(f"[{self.source}] List page not modified: {list_url}")
+            METRICS.incr("conditional.parse_saved")
+            return
 
         if not content:
             # self.logger.warning(f"[{self.source}] Failed to fetch list page: {list_url}")
             return
 
-        soup = BeautifulSoup(content, "html.parser")
+        soup = make_soup(content, self.list_parser, region=self.list_region)
 
         post_links = self.parse_list_page(soup) # 에러 
         print(post_links)
@@ -207,50 +188,184 @@ class ListAnnouncementCrawler(AnnouncementCrawler):
                     else:
                         self.logger.debug(f"[{self.source}] Old post => skip: article_id={article_id}")
 
+            all_saved = True
         else :
+            targets = []
             for post_url, article_id, *optional in post_links:
                 sub_category = optional[0] if optional else None  # 존재하면 가져오고, 없으면 None
                 if first_crawl:
                     self.logger.info(f"[{self.source}] (Full) Found post: {post_url} (article_id: {article_id})")
-                    # self.crawl_notices(post_url, session=session)
-                    self.crawl_notices(post_url, session=session, article_id=article_id, sub_category= sub_category)
+                    targets.append((post_url, article_id, sub_category))
                 else:
                     if self.is_new_post_by_id(article_id):
                         self.logger.info(f"[{self.source}] Found NEW post: {post_url} (article_id: {article_id})")
-                        self.crawl_notices(post_url, session=session, article_id={article_id}, sub_category= sub_category)
+                        targets.append((post_url, article_id, sub_category))
                     else:
                         self.logger.debug(f"[{self.source}] Old post => skip: article_id={article_id}")
 
+            all_saved = self.crawl_notices_many(targets, stop_at_gap=not first_crawl)
+
+        if all_saved:
+            # 목록 페이지 처리를 끝냈으므로 다음 확인부터 조건부 GET 사용
+            self.fetcher.validators.commit(list_url)
+        else:
+            # 저장하지 못한 새 글이 있음: 다음 확인에서 304로 목록 전체를 건너뛰지 않도록 검증자를 버린다
+            self.fetcher.validators.discard(list_url)
+
     
     # --------------------------------------------------
     # E. 상세 페이지 크롤링
     # --------------------------------------------------
-    def crawl_notices(self, notice_url, session=None, article_id=None, sub_category=None):
+    def crawl_notices(self, notice_url, article_id=None, sub_category=None):
         """
         단일 게시글 상세 페이지 파싱 + 저장 + state 갱신
         """
-        if session is None:
-            session = requests.Session()
-
         
         # self.logger.info(f"[{self.source}] Crawling detail page: {notice_url}")
-
+        content = self.fetcher.fetch(self._detail_spec(notice_url, article_id, sub_category))
+        if content is RETRY_PENDING:
+            content = self._wait_for_retry((notice_url, article_id, sub_category))
+        self._handle_detail_content(content, notice_url, article_id, sub_category)
+
+    def crawl_notices_many(self, targets, stop_at_gap=True):
+        """
+        [(notice_url, article_id, sub_category), ...] 상세 페이지를 한꺼번에 요청하고,
+        도착하는 대로 파싱을 공유 파싱 풀에 넘긴다 (모든 사이트가 같은 풀을 쓰므로 비어 있는 워커가 가져감).
+        저장(jsonl 추가) + state 갱신은 targets 순서(오래된 글부터)대로 한다.
+        재시도 큐로 넘어간 글은 그 자리에서 재시도 결과를 기다린다 (RETRY_WAIT_TIMEOUT).
+        받지 못한 글(재시도까지 실패 / 끝내 기다리지 못함)이 있으면:
+        - stop_at_gap=True(새 글 확인): 그 글부터는 이번 실행에서 저장하지 않는다 (self._save_gap = True)
+          → state(last_article_no)가 그 글을 넘어가지 않으므로 다음 실행에서 순서대로 다시 처리된다.
+        - stop_at_gap=False(전체 역순 크롤링): 그 글만 건너뛴다.
+          멈추면 다음 실행부터는 첫 페이지만 확인하므로 뒤 페이지 글을 모두 잃게 된다.
+        모든 글을 저장했으면 True.
+        """
+        if self._save_gap:
+            return False
+
+        specs = [self._detail_spec(notice_url, article_id, sub_category) for notice_url, article_id, sub_category in targets]
+        position = {id(spec): i for i, spec in enumerate(specs)}
+        parsing = {}
+        next_index = 0
+        missing = 0
+
+        for spec, content in self.fetcher.fetch_many(specs):
+            index = position[id(spec)]
+            notice_url, article_id, sub_category = targets[index]
+            if content is RETRY_PENDING:
+                self.logger.info(f"[{self.source}] Detail fetch moved to retry queue: {notice_url}")
+                parsing[index] = RETRY_PENDING
+            else:
+                parsing[index] = self._submit_detail_parse(content, notice_url, sub_category)
+            # 앞선 글의 파싱이 끝난 만큼만 순서대로 저장 (기다리지 않음 → 나머지 파싱도 계속 제출)
+            next_index, missing = self._save_parsed_in_order(targets, parsing, next_index, missing, stop_at_gap, wait=False)
+
+        next_index, missing = self._save_parsed_in_order(targets, parsing, next_index, missing, stop_at_gap, wait=True)
+        return missing == 0 and not self._save_gap
+
+    def _save_parsed_in_order(self, targets, parsing, next_index, missing, stop_at_gap, wait):
+        """
+        parsing: {targets 인덱스: 파싱 Future / None(못 받은 글) / RETRY_PENDING(재시도 중)}
+        next_index부터 빈틈없이 이어지는 글을 저장하고 (다음 인덱스, 못 받은 글 수)를 반환.
+        wait=False면 파싱이 안 끝났거나 재시도 중인 글에서 멈춘다.
+        wait=True면 재시도 결과를 기다린다 (끝내 기다리지 못한 글은 못 받은 글로 센다).
+        stop_at_gap=True면 못 받은 글에서 멈추고 self._save_gap = True.
+        """
+        while next_index in parsing and not self._save_gap:
+            future = parsing[next_index]
+            notice_url, article_id, sub_category = targets[next_index]
+            if future is RETRY_PENDING:
+                if not wait:
+                    break
+                content = self._wait_for_retry(targets[next_index])
+                future = None if content is RETRY_PENDING else self._submit_detail_parse(content, notice_url, sub_category)
+            elif future is not None and not wait and not future.done():
+                break
+            if future is None:
+                missing += 1
+                if stop_at_gap:
+                    self.logger.warning(f"[{self.source}] Stop saving this run at unfetched post (retried next run): {notice_url}")
+                    self._save_gap = True
+                    break
+                self.logger.warning(f"[{self.source}] Skipping unfetched post during full crawl: {notice_url}")
+            else:
+                self._save_notice_detail(future.result(), notice_url, article_id)
+            del parsing[next_index]
+            next_index += 1
+        return next_index, missing
+
+    def _detail_spec(self, notice_url, article_id, sub_category):
+        # 상세 페이지는 게시 후 거의 바뀌지 않으므로 디스크 캐시 사용
+        # (state 유실 후 전체 역순 크롤링, 재시도, 파서 수정 후 재처리 시 네트워크 요청 생략)
+        # 첫 시도가 실패하면 재시도 큐로 넘기고 다음 글 요청을 계속 진행 → 저장 순서가 되면 _wait_for_retry로 결과를 기다림
+        retry_context = (notice_url, article_id, sub_category)
         if(self.source=="POLITICAL_SCIENCE") :
-            content = self.fetcher.fetch_with_form_data(session, notice_url, source=self.source, no=article_id)
-        else :
-            content = self.fetcher.fetch_page_content(session, notice_url, source=self.source)
+            return FetchSpec(notice_url, source=self.source, method="POST", no=article_id, use_cache=True, retry_owner=self.source, retry_context=retry_context)
+        return FetchSpec(notice_url, source=self.source, use_cache=True, retry_owner=self.source, retry_context=retry_context)
+
+    def _handle_detail_content(self, content, notice_url, article_id, sub_category):
+        if self._detail_content_ok(content, notice_url):
+            self.process_notice_content(content, notice_url, article_id, sub_category=sub_category)
+
+    def _detail_content_ok(self, content, notice_url):
+        if content is RETRY_PENDING:
+            self.logger.info(f"[{self.source}] Detail fetch moved to retry queue: {notice_url}")
+            return False
 
         if not content:
             self.logger.warning(f"[{self.source}] Failed to fetch detail: {notice_url}")
-            return
+            return False
+        return True
 
-        soup = BeautifulSoup(content, "html.parser") 
+    def _wait_for_retry(self, retry_context):
+        """
+        재시도 큐로 넘어간 상세 페이지 결과를 최대 RETRY_WAIT_TIMEOUT초 기다린다.
+        HTML 본문 / None(재시도까지 실패) / RETRY_PENDING(아직 재시도 중)
+        """
+        finished, content = self.fetcher.retry_queue.wait_result(self.source, retry_context, RETRY_WAIT_TIMEOUT)
+        if not finished:
+            self.logger.warning(f"[{self.source}] Retry still pending after {RETRY_WAIT_TIMEOUT}s: {retry_context[0]}")
+            return RETRY_PENDING
+        if content:
+            self.logger.info(f"[{self.source}] Retried detail fetched: {retry_context[0]}")
+        return content
+
+    def _submit_detail_parse(self, content, notice_url, sub_category):
+        """받아온 상세 페이지 파싱을 파싱 풀에 넘기고 Future 반환 (못 받은 글은 None)"""
+        if not self._detail_content_ok(content, notice_url):
+            return None
+        return self.parse_pool.submit(
+            self.parser, content, self.detail_parser, notice_url, self.source, self.plan,
+            pre_fetched_sub_category=sub_category,
+        )
 
-        self.process_notice_detail(soup, notice_url, article_id, sub_category= sub_category)
+    # --------------------------------------------------
+    # E-1. 재시도 큐에서 돌아온 상세 페이지 처리
+    # --------------------------------------------------
+    def _process_retried_details(self):
+        """
+        기다리는 시간(RETRY_WAIT_TIMEOUT)이 지난 뒤에 성공한 재시도 결과를 비운다.
+        여기서 jsonl에 추가하면 targets 순서가 깨지고, 그 사이 state가 앞서 있으면 저장도 안 된다.
+        그 글은 state가 넘어가지 않았으므로 다음 목록 확인에서 새 글로 다시 잡히고,
+        본문은 재시도 성공 시 디스크 캐시에 들어갔으므로 네트워크 요청 없이 순서대로 처리된다.
+        """
+        for (notice_url, _, _), _ in self.fetcher.retry_queue.pop_completed(self.source):
+            self.logger.info(f"[{self.source}] Late retry result dropped (re-crawled in order from cache): {notice_url}")
 
     # --------------------------------------------------
-    # E-1. 상세 페이지 데이터를 처리하는 메소드
+    # E-2. 상세 페이지 데이터를 처리하는 메소드
     # --------------------------------------------------
+    def process_notice_content(self, content, notice_url, article_id, sub_category=None):
+        """
+        받아온 상세 페이지 HTML 처리. 파싱(HTML -> JSON)은 파싱 풀(별도 프로세스)에서 하고
+        이 스레드는 결과 저장과 상태 갱신만 한다.
+        """
+        if self.source == "PSYCHOLOGY":
+            self.process_notice_detail(make_soup(content, self.detail_parser), notice_url, article_id, sub_category=sub_category)
+            return
+        json_data = self._submit_detail_parse(content, notice_url, sub_category).result()
+        self._save_notice_detail(json_data, notice_url, article_id)
+
     def process_notice_detail(self, soup, notice_url, article_id, sub_category= None):
         """
         상세 페이지 데이터를 처리하는 메소드:
@@ -285,9 +400,14 @@ class ListAnnouncementCrawler(AnnouncementCrawler):
                 author_selector=self.author_selector,
                 content_selector=self.content_selector,
                 sub_category_selector=self.sub_category_selector,
-                pre_fetched_sub_category=sub_category
+                pre_fetched_sub_category=sub_category,
+                plan=self.plan,
             )
 
+        self._save_notice_detail(json_data, notice_url, article_id)
+
+    def _save_notice_detail(self, json_data, notice_url, article_id):
+        """process_notice_detail의 2~4단계: 로컬 저장, 원격 전송, 상태 갱신"""
         # (2) 로컬 jsonl 저장
         from .json_manager import JsonManager
         file_path = os.path.join(self.notices_dir, f"notices_{self.source}.jsonl")
@@ -309,8 +429,8 @@ class ListAnnouncementCrawler(AnnouncementCrawler):
         else :
             JsonManager.save_to_jsonl(json_data, file_path)
 
-        # (3) 필요하다면 Opensearch/ISSAC 등 원격 전송
-        self.index_to_issac(json_data)
+        # (3) 필요하다면 Opensearch/ISSAC 등 원격 전송 (sink 단계로 넘김)
+        self.index_sink.put(self.source, (self, json_data))
         # self.index_to_opensearch(json_data)
 
 
@@ -341,18 +461,18 @@ class ListAnnouncementCrawler(AnnouncementCrawler):
             return list(range(max_pages, 0, -1))
 
     def _build_list_url(self, page_param):
-        handler = self.build_list_url_handlers.get(self.source)
+        handler = self.plan.build_list_url
         if handler:
-            return handler(page_param)
+            return handler(self, page_param)
         else:
             # fallback (offset 기반)
             return f"{self.base_url}?mode=list&articleLimit=10&article.offset={page_param}"
 
     def parse_list_page(self, soup):
-        handler = self.parse_list_page_handlers.get(self.source)
+        handler = self.plan.parse_list_page
         if handler:
             print("헨들러에 soup pass")
-            return handler(soup)
+            return handler(self, soup)
         return []
     
      # --------------------------------------------------
@@ -832,3 +952,32 @@ class ListAnnouncementCrawler(AnnouncementCrawler):
         return post_links
 
     
+
+
+# 사이트별 목록 URL 빌드 / 목록 파싱 핸들러 (unbound 함수: handler(crawler, ...)로 호출)
+LIST_URL_BUILDERS = {
+    "MAIN_DORM": ListAnnouncementCrawler._build_list_url_main_dorm,
+    "MATERIALS_SCIENCE_ENGINEERING": ListAnnouncementCrawler._build_list_url_mse,
+    "INTERNATIONAL_COLLEGE_STUDENT_SERVICES": ListAnnouncementCrawler._build_list_url_uic_student_services,
+    "INTERNATIONAL_COLLEGE_ACADEMIC_AFFAIRS": ListAnnouncementCrawler._build_list_url_uic_academic_affairs,
+    "ATMOSPHERIC_SCIENCE": ListAnnouncementCrawler._build_list_url_atmospheric_science,
+    "PHYSICS": ListAnnouncementCrawler._build_list_url_physics,
+    "POLITICAL_SCIENCE": ListAnnouncementCrawler._build_list_url_political_science,
+    "PSYCHOLOGY": ListAnnouncementCrawler._build_list_url_psychology,
+    "BUSINESS_COLLEGE" : ListAnnouncementCrawler._build_list_url_business_college
+}
+
+LIST_PAGE_PARSERS = {
+    "MAIN_DORM": ListAnnouncementCrawler._parse_list_page_main_dorm,
+    "MATERIALS_SCIENCE_ENGINEERING": ListAnnouncementCrawler._parse_list_page_mse,
+    "INTERNATIONAL_COLLEGE_STUDENT_SERVICES": ListAnnouncementCrawler._parse_list_page_uic_student_services,
+    "INTERNATIONAL_COLLEGE_ACADEMIC_AFFAIRS": ListAnnouncementCrawler._parse_list_page_uic_academic_affairs,
+    "ATMOSPHERIC_SCIENCE": ListAnnouncementCrawler._parse_list_page_atmospheric_science,
+    "PHYSICS": ListAnnouncementCrawler._parse_list_page_physics,
+    "POLITICAL_SCIENCE": ListAnnouncementCrawler._parse_list_page_political_science,
+    "PSYCHOLOGY": ListAnnouncementCrawler._parse_list_page_psychology,
+    "BUSINESS_COLLEGE" : ListAnnouncementCrawler._parse_list_page_business_college
+}
+
+# SIT 계열 사이트 (site_plan.SIT_DATE_SELECTORS로 판별): (URL 빌드, 목록 파싱)
+SIT_LIST_HANDLERS = (ListAnnouncementCrawler._build_list_url_sit_like, ListAnnouncementCrawler._parse_list_page_sit_like)
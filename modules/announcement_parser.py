@@ -7,99 +7,89 @@ from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
 import logging
 import re
+from .site_plan import make_plan, select_one
+
+# 일반 첨부파일 링크: href에 문서 확장자나 download가 들어 있음 (.doc/.xls는 .docx/.xlsx도 포함)
+FILE_LINK_PATTERN = re.compile(r"\.(?:pdf|doc|xls|zip|hwp)|download", re.I)
+
+# 첨부파일이 아닌 download 링크
+EXCLUDED_FILE_URLS = frozenset([
+    "https://che.yonsei.ac.kr/che/reunion/download.do",
+])
 
 class AnnouncementParser(Parser):
     def __init__(self, base_domain, logger):
         super().__init__(base_domain, logger)
-        self.source_handlers = {
-            "ACADEMIC_NOTICE": self.handle_academic_notice,
-            "BUSINESS_SCHOOL": self.handle_business_school,
-            "CHEMICAL_ENGINEERING": self.handle_chemical_engineering,
-            "SONGDO_DORM": self.handle_songdo_dorm,
-            "INTERNATIONAL_COLLEGE_STUDENT_SERVICES": self.handle_international_college,
-            "INTERNATIONAL_COLLEGE_ACADEMIC_AFFAIRS" : self.handle_international_college, # UIC 추가
-            "ATMOSPHERIC_SCIENCE": self.handle_atmospheric_science,  # 대기과학과 추가
-            "PHYSICAL_EDUCATION": self.handle_physical_education,  # 체육교육학과 추가
-            "PHYSICS": self.handle_physics,  # 물리학과 추가
-            "POLITICAL_SCIENCE" : self.handle_political_science,
-        }
-        self.file_handlers = {
-            "SOCIOLOGY": self.handle_sociology_files,
-            "CHEMICAL_ENGINEERING": self.handle_chemical_engineering_files,
-            "CHEMISTRY": self.handle_chemistry_files,
-            "EARTH_SYSTEM_SCIENCE": self.handle_earth_system_science_files,
-            "GLOBAL_TALENT_COLLEGE": self.handle_global_talent_college_files,
-             "POLITICAL_SCIENCE" : self.handle_political_science_files,
-        }
+        # 사이트별 핸들러는 파일 끝의 SOURCE_HANDLERS / FILE_HANDLERS (SitePlan이 참조를 들고 있음)
         self.logger = logger
 
     # 상위 클래스 Parser의 extract_file_links를 오버라이드
     def extract_file_links(self, soup, base_url, source=None):
-        files = []
-        
+        """
+        첨부파일 목록 [{"name", "url"}] (URL 기준 중복 제거, 처음 나온 순서).
+        특수 처리가 필요한 사이트는 FILE_HANDLERS의 핸들러가 일반 탐색 대신 페이지를 한 번 훑는다.
+        일반 탐색은 <a>를 한 번만 순회한다. href가 없는 링크는 p.file 안의 "내려받기" 버튼일 때만 의미가 있고,
+        예전 패턴별 탐색 순서(href 링크 → onclick 다운로드 → p.file)를 지키기 위해 맨 뒤에 붙인다.
+        """
         # 특수 처리가 필요한 사이트인 경우 해당 핸들러 호출
-        if source in self.file_handlers:
-            return self.file_handlers[source](soup, base_url)
-
-        excluded_urls = [
-            "https://che.yonsei.ac.kr/che/reunion/download.do"
-        ]
-
-        # 파일 링크를 찾을 수 있는 다양한 패턴 검색
-        link_patterns = [
-            ('a', {'href': True}),  # 기본 링크
-            ('a', {'onclick': lambda x: 'download' in x.lower() if x else False}),  # onclick 다운로드
-            ('p.file a', {}),  # 파일 클래스를 가진 p 태그 내의 링크
-            ('span[data-ellipsis="true"]', {})  # data-ellipsis 속성을 가진 span
-        ]
-
-        for selector, attrs in link_patterns:
-            for element in soup.select(selector) if selector.find('.') >= 0 else soup.find_all(selector, attrs):
-                href = element.get('href', '')
-                
-                # "내려받기" 텍스트를 가진 링크 처리
-                if element.get_text(strip=True) == "내려받기":
-                    parent_p = element.find_parent('p', class_='file')
-                    if parent_p:
-                        file_name_span = parent_p.find('span', attrs={'data-ellipsis': 'true'})
-                        if file_name_span:
-                            file_name = file_name_span.get_text(strip=True)
-                            file_url = urljoin(base_url, href)
-                            if file_url not in excluded_urls:
-                                files.append({"name": file_name, "url": file_url})
-                    continue
-
-                # 일반적인 파일 링크 처리
-                if any(ext in href.lower() for ext in ['.pdf', '.doc', '.docx', '.xls', '.xlsx', '.zip', '.hwp']) or 'download' in href.lower():
+        file_handler = FILE_HANDLERS.get(source)
+        if file_handler:
+            return file_handler(self, soup, base_url)
+
+        files = {}
+        onclick_buttons = []
+        file_p_buttons = []
+        for element in soup.find_all('a'):
+            has_href = element.has_attr('href')
+            file_info = self._file_link_info(element, element.get('href', ''), base_url, has_href)
+            if file_info is None:
+                continue
+            if has_href:
+                files.setdefault(file_info["url"], file_info)
+                continue
+            onclick = element.get('onclick')
+            if onclick and 'download' in onclick.lower():
+                onclick_buttons.append(file_info)
+            file_p_buttons.append(file_info)
+
+        for file_info in onclick_buttons + file_p_buttons:
+            files.setdefault(file_info["url"], file_info)
+        return list(files.values())
+
+    def _file_link_info(self, element, href, base_url, has_href):
+        """링크 하나가 첨부파일이면 {"name", "url"}, 아니면 None"""
+        text = element.get_text(strip=True)
+
+        # "내려받기" 텍스트를 가진 링크 처리 (파일명은 같은 p.file의 span)
+        if text == "내려받기":
+            parent_p = element.find_parent('p', class_='file')
+            if parent_p:
+                file_name_span = parent_p.find('span', attrs={'data-ellipsis': 'true'})
+                if file_name_span:
                     file_url = urljoin(base_url, href)
-                    parsed = urlparse(file_url)
-
-                    if file_url in excluded_urls:
-                        continue
-
-                    if parsed.scheme in ['http', 'https']:
-                        # 파일명 추출 로직
-                        title_attr = element.get('title', '')
-                        if title_attr:
-                            file_name = title_attr.replace('다운로드', '').strip()
-                        else:
-                            file_name = element.get_text(strip=True)
-
-                        if not file_name:
-                            file_name = os.path.basename(parsed.path)
-
-                        files.append({"name": file_name, "url": file_url})
-
-        # 중복 제거를 위해 URL을 키로 사용하는 딕셔너리 사용
-        unique_files = {}
-        for file_info in files:
-            url = file_info['url']
-            if url not in unique_files:
-                unique_files[url] = file_info
-        
-        return list(unique_files.values())
-    
+                    if file_url not in EXCLUDED_FILE_URLS:
+                        return {"name": file_name_span.get_text(strip=True), "url": file_url}
+            return None
+
+        # 일반적인 파일 링크 처리
+        if not has_href or not FILE_LINK_PATTERN.search(href):
+            return None
+        file_url = urljoin(base_url, href)
+        if file_url in EXCLUDED_FILE_URLS:
+            return None
+        parsed = urlparse(file_url)
+        if parsed.scheme not in ('http', 'https'):
+            return None
 
+        # 파일명 추출 로직
+        title_attr = element.get('title', '')
+        if title_attr:
+            file_name = title_attr.replace('다운로드', '').strip()
+        else:
+            file_name = text
+        if not file_name:
+            file_name = os.path.basename(parsed.path)
+        return {"name": file_name, "url": file_url}
 
     def handle_sociology_files(self, soup, base_url):
         files = []
@@ -290,10 +280,20 @@ class AnnouncementParser(Parser):
             return date_text
 
 
-    def parse_notice(self, soup, base_domain, url, source, title_selector, date_selector, author_selector, content_selector, sub_category_selector, pre_fetched_sub_category =None):
+    def parse_notice(self, soup, base_domain, url, source, title_selector, date_selector, author_selector, content_selector, sub_category_selector, pre_fetched_sub_category =None, plan=None):
         """
         프론트에 넘겨줄 JSON 구조에 맞게 파싱하는 메서드.
+        plan(SitePlan)이 주어지면 미리 컴파일된 선택자와 핸들러 참조를 쓰고 *_selector 인자는 무시한다.
         """
+        if plan is None:
+            plan = make_plan(source, {
+                "title_selector": title_selector,
+                "date_selector": date_selector,
+                "author_selector": author_selector,
+                "content_selector": content_selector,
+                "sub_category_selector": sub_category_selector,
+            })
+
         # tables = []
 
         # subCategory, author 추출
@@ -302,12 +302,12 @@ class AnnouncementParser(Parser):
         plainText = ""
         content_html = ""
 
-        title = soup.select_one(title_selector)
+        title = select_one(soup, plan.title)
         title_text = title.get_text(strip=True) if title else ""
-        author_tag = soup.select_one(author_selector)
+        author_tag = select_one(soup, plan.author)
         author_text = author_tag.get_text(strip=True) if author_tag else ""
 
-        sub_category_tag = soup.select_one(sub_category_selector)
+        sub_category_tag = select_one(soup, plan.sub_category)
         sub_category = sub_category_tag.get_text(strip=True) if sub_category_tag else ""
         
         if(source=="BUSINESS_COLLEGE") :
@@ -317,43 +317,27 @@ class AnnouncementParser(Parser):
             match = re.search(r"\[(.*?)\]", title_text)
             sub_category = match.group(1) if match else ""  # 없으면 None
             
-        date = soup.select_one(date_selector)
+        date = select_one(soup, plan.date)
         date_text = date.get_text(strip=True) if date else ""
         date_text = self.standardize_date(date_text)
 
         # content: .fr-view 내부 HTML 전부
-        content_element = soup.select_one(content_selector)
+        content_element = select_one(soup, plan.content)
 
         if content_element:
-            content_html = str(content_element)
-            # 1) \" -> '
-            content_html = content_html.replace('\\"', "'")
-            
-            if base_domain.endswith('/'):
-                base_domain = base_domain[:-1]
-                
-            # 2) src="/..." → src="base_domain/..."
-            pattern_src = r'src="(\/[^"]+)"'
-            replacement_src = fr'src="{base_domain}\1"'
-            content_html = re.sub(pattern_src, replacement_src, content_html)
-            
-            # 3) href가 http로 시작하지 않는 경우 base_domain 추가
-            pattern_href = r'href="(?!http[s]?://)((?!javascript:)[^"]+)"'
-            replacement_href = fr'href="{base_domain}\1"'
-            content_html = re.sub(pattern_href, replacement_href, content_html)
+            content_html = self.render_content_html(content_element, base_domain)
+            plainText = self.extract_plain_text(content_element)
 
-            for element in content_element.select("*"):  # 모든 자식 태그
-                text_content = element.get_text(strip=True)
-                if text_content:
-                    plainText += text_content + " "
-
-        extracted_files = self.extract_file_links(soup, self.base_domain, source)
+        if plan.file_handler:
+            extracted_files = plan.file_handler(self, soup, self.base_domain)
+        else:
+            extracted_files = self.extract_file_links(soup, self.base_domain)
 
 
 
-        if source in self.source_handlers:
-            sub_category, author_text, date_text = self.source_handlers[source](
-                soup, sub_category, author_text, date_text
+        if plan.source_handler:
+            sub_category, author_text, date_text = plan.source_handler(
+                self, soup, sub_category, author_text, date_text
             )
         else:   
             print(f"No handler found for source: {source}")
@@ -612,4 +596,28 @@ class AnnouncementParser(Parser):
         return sub_category, author_text, date_text
     
     def handle_political_science(self, soup, sub_category, author_text, date_text):
-        return sub_category, author_text, date_text
\ No newline at end of file
+        return sub_category, author_text, date_text
+
+
+# 사이트별 특수 처리 핸들러 (unbound 함수: handler(parser, soup, ...)로 호출)
+SOURCE_HANDLERS = {
+    "ACADEMIC_NOTICE": AnnouncementParser.handle_academic_notice,
+    "BUSINESS_SCHOOL": AnnouncementParser.handle_business_school,
+    "CHEMICAL_ENGINEERING": AnnouncementParser.handle_chemical_engineering,
+    "SONGDO_DORM": AnnouncementParser.handle_songdo_dorm,
+    "INTERNATIONAL_COLLEGE_STUDENT_SERVICES": AnnouncementParser.handle_international_college,
+    "INTERNATIONAL_COLLEGE_ACADEMIC_AFFAIRS" : AnnouncementParser.handle_international_college, # UIC 추가
+    "ATMOSPHERIC_SCIENCE": AnnouncementParser.handle_atmospheric_science,  # 대기과학과 추가
+    "PHYSICAL_EDUCATION": AnnouncementParser.handle_physical_education,  # 체육교육학과 추가
+    "PHYSICS": AnnouncementParser.handle_physics,  # 물리학과 추가
+    "POLITICAL_SCIENCE" : AnnouncementParser.handle_political_science,
+}
+
+FILE_HANDLERS = {
+    "SOCIOLOGY": AnnouncementParser.handle_sociology_files,
+    "CHEMICAL_ENGINEERING": AnnouncementParser.handle_chemical_engineering_files,
+    "CHEMISTRY": AnnouncementParser.handle_chemistry_files,
+    "EARTH_SYSTEM_SCIENCE": AnnouncementParser.handle_earth_system_science_files,
+    "GLOBAL_TALENT_COLLEGE": AnnouncementParser.handle_global_talent_college_files,
+    "POLITICAL_SCIENCE" : AnnouncementParser.handle_political_science_files,
+}
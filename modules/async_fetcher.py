@@ -0,0 +1,245 @@
+# async_fetcher.py
+
+import asyncio
+import threading
+import time
+from urllib.parse import urlparse
+
+import aiohttp
+
+from config.fetch_config import MAX_CONNECTIONS, DEFAULT_HOST_CONCURRENCY, HOST_CONCURRENCY, KEEPALIVE_TIMEOUT, DNS_CACHE_TTL, STREAM_CHUNK_SIZE
+from .rate_limiter import HostRateLimiter
+from .circuit_breaker import CircuitBreakerRegistry
+from .latency_tracker import LatencyTracker
+from .metrics import METRICS
+from .pipeline import stage_meter
+
+
+class BodyTooLarge(Exception):
+    """응답 본문이 max_bytes를 넘어 읽기를 중단함"""
+
+
+class FetchResponse:
+    """
+    엔진이 돌려주는 응답 (본문까지 모두 읽은 상태).
+    accept_types에 맞지 않는 200 응답은 본문을 읽지 않으므로 content가 None이다.
+    """
+
+    def __init__(self, status_code, headers, content, url):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+
+
+class AsyncFetchEngine:
+    """
+    aiohttp 기반 비동기 fetch 엔진.
+    - 별도 스레드에서 이벤트 루프를 하나 돌리고, 모든 크롤러가 이 루프를 공유한다.
+    - 호스트별 세마포어로 동시 요청 수를, 토큰 버킷으로 요청 속도를 제한한다.
+    - 호스트별 서킷 브레이커(breakers)를 들고 있으며, 성공/실패 판정과 기록은 Fetcher가 한다.
+    - 호스트별 지연 히스토그램(latency)으로 연결/읽기 타임아웃을 정한다.
+    - 코루틴은 submit()/run()으로 어느 스레드에서든 실행할 수 있다.
+    """
+
+    def __init__(self, max_connections=MAX_CONNECTIONS, default_host_limit=DEFAULT_HOST_CONCURRENCY, host_limits=None, rate_limiter=None, breakers=None, latency=None):
+        self.max_connections = max_connections
+        self.default_host_limit = default_host_limit
+        self.host_limits = dict(HOST_CONCURRENCY if host_limits is None else host_limits)
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.breakers = breakers or CircuitBreakerRegistry()
+        self.latency = latency or LatencyTracker()
+
+        self._loop = None
+        self._thread = None
+        self._session = None
+        self._host_semaphores = {}
+        self._lock = threading.Lock()
+
+    # --------------------------------------------------
+    # 이벤트 루프 관리
+    # --------------------------------------------------
+    def _ensure_started(self):
+        with self._lock:
+            if self._loop is not None:
+                return
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever, name="AsyncFetchEngine", daemon=True)
+            self._thread.start()
+
+    def submit(self, coro):
+        """코루틴을 엔진 루프에 올리고 concurrent.futures.Future 반환"""
+        self._ensure_started()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run(self, coro):
+        """코루틴을 엔진 루프에서 실행하고 결과가 나올 때까지 대기 (동기 호출용)"""
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("엔진 루프 스레드에서는 run()을 호출할 수 없습니다. await를 사용하세요.")
+        return self.submit(coro).result()
+
+    def close(self):
+        """세션을 닫고 이벤트 루프를 종료"""
+        if self._loop is None:
+            return
+        if self._session is not None:
+            self.run(self._session.close())
+            self._session = None
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop = None
+        self._thread = None
+
+    # --------------------------------------------------
+    # 요청
+    # --------------------------------------------------
+    def _get_session(self):
+        # 루프 스레드 안에서만 호출됨
+        # 세션(커넥션 풀)은 프로세스가 끝날 때까지 유지되어 사이클이 바뀌어도 keep-alive 연결을 재사용한다
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=0,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                ssl=False,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                cookie_jar=aiohttp.CookieJar(unsafe=True),
+                trace_configs=[self._connection_trace()],
+            )
+        return self._session
+
+    def _connection_trace(self):
+        """
+        새 연결 / 재사용 연결 횟수를 METRICS에 기록하고,
+        연결 수립 시간과 응답 헤더 대기 시간을 self.latency에 기록하는 trace 설정
+        """
+
+        async def on_request_start(session, context, params):
+            context.host = params.url.host or ""
+
+        async def on_connection_create_start(session, context, params):
+            context.connect_started = time.monotonic()
+
+        async def on_connection_create_end(session, context, params):
+            METRICS.incr("pool.engine.new_connections")
+            self.latency.record(context.host, "connect", time.monotonic() - context.connect_started)
+
+        async def on_connection_reuseconn(session, context, params):
+            METRICS.incr("pool.engine.reused")
+
+        async def on_request_headers_sent(session, context, params):
+            context.headers_sent = time.monotonic()
+
+        async def on_response_headers(session, context, params):
+            # 리다이렉트 응답도 한 번의 왕복이므로 같이 기록
+            if getattr(context, "headers_sent", None) is not None:
+                self.latency.record(context.host, "read", time.monotonic() - context.headers_sent)
+                context.headers_sent = None
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_start.append(on_connection_create_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_request_headers_sent.append(on_request_headers_sent)
+        trace_config.on_request_end.append(on_response_headers)
+        trace_config.on_request_redirect.append(on_response_headers)
+        return trace_config
+
+    def _host_semaphore(self, host):
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            limit = self.host_limits.get(host, self.default_host_limit)
+            semaphore = asyncio.Semaphore(limit)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    async def request(self, method, url, headers=None, data=None, timeout=30, allow_redirects=True, accept_types=None, max_bytes=None):
+        """
+        단일 HTTP 요청. 본문은 헤더를 확인한 뒤 스트리밍으로 읽는다.
+        - accept_types: 200 응답의 Content-Type에 이 중 하나가 포함되지 않으면 본문을 읽지 않는다 (PDF/HWP 링크 등)
+        - max_bytes: Content-Length나 실제로 읽은 양이 이를 넘으면 즉시 중단하고 BodyTooLarge를 올린다
+        - timeout: 요청 전체 상한. 연결/읽기 타임아웃은 호스트별 지연 히스토그램에서 정한다.
+        타임아웃은 asyncio.TimeoutError, 연결/프로토콜 오류는 aiohttp.ClientError로 올라온다.
+        """
+        host = urlparse(url).hostname or ""
+        session = self._get_session()
+        connect_timeout, read_timeout = self.latency.timeouts_for(host)
+        read_timeout = min(read_timeout, timeout)
+        # fetch 단계 계측: 속도 제한/호스트 동시성 슬롯을 기다린 시간은 blocked, 나머지는 처리 시간
+        meter = stage_meter("fetch")
+        meter.enter()
+        queued = time.monotonic()
+        started = queued
+        try:
+            # 재시도를 포함한 모든 요청은 호스트(그룹) 토큰 버킷에서 슬롯을 예약한 뒤 나간다
+            await self.rate_limiter.acquire(host)
+            async with self._host_semaphore(host):
+                started = time.monotonic()
+                meter.blocked(started - queued)
+                try:
+                    return await self._send(session, method, url, headers, data, allow_redirects, accept_types, max_bytes,
+                                            aiohttp.ClientTimeout(total=timeout, sock_connect=connect_timeout, sock_read=read_timeout))
+                except aiohttp.ConnectionTimeoutError:
+                    # 타임아웃도 "최소 이만큼 걸림"으로 기록해 느려진 호스트의 타임아웃이 늘어나도록 함
+                    self.latency.record(host, "connect", connect_timeout)
+                    raise
+                except aiohttp.SocketTimeoutError:
+                    self.latency.record(host, "read", read_timeout)
+                    raise
+        finally:
+            meter.leave(time.monotonic() - started)
+
+    async def _send(self, session, method, url, headers, data, allow_redirects, accept_types, max_bytes, timeout):
+        """요청을 보내고 헤더 확인 후 본문을 스트리밍으로 읽는다 (request() 참고)"""
+        async with session.request(
+            method,
+            url,
+            headers=headers,
+            data=data,
+            allow_redirects=allow_redirects,
+            timeout=timeout,
+        ) as response:
+            if response.status == 200 and accept_types:
+                content_type = response.headers.get("Content-Type", "").lower()
+                if not any(t in content_type for t in accept_types):
+                    METRICS.incr("stream.rejected_content_type")
+                    METRICS.incr("stream.bytes_skipped", response.content_length or 0)
+                    return FetchResponse(response.status, response.headers, None, str(response.url))
+
+            if max_bytes is not None and (response.content_length or 0) > max_bytes:
+                METRICS.incr("stream.aborted_oversize")
+                METRICS.incr("stream.bytes_skipped", response.content_length)
+                raise BodyTooLarge(f"Content-Length {response.content_length} > {max_bytes}")
+
+            content = await self._read_body(response, max_bytes)
+            return FetchResponse(response.status, response.headers, content, str(response.url))
+
+    @staticmethod
+    async def _read_body(response, max_bytes):
+        """본문을 청크 단위로 읽다가 max_bytes를 넘으면 중단 (Content-Length가 없거나 틀린 응답 대비)"""
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            size += len(chunk)
+            if max_bytes is not None and size > max_bytes:
+                METRICS.incr("stream.aborted_oversize")
+                raise BodyTooLarge(f"본문이 {max_bytes}바이트를 넘음")
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine():
+    """프로세스 전체에서 공유하는 엔진 반환"""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = AsyncFetchEngine()
+        return _engine
@@ -0,0 +1,131 @@
+# charset_cache.py
+
+import os
+import re
+import json
+import codecs
+import threading
+
+import chardet
+
+from config.fetch_config import CHARSET_META_SCAN_BYTES, CHARSET_DETECT_BYTES
+from .metrics import METRICS
+
+_HEADER_CHARSET = re.compile(r"charset=[\"']?([\w.:-]+)", re.I)
+# <meta charset="..."> / <meta http-equiv="Content-Type" content="text/html; charset=...">
+_META_CHARSET = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?\s*([\w.:-]+)", re.I)
+
+
+def normalize_charset(name):
+    """파이썬 코덱 이름으로 정규화. 모르는 이름이면 None"""
+    if not name:
+        return None
+    try:
+        encoding = codecs.lookup(name.strip()).name
+    except LookupError:
+        return None
+    if encoding == "euc_kr":
+        # 국내 사이트의 EUC-KR 선언은 대부분 실제로는 확장 완성형(CP949)
+        return "cp949"
+    if encoding == "ascii":
+        return "utf-8"
+    return encoding
+
+
+class CharsetCache:
+    """
+    호스트별 문자 인코딩 기억.
+    페이지마다 Content-Type 헤더 → <meta> 선언 → 호스트에 기억된 인코딩 순으로 시도하고,
+    모두 없거나 맞지 않을 때만 chardet으로 한 번 감지해서 호스트에 기억한다.
+    각 후보는 strict로 디코딩해 보고 실패하면 다음 후보로 넘어간다 (사이트가 인코딩을 바꾼 경우 대비).
+    기억한 인코딩은 파일에 저장되어 재시작 후에도 감지를 다시 하지 않는다.
+    """
+
+    def __init__(self, path="./output/http_cache/charsets.json"):
+        self.path = path
+        self._charsets = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._charsets = json.load(f)
+            except (OSError, ValueError):
+                self._charsets = {}
+
+    def save(self):
+        with self._lock:
+            data = dict(self._charsets)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def get(self, host):
+        with self._lock:
+            return self._charsets.get(host)
+
+    def decode(self, host, content, content_type=""):
+        """응답 본문(bytes)을 str로 디코딩"""
+        declared = self._declared_charset(content, content_type)
+        if declared:
+            text = self._try_decode(content, declared)
+            if text is not None:
+                METRICS.incr("charset.declared")
+                self._remember(host, declared)
+                return text
+
+        cached = self.get(host)
+        if cached and cached != declared:
+            text = self._try_decode(content, cached)
+            if text is not None:
+                METRICS.incr("charset.cached")
+                return text
+            METRICS.incr("charset.mismatch")
+
+        # 선언도 없고 기억한 인코딩도 맞지 않음: 앞부분만 감지
+        detected = normalize_charset(chardet.detect(content[:CHARSET_DETECT_BYTES])["encoding"]) or "utf-8"
+        METRICS.incr("charset.detected")
+        self._remember(host, detected)
+        return content.decode(detected, errors="replace")
+
+    @staticmethod
+    def _declared_charset(content, content_type):
+        match = _HEADER_CHARSET.search(content_type or "")
+        if match:
+            encoding = normalize_charset(match.group(1))
+            if encoding:
+                return encoding
+        match = _META_CHARSET.search(content[:CHARSET_META_SCAN_BYTES])
+        if match:
+            return normalize_charset(match.group(1).decode("ascii", errors="ignore"))
+        return None
+
+    @staticmethod
+    def _try_decode(content, encoding):
+        try:
+            return content.decode(encoding)
+        except (UnicodeDecodeError, LookupError):
+            return None
+
+    def _remember(self, host, encoding):
+        if not host:
+            return
+        with self._lock:
+            self._charsets[host] = encoding
+
+
+_charset_cache = None
+_charset_cache_lock = threading.Lock()
+
+
+def get_charset_cache():
+    """프로세스 전체에서 공유하는 호스트별 인코딩 저장소 반환"""
+    global _charset_cache
+    with _charset_cache_lock:
+        if _charset_cache is None:
+            _charset_cache = CharsetCache()
+        return _charset_cache
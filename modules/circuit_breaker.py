@@ -0,0 +1,98 @@
+# circuit_breaker.py
+
+import threading
+
+from config.fetch_config import BREAKER_FAILURE_THRESHOLD
+
+CLOSED = "CLOSED"
+OPEN = "OPEN"
+HALF_OPEN = "HALF_OPEN"
+
+
+class _Breaker:
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0       # 연속 실패 횟수
+        self.trips = 0          # 누적 차단 횟수
+        self.probing = False    # HALF_OPEN 상태에서 시험 요청이 진행 중인지
+
+
+class CircuitBreakerRegistry:
+    """
+    호스트별 서킷 브레이커.
+    - CLOSED: 정상. 연속 실패가 threshold에 도달하면 OPEN.
+    - OPEN: 이번 사이클 동안 해당 호스트 요청을 바로 실패 처리(재시도 루프를 돌지 않음).
+    - 다음 사이클 시작(start_cycle) 시 HALF_OPEN으로 바뀌고, 시험 요청 하나만 내보낸다.
+      성공하면 CLOSED, 실패하면 다시 OPEN.
+    실패 = 5xx / 타임아웃 / 연결 오류 (4xx 등은 서버가 살아 있는 것으로 본다).
+    """
+
+    def __init__(self, failure_threshold=BREAKER_FAILURE_THRESHOLD):
+        self.failure_threshold = failure_threshold
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def _get(self, host):
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = _Breaker()
+            self._breakers[host] = breaker
+        return breaker
+
+    def allow(self, host):
+        """host로 요청을 보내도 되는지. HALF_OPEN이면 첫 호출만 시험 요청으로 통과시킨다"""
+        with self._lock:
+            breaker = self._get(host)
+            if breaker.state == CLOSED:
+                return True
+            if breaker.state == HALF_OPEN and not breaker.probing:
+                breaker.probing = True
+                return True
+            return False
+
+    def is_open(self, host):
+        with self._lock:
+            breaker = self._breakers.get(host)
+            return breaker is not None and breaker.state == OPEN
+
+    def record_success(self, host):
+        """성공 기록. 차단 상태에서 복구되었으면 True"""
+        with self._lock:
+            breaker = self._get(host)
+            recovered = breaker.state != CLOSED
+            breaker.state = CLOSED
+            breaker.failures = 0
+            breaker.probing = False
+            return recovered
+
+    def record_failure(self, host):
+        """실패 기록. 이번 실패로 차단(OPEN)되었으면 True"""
+        with self._lock:
+            breaker = self._get(host)
+            breaker.failures += 1
+            if breaker.state == HALF_OPEN or (breaker.state == CLOSED and breaker.failures >= self.failure_threshold):
+                breaker.state = OPEN
+                breaker.probing = False
+                breaker.trips += 1
+                return True
+            return False
+
+    def start_cycle(self):
+        """새 사이클 시작: OPEN인 호스트를 HALF_OPEN으로 바꾸고 그 목록을 반환"""
+        with self._lock:
+            hosts = []
+            for host, breaker in self._breakers.items():
+                if breaker.state == OPEN:
+                    breaker.state = HALF_OPEN
+                    breaker.probing = False
+                    hosts.append(host)
+            return hosts
+
+    def snapshot(self):
+        """정상(CLOSED)이 아니거나 차단된 적이 있는 호스트: {host: {"state", "failures", "trips"}}"""
+        with self._lock:
+            return {
+                host: {"state": b.state, "failures": b.failures, "trips": b.trips}
+                for host, b in self._breakers.items()
+                if b.state != CLOSED or b.trips
+            }
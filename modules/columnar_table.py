@@ -0,0 +1,66 @@
+# columnar_table.py
+
+from array import array
+
+
+class ColumnarTable:
+    """
+    Parser.parse_table 결과를 셀 dict 대신 열(column) 배열로 담는 표.
+    - 셀 i의 위치/병합 정보: row[i], col[i], rowspan[i], colspan[i] (array('i'))
+    - 문자열(셀 텍스트, 이미지/링크 URL, 링크 텍스트)은 표 전체가 공유하는 문자열 테이블의 번호로 저장
+    - 이미지/링크는 있는 셀만 {셀 번호: [...]}로 저장
+    기존 JSON 형태({"table": [셀 dict, ...]})는 to_json()을 호출할 때 만든다.
+    """
+
+    __slots__ = ("strings", "_string_ids", "text", "row", "col", "rowspan", "colspan", "img_links", "links")
+
+    def __init__(self):
+        self.strings = []
+        self._string_ids = {}
+        self.text = array("i")
+        self.row = array("i")
+        self.col = array("i")
+        self.rowspan = array("i")
+        self.colspan = array("i")
+        self.img_links = {}  # 셀 번호 → [URL 문자열 번호]
+        self.links = {}      # 셀 번호 → [(href 문자열 번호, 텍스트 문자열 번호)]
+
+    def __len__(self):
+        return len(self.text)
+
+    def intern(self, value):
+        """문자열 테이블 번호 (처음 보는 문자열이면 추가)"""
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.strings.append(value)
+            self._string_ids[value] = string_id
+        return string_id
+
+    def add_cell(self, text, row, col, rowspan=1, colspan=1):
+        """셀 추가 후 셀 번호 반환"""
+        self.text.append(self.intern(text))
+        self.row.append(row)
+        self.col.append(col)
+        self.rowspan.append(rowspan)
+        self.colspan.append(colspan)
+        return len(self.text) - 1
+
+    def cell_json(self, index):
+        """셀 하나를 기존 parse_table의 셀 dict 형태로"""
+        strings = self.strings
+        cell = {"text": strings[self.text[index]]}
+        if self.colspan[index] > 1:
+            cell["colspan"] = self.colspan[index]
+        if self.rowspan[index] > 1:
+            cell["rowspan"] = self.rowspan[index]
+        if index in self.img_links:
+            cell["img_links"] = [strings[i] for i in self.img_links[index]]
+        if index in self.links:
+            cell["links"] = [{"href": strings[h], "text": strings[t]} for h, t in self.links[index]]
+        cell["row"] = self.row[index]
+        cell["col"] = self.col[index]
+        return cell
+
+    def to_json(self):
+        return {"table": [self.cell_json(i) for i in range(len(self))]}
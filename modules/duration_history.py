@@ -0,0 +1,76 @@
+# duration_history.py
+
+import os
+import json
+import heapq
+import threading
+
+from config.fetch_config import DURATION_EWMA_ALPHA
+
+
+class DurationHistory:
+    """
+    사이트(작업)별 실행 시간 기록. 최근 값에 DURATION_EWMA_ALPHA만큼 가중치를 둔 지수 이동 평균.
+    스케줄러가 같은 시각에 due가 된 작업을 오래 걸리는 것부터 시작(LPT)하는 데 쓴다.
+    파일에 저장되어 재시작 직후 첫 실행부터 사용된다.
+    """
+
+    def __init__(self, path="./output/crawler_state/site_durations.json"):
+        self.path = path
+        self._durations = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._durations = json.load(f)
+            except (OSError, ValueError):
+                self._durations = {}
+
+    def save(self):
+        with self._lock:
+            data = dict(self._durations)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def record(self, name, seconds):
+        with self._lock:
+            previous = self._durations.get(name)
+            if previous is None:
+                self._durations[name] = seconds
+            else:
+                self._durations[name] = previous + DURATION_EWMA_ALPHA * (seconds - previous)
+
+    def expected(self, name):
+        """예상 실행 시간(초). 기록이 없으면 기록된 작업들의 평균 (아무것도 없으면 0)"""
+        with self._lock:
+            value = self._durations.get(name)
+            if value is None and self._durations:
+                value = sum(self._durations.values()) / len(self._durations)
+            return value or 0.0
+
+
+def predicted_makespan(durations, workers):
+    """durations를 주어진 순서대로 비어 있는 워커에 배정했을 때 마지막 작업이 끝나는 시간"""
+    loads = [0.0] * max(1, min(workers, len(durations)))
+    for duration in durations:
+        heapq.heapreplace(loads, loads[0] + duration)
+    return max(loads) if durations else 0.0
+
+
+_duration_history = None
+_duration_history_lock = threading.Lock()
+
+
+def get_duration_history():
+    """프로세스 전체에서 공유하는 실행 시간 기록 반환"""
+    global _duration_history
+    with _duration_history_lock:
+        if _duration_history is None:
+            _duration_history = DurationHistory()
+        return _duration_history
@@ -1,21 +1,82 @@
 # fetcher.py
 
-import requests
+import asyncio
 import random
 import time
-import urllib3
-from urllib.parse import urlparse, urljoin
-import logging
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import aiohttp
+from concurrent.futures import as_completed
+from urllib.parse import urlparse
+from .async_fetcher import get_engine, BodyTooLarge
+from .validator_cache import get_validator_cache
+from .response_cache import ResponseCache, get_response_cache
+from .retry_queue import get_retry_queue
+from .charset_cache import get_charset_cache
+from .metrics import METRICS
+from config.site_config import SITES
+from config.fetch_config import DEFAULT_CACHE_TTL, DEFAULT_MAX_BODY_BYTES
+
+
+class _NotModified:
+    """304 응답 표시용 센티널 (falsy라서 미처리 호출부에서는 실패와 동일하게 취급된다)"""
+
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return "NOT_MODIFIED"
+
+
+NOT_MODIFIED = _NotModified()
+
+
+class _RetryPending:
+    """재시도 큐로 넘어간 요청 표시용 센티널 (falsy)"""
+
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return "RETRY_PENDING"
+
+
+RETRY_PENDING = _RetryPending()
+
+
+class FetchSpec:
+    """
+    fetch_many에 넘길 요청 하나.
+    method="GET"이면 fetch_page_content, "POST"면 fetch_with_form_data(page_param / no)와 같은 요청을 보낸다.
+    """
+
+    def __init__(self, url, source=None, method="GET", page_param=None, no=None, conditional=False, use_cache=False, retry_owner=None, retry_context=None):
+        self.url = url
+        self.source = source
+        self.method = method
+        self.page_param = page_param
+        self.no = no
+        self.conditional = conditional
+        self.use_cache = use_cache
+        self.retry_owner = retry_owner
+        self.retry_context = retry_context
+
 
 class Fetcher:
-    def __init__(self, user_agents=None, logger=None):
+    def __init__(self, user_agents=None, logger=None, engine=None, validators=None, response_cache=None, retry_queue=None, charsets=None):
         # 기본 User-Agent를 설정
         self.USER_AGENTS = user_agents or [
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         ]
         self.logger = logger
+        # 모든 Fetcher가 공유하는 비동기 엔진 (호스트별 동시성 제한 포함)
+        self.engine = engine or get_engine()
+        # URL별 ETag / Last-Modified (조건부 GET)
+        self.validators = validators or get_validator_cache()
+        # 상세 페이지 디스크 캐시
+        self.response_cache = response_cache or get_response_cache()
+        # 워커를 붙잡지 않는 지연 재시도 큐
+        self.retry_queue = retry_queue or get_retry_queue()
+        # 호스트별 문자 인코딩 (본문은 디코딩해서 str로 돌려준다)
+        self.charsets = charsets or get_charset_cache()
         
         # 소스별 헤더 정의
         self.source_headers = {
@@ -55,68 +116,73 @@ class Fetcher:
         headers['User-Agent'] = random.choice(self.USER_AGENTS)
         return headers
 
-    def fetch_page_content(self, session, url, source=None, retries=3, backoff_factor=2, max_backoff=100, initial_timeout=30, max_total_timeout=200):
+    def fetch_page_content(self, url, source=None, retries=3, backoff_factor=2, max_backoff=100, initial_timeout=30, max_total_timeout=200, conditional=False, use_cache=False, retry_owner=None, retry_context=None):
+        """
+        동기 래퍼: 엔진 루프에서 afetch_page_content를 실행하고 결과를 기다린다.
+        연결은 엔진의 공유 커넥션 풀이 관리하므로 호출부에서 세션을 만들 필요가 없다.
+        """
+        return self.engine.run(self.afetch_page_content(
+            url, source=source, retries=retries, backoff_factor=backoff_factor, max_backoff=max_backoff,
+            initial_timeout=initial_timeout, max_total_timeout=max_total_timeout, conditional=conditional,
+            use_cache=use_cache, retry_owner=retry_owner, retry_context=retry_context,
+        ))
+
+    def fetch_with_form_data(self, url, source, page_param=None, no=None, retries=10, backoff_factor=2, max_backoff=100, initial_timeout=30, max_total_timeout=200, use_cache=False, retry_owner=None, retry_context=None):
+        """동기 래퍼: afetch_with_form_data 참고"""
+        return self.engine.run(self.afetch_with_form_data(
+            url, source, page_param=page_param, no=no, retries=retries, backoff_factor=backoff_factor,
+            max_backoff=max_backoff, initial_timeout=initial_timeout, max_total_timeout=max_total_timeout,
+            use_cache=use_cache, retry_owner=retry_owner, retry_context=retry_context,
+        ))
+
+    def fetch(self, spec):
+        """FetchSpec 하나를 동기로 요청"""
+        return self.engine.run(self._afetch_spec(spec))
+
+    def fetch_many(self, specs):
+        """
+        여러 FetchSpec을 한꺼번에 엔진에 올리고, 끝나는 순서대로 (spec, 결과)를 yield 한다.
+        호스트별 동시성/속도 제한, 재시도, 캐시, 서킷 브레이커는 개별 요청과 똑같이 적용된다.
+        """
+        futures = {self.engine.submit(self._afetch_spec(spec)): spec for spec in specs}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+    async def _afetch_spec(self, spec):
+        if spec.method == "POST":
+            return await self.afetch_with_form_data(
+                spec.url, spec.source, page_param=spec.page_param, no=spec.no, use_cache=spec.use_cache,
+                retry_owner=spec.retry_owner, retry_context=spec.retry_context,
+            )
+        return await self.afetch_page_content(
+            spec.url, source=spec.source, conditional=spec.conditional, use_cache=spec.use_cache,
+            retry_owner=spec.retry_owner, retry_context=spec.retry_context,
+        )
+
+    async def afetch_page_content(self, url, source=None, retries=3, backoff_factor=2, max_backoff=100, initial_timeout=30, max_total_timeout=200, conditional=False, use_cache=False, retry_owner=None, retry_context=None):
+        """
+        GET 요청으로 HTML 본문을 가져온다 (호스트별 인코딩으로 디코딩한 str). 실패 시 None.
+        conditional=True면 저장된 검증자로 조건부 요청을 보내고, 304면 NOT_MODIFIED를 반환한다.
+        200이면 새 검증자를 임시 보관하므로, 받아온 페이지를 다 처리한 뒤 self.validators.commit(url)을 호출해야 다음 요청부터 적용됨
+        (conditional=False 요청은 검증자를 보관하지 않는다)
+        use_cache=True면 디스크 캐시를 먼저 확인한다 (게시 후 바뀌지 않는 상세 페이지용).
+        retry_owner가 주어지면 첫 시도 실패 시 백오프를 기다리지 않고 재시도 큐에 넘긴 뒤 RETRY_PENDING을 반환한다.
+        (재시도 결과는 self.retry_queue.wait_result(retry_owner, retry_context, timeout)로 기다려 받는다)
+        """
         headers = self.get_headers(source) if source else {'User-Agent': random.choice(self.USER_AGENTS)}
-        attempt = 0
-        backoff = backoff_factor  # 초기 대기 시간 (초)
-        timeout = initial_timeout  # 타임아웃 시간
-        total_time_spent = 0  # 총 소요 시간
+        if conditional:
+            headers.update(self.validators.request_headers(url))
+        return await self._fetch(
+            "GET", url, headers, allow_redirects=True, retries=retries, backoff_factor=backoff_factor,
+            max_backoff=max_backoff, initial_timeout=initial_timeout, max_total_timeout=max_total_timeout,
+            cache_ttl=self._cache_ttl(source) if use_cache else None, max_bytes=self._max_body_bytes(source),
+            retry_owner=retry_owner, retry_context=retry_context, conditional=conditional,
+        )
 
-        while attempt < retries and total_time_spent < max_total_timeout:
-            try:
-                start_time = time.time()
-                response = session.get(url, headers=headers, verify=False, allow_redirects=True, timeout=timeout)
-
-                elapsed_time = time.time() - start_time
-                total_time_spent += elapsed_time
-                if response.status_code == 200:
-                    content_type = response.headers.get('Content-Type', '').lower()
-                    if 'text/html' in content_type:
-                        time.sleep(random.uniform(0.1, 0.5))  # 짧은 지연 시간 추가
-                        return response.content
-                    else:
-                        self.logger.warning(f"비HTML 컨텐츠 ({content_type}) for URL: {url}. 스킵합니다.")
-                        return None
-                elif 500 <= response.status_code < 600:
-                    # 서버 오류 시 재시도
-                    attempt += 1
-                    self.logger.warning(f"서버 오류 {response.status_code} for URL: {url}. 재시도 중... (Attempt {attempt}/{retries})")
-                    if attempt >= retries:
-                        break
-                    time.sleep(backoff)
-                    backoff = min(backoff * 2, max_backoff)  # 지수 백오프 적용
-                else:
-                    # 클라이언트 오류: 로깅 후 재시도하지 않음
-                    self.logger.error(f"클라이언트 오류 {response.status_code} for URL: {url}. 재시도하지 않음.")
-                    break
-            except requests.exceptions.Timeout as e:
-                # 타임아웃 예외 처리
-                attempt += 1
-                elapsed_time = time.time() - start_time
-                total_time_spent += elapsed_time
-                self.logger.warning(f"타임아웃 발생 (Attempt {attempt}/{retries}): {url} - {e}")
-                if attempt >= retries or total_time_spent >= max_total_timeout:
-                    break
-                time.sleep(backoff)
-                backoff = min(backoff * 2, max_backoff)
-            except requests.exceptions.RequestException as e:
-                # 기타 예외 처리
-                attempt += 1
-                elapsed_time = time.time() - start_time
-                total_time_spent += elapsed_time
-                self.logger.warning(f"URL 요청 실패 (Attempt {attempt}/{retries}): {url} - {e}")
-                if attempt >= retries or total_time_spent >= max_total_timeout:
-                    break
-                time.sleep(backoff)
-                backoff = min(backoff * 2, max_backoff)
-        self.logger.error(f"{retries}번의 시도 또는 최대 대기 시간 {max_total_timeout}초 후에도 가져오지 못함: {url}")
-        return None
-        
-    def fetch_with_form_data(self, session, url, source, page_param=None, no=None, retries=10, backoff_factor=2, max_backoff=100, initial_timeout=30, max_total_timeout=200):
+    async def afetch_with_form_data(self, url, source, page_param=None, no=None, retries=10, backoff_factor=2, max_backoff=100, initial_timeout=30, max_total_timeout=200, use_cache=False, retry_owner=None, retry_context=None):
         """
         POLITICAL_SCIENCE 소스에 대한 form-data 요청 처리 메서드.
         """
-
         form_data = {
             "catalogid": "politics",
             "language": "ko",
@@ -124,60 +190,172 @@ class Fetcher:
             "boardcode": "com01",
             "page": page_param,
         }
+        # aiohttp는 None 값을 form에 넣지 못하므로 requests와 동일하게 빠진 값은 제외
+        form_data = {k: v for k, v in form_data.items() if v is not None}
+
+        headers = self.get_headers(source) if source else {'User-Agent': random.choice(self.USER_AGENTS)}
+        return await self._fetch(
+            "POST", url, headers, data=form_data, allow_redirects=False, retries=retries, backoff_factor=backoff_factor,
+            max_backoff=max_backoff, initial_timeout=initial_timeout, max_total_timeout=max_total_timeout,
+            cache_ttl=self._cache_ttl(source) if use_cache else None, max_bytes=self._max_body_bytes(source),
+            retry_owner=retry_owner, retry_context=retry_context,
+        )
+
+    def _cache_ttl(self, source):
+        """사이트별 캐시 유효 기간 (SITES[source]["cache_ttl"], 없으면 기본값)"""
+        return SITES.get(source, {}).get("cache_ttl", DEFAULT_CACHE_TTL)
 
+    def _max_body_bytes(self, source):
+        """사이트별 응답 본문 최대 크기 (SITES[source]["max_body_bytes"], 없으면 기본값)"""
+        return SITES.get(source, {}).get("max_body_bytes", DEFAULT_MAX_BODY_BYTES)
+
+    async def _fetch(self, method, url, headers, data=None, allow_redirects=True, retries=3, backoff_factor=2, max_backoff=100, initial_timeout=30, max_total_timeout=200, cache_ttl=None, max_bytes=DEFAULT_MAX_BODY_BYTES, retry_owner=None, retry_context=None, conditional=False):
+        """
+        재시도/지수 백오프를 포함한 공통 요청 루프 (엔진 루프에서 실행)
+        cache_ttl이 주어지면 디스크 캐시를 먼저 확인하고, 받아온 HTML은 캐시에 저장한다.
+        호스트의 서킷 브레이커가 열려 있으면 재시도 없이 바로 None을 반환한다.
+        """
+        cache_key = None
+        if cache_ttl is not None:
+            cache_key = ResponseCache.make_key(method, url, data)
+            cached = await asyncio.to_thread(self.response_cache.get, cache_key, cache_ttl)
+            if cached is not None:
+                METRICS.incr("cache.hit")
+                # 캐시에는 받은 그대로(bytes) 저장되어 있으므로 호스트 인코딩으로 디코딩
+                # (큰 본문 디코딩/인코딩 감지가 엔진 루프를 막지 않도록 스레드에서)
+                return await asyncio.to_thread(self.charsets.decode, urlparse(url).hostname or "", cached)
+            METRICS.incr("cache.miss")
+
+        request = {
+            "method": method,
+            "url": url,
+            "host": urlparse(url).hostname or "",
+            "headers": headers,
+            "data": data,
+            "allow_redirects": allow_redirects,
+            "timeout": initial_timeout,  # 타임아웃 시간
+            "cache_key": cache_key,
+            "max_bytes": max_bytes,
+            "conditional": conditional,  # 200이면 검증자를 임시 보관 (commit 대상)
+        }
         attempt = 0
         backoff = backoff_factor  # 초기 대기 시간 (초)
-        timeout = initial_timeout  # 타임아웃 시간
         total_time_spent = 0  # 총 소요 시간
 
-        headers = self.get_headers(source) if source else {'User-Agent': random.choice(self.USER_AGENTS)}
-        
         while attempt < retries and total_time_spent < max_total_timeout:
-            try:
-                start_time = time.time()
-                response = session.post(url, headers=headers, data=form_data, verify=False, allow_redirects=False, timeout=timeout)
-                elapsed_time = time.time() - start_time
-                total_time_spent += elapsed_time
-
-                if response.status_code == 200:
-                    content_type = response.headers.get('Content-Type', '').lower()
-                    if 'text/html' in content_type:
-                        time.sleep(random.uniform(0.1, 0.5))  # 짧은 지연 시간 추가
-                        return response.content
-                    else:
-                        self.logger.warning(f"비HTML 컨텐츠 ({content_type}) for URL: {url}. 스킵합니다.")
-                        return None
-                elif 500 <= response.status_code < 600:
-                    # 서버 오류 시 재시도
-                    attempt += 1
-                    self.logger.warning(f"서버 오류 {response.status_code} for URL: {url}. 재시도 중... (Attempt {attempt}/{retries})")
-                    if attempt >= retries:
-                        break
-                    time.sleep(backoff)
-                    backoff = min(backoff * 2, max_backoff)  # 지수 백오프 적용
-                else:
-                    # 클라이언트 오류: 로깅 후 재시도하지 않음
-                    self.logger.error(f"클라이언트 오류 {response.status_code} for URL: {url}. 재시도하지 않음.")
-                    break
-            except requests.exceptions.Timeout as e:
-                # 타임아웃 예외 처리
-                attempt += 1
-                elapsed_time = time.time() - start_time
-                total_time_spent += elapsed_time
-                self.logger.warning(f"타임아웃 발생 (Attempt {attempt}/{retries}): {url} - {e}")
-                if attempt >= retries or total_time_spent >= max_total_timeout:
-                    break
-                time.sleep(backoff)
-                backoff = min(backoff * 2, max_backoff)
-            except requests.exceptions.RequestException as e:
-                # 기타 예외 처리
-                attempt += 1
-                elapsed_time = time.time() - start_time
-                total_time_spent += elapsed_time
-                self.logger.warning(f"URL 요청 실패 (Attempt {attempt}/{retries}): {url} - {e}")
-                if attempt >= retries or total_time_spent >= max_total_timeout:
-                    break
-                time.sleep(backoff)
-                backoff = min(backoff * 2, max_backoff)
+            start_time = time.time()
+            attempt += 1
+            content, retryable = await self._guarded_attempt(request, attempt, retries)
+            total_time_spent += time.time() - start_time
+
+            if not retryable:
+                return content
+            if attempt >= retries or total_time_spent >= max_total_timeout:
+                break
+            if self.engine.breakers.is_open(request["host"]):
+                # 이번 실패로 호스트가 차단됨: 남은 재시도 생략
+                return None
+
+            if retry_owner is not None:
+                # 남은 재시도는 큐에서 진행: 호출한 워커는 백오프를 기다리지 않고 다음 작업으로 넘어간다
+                self._schedule_retry(request, retry_owner, retry_context, attempt, retries, backoff, max_backoff, total_time_spent, max_total_timeout)
+                return RETRY_PENDING
+
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, max_backoff)  # 지수 백오프 적용
         self.logger.error(f"{retries}번의 시도 또는 최대 대기 시간 {max_total_timeout}초 후에도 가져오지 못함: {url}")
-        return None
\ No newline at end of file
+        return None
+
+    def _schedule_retry(self, request, owner, context, attempt, retries, backoff, max_backoff, total_time_spent, max_total_timeout):
+        """backoff초 뒤에 한 번 더 시도하도록 재시도 큐에 등록 (실패하면 다시 등록)"""
+        async def run():
+            start_time = time.time()
+            next_attempt = attempt + 1
+            content, retryable = await self._guarded_attempt(request, next_attempt, retries)
+            spent = total_time_spent + time.time() - start_time
+
+            if not retryable:
+                return content
+            if next_attempt >= retries or spent >= max_total_timeout:
+                self.logger.error(f"{retries}번의 시도 또는 최대 대기 시간 {max_total_timeout}초 후에도 가져오지 못함: {request['url']}")
+                return None
+            if self.engine.breakers.is_open(request["host"]):
+                return None
+            self._schedule_retry(request, owner, context, next_attempt, retries, min(backoff * 2, max_backoff), max_backoff, spent, max_total_timeout)
+            return None
+
+        self.retry_queue.schedule(owner, context, run, backoff)
+
+    async def _guarded_attempt(self, request, attempt, retries):
+        """서킷 브레이커를 거치는 _attempt. 차단된 호스트면 요청 없이 (None, False)"""
+        host = request["host"]
+        breakers = self.engine.breakers
+        if not breakers.allow(host):
+            METRICS.incr("breaker.short_circuited")
+            self.logger.debug(f"[breaker] {host} 차단 중. 요청 생략: {request['url']}")
+            return None, False
+
+        content, retryable = await self._attempt(request, attempt, retries)
+        if retryable:
+            if breakers.record_failure(host):
+                METRICS.incr("breaker.tripped")
+                self.logger.warning(f"[breaker] {host} 연속 실패로 차단(OPEN). 다음 사이클에 시험 요청 후 재개합니다.")
+        elif breakers.record_success(host):
+            METRICS.incr("breaker.recovered")
+            self.logger.info(f"[breaker] {host} 시험 요청 성공. 차단 해제(CLOSED).")
+        return content, retryable
+
+    async def _attempt(self, request, attempt, retries):
+        """
+        요청 한 번. (결과, 재시도 필요 여부)를 반환한다.
+        결과: HTML 본문(str) / NOT_MODIFIED / None
+        """
+        url = request["url"]
+        headers = request["headers"]
+        try:
+            response = await self.engine.request(
+                request["method"], url, headers=headers, data=request["data"],
+                timeout=request["timeout"], allow_redirects=request["allow_redirects"],
+                # 헤더만 보고 HTML이 아니면 본문을 받지 않고, 너무 큰 본문은 읽다가 중단
+                accept_types=("text/html",), max_bytes=request["max_bytes"],
+            )
+
+            if response.status_code == 200:
+                content_type = response.headers.get('Content-Type', '').lower()
+                if 'text/html' in content_type:
+                    # 요청 간격 조절은 엔진의 호스트별 토큰 버킷이 담당
+                    # 조건부 요청만: 상세 페이지 등 commit하지 않는 200까지 보관하면 임시 검증자가 끝없이 쌓인다
+                    if request["conditional"]:
+                        self.validators.stage(url, response.headers, len(response.content))
+                    if request["cache_key"] is not None:
+                        await asyncio.to_thread(self.response_cache.put, request["cache_key"], response.content)
+                    content = await asyncio.to_thread(self.charsets.decode, request["host"], response.content, content_type)
+                    return content, False
+                else:
+                    self.logger.warning(f"비HTML 컨텐츠 ({content_type}) for URL: {url}. 스킵합니다.")
+                    return None, False
+            elif response.status_code == 304 and ('If-None-Match' in headers or 'If-Modified-Since' in headers):
+                # 조건부 요청 결과 변경 없음: 본문 다운로드와 파싱 모두 생략
+                METRICS.incr("conditional.not_modified")
+                METRICS.incr("conditional.bytes_saved", self.validators.size_of(url))
+                return NOT_MODIFIED, False
+            elif 500 <= response.status_code < 600:
+                # 서버 오류 시 재시도
+                self.logger.warning(f"서버 오류 {response.status_code} for URL: {url}. 재시도 중... (Attempt {attempt}/{retries})")
+                return None, True
+            else:
+                # 클라이언트 오류: 로깅 후 재시도하지 않음
+                self.logger.error(f"클라이언트 오류 {response.status_code} for URL: {url}. 재시도하지 않음.")
+                return None, False
+        except BodyTooLarge as e:
+            # 크기 초과: 다시 받아도 같으므로 재시도하지 않음
+            self.logger.warning(f"응답 크기 초과로 중단 ({e}) for URL: {url}. 스킵합니다.")
+            return None, False
+        except asyncio.TimeoutError as e:
+            # 타임아웃 예외 처리
+            self.logger.warning(f"타임아웃 발생 (Attempt {attempt}/{retries}): {url} - {e}")
+            return None, True
+        except aiohttp.ClientError as e:
+            # 기타 예외 처리
+            self.logger.warning(f"URL 요청 실패 (Attempt {attempt}/{retries}): {url} - {e}")
+            return None, True
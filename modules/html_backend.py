@@ -0,0 +1,159 @@
+# html_backend.py
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from config.site_config import SITES
+from config.parse_config import DEFAULT_LIST_PARSER, DEFAULT_DETAIL_PARSER
+from .metrics import METRICS
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax는 선택 의존성
+    LexborHTMLParser = None
+
+BS4_BACKENDS = ("html.parser", "lxml", "html5lib")
+
+# parse_only(SoupStrainer)를 지원하는 백엔드 (html5lib은 무시하고 전체를 파싱함)
+STRAINER_BACKENDS = ("html.parser", "lxml")
+
+
+def parser_for(source, kind):
+    """사이트별 파서 백엔드 이름 (kind: "list" / "detail")"""
+    site = SITES.get(source, {})
+    if kind == "list":
+        return site.get("list_parser", DEFAULT_LIST_PARSER)
+    return site.get("detail_parser", DEFAULT_DETAIL_PARSER)
+
+
+def list_region_for(source):
+    """
+    목록 페이지에서 실제로 읽는 영역 (SITES[source]["list_region"], 없으면 None)
+    예) {"name": "table", "class": "board-list"} → <table class="board-list"> 이하만 트리로 만든다.
+    """
+    return SITES.get(source, {}).get("list_region")
+
+
+def _strainer(region):
+    attrs = {k: v for k, v in region.items() if k != "name"}
+    return SoupStrainer(region.get("name"), attrs=attrs)
+
+
+def make_soup(content, backend="html.parser", region=None):
+    """
+    HTML을 파싱해 BeautifulSoup 호환 트리를 반환.
+    - html.parser / lxml / html5lib: BeautifulSoup 그대로
+    - selectolax: LexborNode 어댑터 (목록 파싱에서 쓰는 select / get / get_text 정도만 지원).
+      설치되어 있지 않으면 lxml로 대체한다.
+    - region: list_region_for() 형식. 주어지면 그 영역만 트리로 만든다 (html.parser / lxml).
+      영역을 찾지 못하면(사이트 개편 등) 전체 페이지를 다시 파싱한다.
+    """
+    if backend == "selectolax":
+        if LexborHTMLParser is not None:
+            return LexborNode(LexborHTMLParser(content).root)
+        backend = "lxml"
+    if backend not in BS4_BACKENDS:
+        raise ValueError(f"알 수 없는 파서 백엔드: {backend}")
+
+    if region and backend in STRAINER_BACKENDS:
+        soup = BeautifulSoup(content, backend, parse_only=_strainer(region))
+        if soup.contents:
+            return soup
+        METRICS.incr("parse.region_miss")
+    return BeautifulSoup(content, backend)
+
+
+class LexborNode:
+    """
+    selectolax(lexbor) 노드를 BeautifulSoup Tag처럼 쓰기 위한 얇은 어댑터.
+    _parse_list_page_* 핸들러와 get_next_notice_url이 쓰는 API만 구현한다.
+    """
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node):
+        self._node = node
+
+    def __bool__(self):
+        return True
+
+    def __repr__(self):
+        return f"LexborNode({self._node.html[:80]!r})"
+
+    # ----- 탐색 -----
+    # selector는 문자열 또는 soupsieve로 컴파일된 패턴(SitePlan)
+    def select(self, selector):
+        return [LexborNode(n) for n in self._node.css(getattr(selector, "pattern", selector))]
+
+    def select_one(self, selector):
+        node = self._node.css_first(getattr(selector, "pattern", selector))
+        return LexborNode(node) if node is not None else None
+
+    def find_all(self, name=None, attrs=None, class_=None, **kwargs):
+        return self.select(self._to_css(name, attrs, class_, kwargs))
+
+    def find(self, name=None, attrs=None, class_=None, **kwargs):
+        return self.select_one(self._to_css(name, attrs, class_, kwargs))
+
+    @staticmethod
+    def _to_css(name, attrs, class_, kwargs):
+        # BeautifulSoup의 find(name, attrs, class_=, 속성=) 검색 → CSS 선택자
+        # (class_에 공백이 있으면 BeautifulSoup처럼 class 속성 문자열 전체가 같은지 비교)
+        conditions = dict(attrs or {})
+        conditions.update(kwargs)
+        if class_ is not None:
+            conditions["class"] = class_
+        css = name or "*"
+        for key, value in conditions.items():
+            if key == "class" and " " not in value:
+                css += f".{value}"
+            elif value is True:
+                css += f"[{key}]"
+            else:
+                css += f'[{key}="{value}"]'
+        return css
+
+    # ----- 속성 / 텍스트 -----
+    @property
+    def name(self):
+        return self._node.tag
+
+    @property
+    def attrs(self):
+        attrs = dict(self._node.attributes)
+        if "class" in attrs:
+            attrs["class"] = (attrs["class"] or "").split()
+        return attrs
+
+    def get(self, key, default=None):
+        if key not in self._node.attributes:
+            return default
+        value = self._node.attributes[key]
+        if key == "class":
+            # BeautifulSoup은 class를 리스트로 돌려줌
+            return (value or "").split()
+        return value if value is not None else ""
+
+    def has_attr(self, key):
+        return key in self._node.attributes
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def get_text(self, separator="", strip=False):
+        if not strip:
+            return self._node.text(deep=True, separator=separator)
+        # BeautifulSoup과 같이 각 텍스트 조각을 strip하고 빈 조각은 버린 뒤 이어 붙임
+        parts = (t.strip() for t in self._node.text(deep=True, separator="\x00").split("\x00"))
+        return separator.join(p for p in parts if p)
+
+    @property
+    def text(self):
+        return self.get_text()
+
+    # ----- 수정 -----
+    def extract(self):
+        self._node.decompose()
+        return self
@@ -0,0 +1,100 @@
+# latency_tracker.py
+
+import os
+import json
+import threading
+
+from config.fetch_config import (
+    LATENCY_BUCKETS, LATENCY_WINDOW, LATENCY_MIN_SAMPLES, LATENCY_PERCENTILE, LATENCY_TIMEOUT_MULTIPLIER,
+    CONNECT_TIMEOUT_BOUNDS, READ_TIMEOUT_BOUNDS,
+)
+
+
+class LatencyTracker:
+    """
+    호스트별 응답 지연 히스토그램과 그로부터 계산한 타임아웃.
+    - connect: TCP(+TLS) 연결 수립 시간
+    - read: 요청 전송 후 응답 헤더가 도착하기까지의 시간
+    버킷 경계(초)는 LATENCY_BUCKETS, 마지막 칸은 그보다 큰 값.
+    표본 수가 LATENCY_WINDOW를 넘으면 전체를 절반으로 줄여 최근 값의 비중을 유지한다(rolling).
+    히스토그램은 파일에 저장되어 재시작 직후 첫 사이클부터 사용된다.
+    """
+
+    KINDS = ("connect", "read")
+
+    def __init__(self, path="./output/http_cache/latency.json"):
+        self.path = path
+        self._hosts = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                return
+            for host, hists in data.items():
+                # 버킷 경계가 바뀐 경우 해당 히스토그램은 버림
+                self._hosts[host] = {
+                    kind: counts for kind, counts in hists.items()
+                    if kind in self.KINDS and len(counts) == len(LATENCY_BUCKETS) + 1
+                }
+
+    def save(self):
+        with self._lock:
+            data = {host: {kind: list(counts) for kind, counts in hists.items()} for host, hists in self._hosts.items()}
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def record(self, host, kind, seconds):
+        index = len(LATENCY_BUCKETS)
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                index = i
+                break
+        with self._lock:
+            hists = self._hosts.setdefault(host, {})
+            counts = hists.get(kind)
+            if counts is None:
+                counts = [0] * (len(LATENCY_BUCKETS) + 1)
+                hists[kind] = counts
+            counts[index] += 1
+            if sum(counts) > LATENCY_WINDOW:
+                hists[kind] = [c / 2 for c in counts]
+
+    def percentile(self, host, kind, q=LATENCY_PERCENTILE):
+        """q(0~1) 백분위 지연(초, 해당 버킷의 상한). 표본이 부족하면 None"""
+        with self._lock:
+            counts = self._hosts.get(host, {}).get(kind)
+            if not counts:
+                return None
+            counts = list(counts)
+        total = sum(counts)
+        if total < LATENCY_MIN_SAMPLES:
+            return None
+        target = total * q
+        seen = 0
+        for i, c in enumerate(counts):
+            seen += c
+            if seen >= target:
+                return LATENCY_BUCKETS[i] if i < len(LATENCY_BUCKETS) else None
+        return None
+
+    def timeouts_for(self, host):
+        """(연결 타임아웃, 읽기 타임아웃) 초. 표본이 부족하면 각 상한값"""
+        return (
+            self._timeout(host, "connect", CONNECT_TIMEOUT_BOUNDS),
+            self._timeout(host, "read", READ_TIMEOUT_BOUNDS),
+        )
+
+    def _timeout(self, host, kind, bounds):
+        floor, ceiling = bounds
+        p = self.percentile(host, kind)
+        if p is None:
+            return ceiling
+        return min(max(p * LATENCY_TIMEOUT_MULTIPLIER, floor), ceiling)
@@ -0,0 +1,35 @@
+# metrics.py
+
+import threading
+
+
+class Metrics:
+    """스레드 안전한 단순 카운터 모음 (사이클 요약 로그용)"""
+
+    def __init__(self):
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def incr(self, name, value=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def get(self, name, default=0):
+        with self._lock:
+            return self._counters.get(name, default)
+
+    def snapshot(self, prefix=None, reset=False):
+        """
+        prefix로 시작하는 카운터만 복사해서 반환.
+        reset=True면 반환한 카운터를 0으로 되돌린다 (사이클 단위 집계).
+        """
+        with self._lock:
+            data = {k: v for k, v in self._counters.items() if prefix is None or k.startswith(prefix)}
+            if reset:
+                for k in data:
+                    del self._counters[k]
+            return data
+
+
+# 프로세스 전체에서 공유하는 카운터
+METRICS = Metrics()
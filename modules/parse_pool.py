@@ -0,0 +1,184 @@
+# parse_pool.py
+
+import os
+import time
+import logging
+import threading
+import multiprocessing
+from urllib.parse import urljoin
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from config.parse_config import PARSE_POOL_ENABLED, PARSE_POOL_WORKERS, PARSE_POOL_PENDING_PER_WORKER
+from .html_backend import make_soup
+from .site_plan import select_one
+from .announcement_parser import AnnouncementParser
+from .metrics import METRICS
+from .pipeline import stage_meter
+
+# 워커 프로세스 안에서 재사용하는 파서 (base_url별)
+_worker_parsers = {}
+
+
+def find_next_notice_url(soup, plan, source, base_url):
+    """
+    다음 공지 링크를 plan.next_page로 찾고, javascript:...이 아닌 실제 URL이면 반환.
+    """
+    link = select_one(soup, plan.next_page)
+    if not link:
+        return None
+
+    text = link.get_text(strip=True)
+    # "등록된 글이 없습니다" 같은 문구 필터
+    if "등록된 글이 없습니다" in text or "다음글이 없습니다." in text:
+        return None
+    href = link.get("href")
+    if not href or "javascript" in href.lower():
+        return None
+
+    if source == "RC_EDUCATION":
+        return urljoin(base_url + "/main/", href)
+
+    return urljoin(base_url, href)
+
+
+def parse_notice_html(parser, content, backend, url, source, plan, pre_fetched_sub_category=None, next_url_base=None):
+    """
+    상세 페이지 HTML(str) → parse_notice JSON. 워커 프로세스와 로컬 처리에서 같이 쓴다.
+    next_url_base(사이트 base_url)를 주면 같은 soup에서 다음 공지 링크도 찾아 (JSON, 다음 공지 URL)을 반환.
+    """
+    soup = make_soup(content, backend)
+    json_data = parser.parse_notice(
+        soup=soup,
+        base_domain=parser.extract_domain(url),
+        url=url,
+        source=source,
+        title_selector=None,
+        date_selector=None,
+        author_selector=None,
+        content_selector=None,
+        sub_category_selector=None,
+        pre_fetched_sub_category=pre_fetched_sub_category,
+        plan=plan,
+    )
+    if next_url_base is None:
+        return json_data
+    return json_data, find_next_notice_url(soup, plan, source, next_url_base)
+
+
+def _parse_in_worker(base_url, content, backend, url, source, plan, pre_fetched_sub_category, next_url_base):
+    parser = _worker_parsers.get(base_url)
+    if parser is None:
+        parser = AnnouncementParser(base_url, logging.getLogger("parse_pool"))
+        _worker_parsers[base_url] = parser
+    return parse_notice_html(parser, content, backend, url, source, plan, pre_fetched_sub_category, next_url_base)
+
+
+class ParsePool:
+    """
+    CPU를 쓰는 상세 페이지 파싱(make_soup + parse_notice: 본문/표/첨부파일 추출)을 별도 프로세스에서 실행.
+    크롤러 스레드는 요청을 넘기고 결과만 기다리므로 GIL에 막히지 않는다.
+    워커에는 HTML(str)과 사이트의 SitePlan(피클 가능)을 넘기고 JSON dict를 돌려받는다.
+    풀이 깨지면(워커 강제 종료 등) 경고 후 크롤러 스레드에서 직접 파싱한다.
+    대기 작업은 워커당 PARSE_POOL_PENDING_PER_WORKER개까지만 받고, 넘으면 submit()이 기다린다 (parse 단계 계측).
+    """
+
+    def __init__(self, workers=PARSE_POOL_WORKERS, enabled=PARSE_POOL_ENABLED, logger=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.logger = logger or logging.getLogger("AnnouncementCrawler")
+        self._executor = None
+        self.meter = stage_meter("parse")
+        self._slots = threading.BoundedSemaphore(self.workers * PARSE_POOL_PENDING_PER_WORKER)
+        if enabled:
+            # 엔진 루프 등 스레드가 떠 있는 프로세스를 fork하지 않도록 spawn 사용
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+
+    @property
+    def enabled(self):
+        return self._executor is not None
+
+    def submit(self, parser, content, backend, url, source, plan, pre_fetched_sub_category=None, next_url_base=None):
+        """
+        parse_notice_html을 워커에 넘기고 Future 반환 (풀이 없으면 여기서 파싱한 완료된 Future)
+        next_url_base를 주면 결과는 (JSON, 다음 공지 URL)
+        """
+        if self._executor is not None:
+            if not self._slots.acquire(blocking=False):
+                waited = time.time()
+                self._slots.acquire()
+                self.meter.blocked(time.time() - waited)
+            self.meter.enter()
+            submitted = time.time()
+            try:
+                future = self._executor.submit(
+                    _parse_in_worker, parser.base_domain, content, backend, url, source, plan, pre_fetched_sub_category, next_url_base,
+                )
+            except (BrokenProcessPool, RuntimeError) as e:
+                self._release(submitted)
+                self._disable(e)
+            else:
+                future.add_done_callback(lambda _: self._release(submitted))
+                METRICS.incr("parse.pool_jobs")
+                return _FallbackFuture(future, self, parser, content, backend, url, source, plan, pre_fetched_sub_category, next_url_base)
+
+        self.meter.enter()
+        started = time.time()
+        future = Future()
+        try:
+            future.set_result(parse_notice_html(parser, content, backend, url, source, plan, pre_fetched_sub_category, next_url_base))
+        except Exception as e:
+            future.set_exception(e)
+        self.meter.leave(time.time() - started)
+        return future
+
+    def _release(self, submitted):
+        self.meter.leave(time.time() - submitted)
+        self._slots.release()
+
+    def parse(self, parser, content, backend, url, source, plan, pre_fetched_sub_category=None, next_url_base=None):
+        return self.submit(parser, content, backend, url, source, plan, pre_fetched_sub_category, next_url_base).result()
+
+    def _disable(self, error):
+        if self._executor is None:
+            return
+        self.logger.warning(f"[parse_pool] 프로세스 풀 사용 불가 ({error}). 이후 상세 페이지는 크롤러 스레드에서 파싱합니다.")
+        METRICS.incr("parse.pool_fallback")
+        executor, self._executor = self._executor, None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+class _FallbackFuture:
+    """워커 결과를 기다리다 풀이 깨졌으면 로컬에서 다시 파싱하는 Future 래퍼"""
+
+    def __init__(self, future, pool, *args):
+        self._future = future
+        self._pool = pool
+        self._args = args
+
+    def done(self):
+        return self._future.done()
+
+    def result(self, timeout=None):
+        try:
+            return self._future.result(timeout)
+        except BrokenProcessPool as e:
+            self._pool._disable(e)
+            return parse_notice_html(*self._args)
+
+
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+
+
+def get_parse_pool():
+    """프로세스 전체에서 공유하는 파싱 풀 반환 (PARSE_POOL_ENABLED=False면 로컬 파싱만 하는 풀)"""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ParsePool()
+        return _parse_pool
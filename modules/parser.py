@@ -1,12 +1,29 @@
 # parser.py
 
 import re
-import chardet
-from bs4 import BeautifulSoup
+import itertools
+from bs4 import BeautifulSoup, NavigableString, CData, Tag
 from urllib.parse import urljoin, urlparse
 import trafilatura
 from boilerpy3 import extractors as boilerpy_extractors
 import logging
+from .charset_cache import get_charset_cache
+from .columnar_table import ColumnarTable
+
+# 텍스트 추출 시 앞뒤로 공백을 넣을 블록 태그 (인라인 태그는 단어 중간에 올 수 있으므로 이어 붙임)
+BLOCK_TAGS = frozenset([
+    "address", "article", "aside", "blockquote", "br", "caption", "dd", "div", "dl", "dt",
+    "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header",
+    "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table", "tbody", "td", "tfoot",
+    "th", "thead", "tr", "ul",
+])
+
+# sliding_window_search_optimized: 해시 인덱스를 만들기 전에 str.find로 바로 찾아볼 앞쪽 창 개수
+DIRECT_SEARCH_WINDOWS = 8
+
+# rawContent에서 base_domain을 붙이지 않는 href
+ABSOLUTE_OR_SCRIPT_HREF = re.compile(r"https?://|javascript:")
+
 
 class Parser:
     def __init__(self, base_domain, logger):
@@ -20,86 +37,138 @@ class Parser:
         text = re.sub(r'\n', ' ', text)
         return text
 
+    def extract_plain_text(self, element):
+        """
+        element 하위 텍스트를 한 번의 순회로 추출 (각 텍스트 노드는 한 번만 포함).
+        블록 태그 경계에는 공백을 넣고, 연속 공백은 하나로 줄인다.
+        script / style / 주석은 get_text()와 같이 제외한다.
+        """
+        parts = []
+        for node in element.descendants:
+            if isinstance(node, Tag):
+                if node.name in BLOCK_TAGS:
+                    parts.append(" ")
+            elif type(node) in (NavigableString, CData):
+                parts.append(node)
+        return " ".join("".join(parts).split())
+
+    def render_content_html(self, element, base_domain):
+        """
+        본문 element를 rawContent용 HTML 문자열로 직렬화.
+        한 번의 순회로 트리에서 직접 고친 뒤 str() 하고, 고친 값은 원래대로 되돌린다
+        (같은 soup에서 첨부파일 링크를 다시 읽기 때문).
+        - 텍스트/속성 값의 \\" -> '
+        - *src="/..."  -> base_domain + 값
+        - *href="..."  -> http(s)://, javascript: 로 시작하지 않으면 base_domain + 값
+        (예전 문자열 치환과 같이 data-src, data-href 등 이름이 src/href로 끝나는 속성도 포함)
+        """
+        if base_domain.endswith("/"):
+            base_domain = base_domain[:-1]
+        changed_attrs = []
+        changed_texts = []
+
+        for node in itertools.chain((element,), element.descendants):
+            if not isinstance(node, Tag):
+                # 순회 중에 트리 구조를 바꾸면 descendants가 꼬이므로 모아 두었다가 교체
+                if '\\"' in node:
+                    changed_texts.append((node, type(node)(node.replace('\\"', "'"))))
+                continue
+
+            for name, value in node.attrs.items():
+                if not isinstance(value, str) or not value:
+                    continue
+                new_value = value
+                # 값에 "가 있으면 직렬화가 작은따옴표로 바뀌어 예전 치환 대상이 아니었음
+                if '"' not in value:
+                    if name.endswith("src"):
+                        if value.startswith("/"):
+                            new_value = base_domain + value
+                    elif name.endswith("href"):
+                        if not ABSOLUTE_OR_SCRIPT_HREF.match(value):
+                            new_value = base_domain + value
+                else:
+                    new_value = value.replace('\\"', "'")
+                if new_value != value:
+                    changed_attrs.append((node, name, value))
+                    node.attrs[name] = new_value
+
+        for node, replacement in changed_texts:
+            node.replace_with(replacement)
+
+        try:
+            return str(element)
+        finally:
+            for node, name, value in changed_attrs:
+                node.attrs[name] = value
+            for node, replacement in reversed(changed_texts):
+                replacement.replace_with(node)
+
     def parse_table(self, table_element, base_url):
-        table_object = {"table": []}
-        cells_array = []
+        """표 하나를 {"table": [셀 dict, ...]} 형태로 (parse_table_columnar(...).to_json()과 같음)"""
+        return self.parse_table_columnar(table_element, base_url).to_json()
+
+    def parse_table_columnar(self, table_element, base_url):
+        """
+        표 하나를 ColumnarTable로 파싱.
+        rowspan/colspan으로 가려진 칸은 행 x 열 행렬 대신
+        열마다 '몇 번째 행 전까지 차 있는지'(busy_until)만 기억해서 건너뛴다.
+        (지금 행을 덮는 병합 셀은 모두 지금 행 이전에 시작하므로, 열마다 가장 늦게 끝나는 행만 알면 충분)
+        """
+        table = ColumnarTable()
         rows = table_element.select("tr")
+        # direct children을 찾기 위해 recursive=False 사용
+        row_cells = [row.find_all(['td', 'th'], recursive=False) for row in rows]
+        row_count = len(rows)
 
         # 1. 테이블의 최대 열 개수 계산
         max_col_count = 0
-        for row in rows:
+        for cols in row_cells:
             col_count = 0
-            # direct children을 찾기 위해 recursive=False 사용
-            cols = row.find_all(['td', 'th'], recursive=False)
             for col in cols:
-                colspan = int(col.get('colspan', 1))
-                col_count += colspan
+                col_count += int(col.get('colspan', 1))
             max_col_count = max(max_col_count, col_count)
 
-        # 2. cellMatrix 초기화 (최대 열 개수 사용)
-        cell_matrix = [[None for _ in range(max_col_count)] for _ in range(len(rows))]
-        current_row = 0
+        # 2. 열별로 병합 셀이 차지하고 있는 마지막 행(+1)
+        busy_until = [0] * max_col_count
 
-        for row in rows:
-            cols = row.find_all(['td', 'th'], recursive=False)
+        for current_row, cols in enumerate(row_cells):
             current_col = 0
             for col in cols:
                 # 이미 채워진 셀인지 확인하고 비어있는 위치를 찾음
-                while current_col < max_col_count and cell_matrix[current_row][current_col] is not None:
+                while current_col < max_col_count and busy_until[current_col] > current_row:
                     current_col += 1
                 if current_col >= max_col_count:
                     break  # 더 이상 열이 없으면 다음 행으로
 
-                cell_object = {}
-                cell_object["text"] = self.clean_text(col.get_text())
-
                 colspan = int(col.get('colspan', 1))
                 rowspan = int(col.get('rowspan', 1))
-
-                if colspan > 1:
-                    cell_object["colspan"] = colspan
-                if rowspan > 1:
-                    cell_object["rowspan"] = rowspan
+                index = table.add_cell(self.clean_text(col.get_text()), current_row, current_col, rowspan, colspan)
 
                 # 이미지 링크 추출
                 img_elements = col.select("img")
                 if img_elements:
-                    img_array = []
-                    for img in img_elements:
-                        img_src = img.get('src')
-                        if img_src:
-                            img_url = urljoin(base_url, img_src)
-                            img_array.append(img_url)
-                    cell_object["img_links"] = img_array
+                    table.img_links[index] = [
+                        table.intern(urljoin(base_url, img.get('src')))
+                        for img in img_elements if img.get('src')
+                    ]
 
                 # 링크 추출
                 link_elements = col.select("a")
                 if link_elements:
-                    link_array = []
-                    for link in link_elements:
-                        href = link.get('href')
-                        text = self.clean_text(link.get_text())
-                        if href:
-                            full_href = urljoin(base_url, href)
-                            link_array.append({"href": full_href, "text": text})
-                    cell_object["links"] = link_array
-
-                # 현재 셀의 위치 정보 추가
-                cell_object["row"] = current_row
-                cell_object["col"] = current_col
-
-                # cell_matrix에 셀을 추가 (rowspan과 colspan 처리)
-                for i in range(rowspan):
-                    for j in range(colspan):
-                        if current_row + i < len(rows) and current_col + j < max_col_count:
-                            cell_matrix[current_row + i][current_col + j] = cell_object
-
-                cells_array.append(cell_object)
+                    table.links[index] = [
+                        (table.intern(urljoin(base_url, link.get('href'))), table.intern(self.clean_text(link.get_text())))
+                        for link in link_elements if link.get('href')
+                    ]
+
+                # 병합 범위 표시 (표 밖으로 나가는 부분은 무시)
+                end_row = min(current_row + rowspan, row_count)
+                for j in range(colspan):
+                    if current_col + j < max_col_count and end_row > busy_until[current_col + j]:
+                        busy_until[current_col + j] = end_row
+
                 current_col += colspan
-            current_row += 1
 
-        table_object["table"] = cells_array
-        return table_object
+        return table
 
     def extract_image_links(self, soup, base_url):
         images = set()
@@ -124,10 +193,15 @@ class Parser:
         return files
 
     def extract_tables(self, soup, base_url):
+        """페이지의 모든 표를 [{"table": [셀 dict, ...]}, ...] 형태로 (JSON 저장용)"""
+        return [table.to_json() for table in self.extract_tables_columnar(soup, base_url)]
+
+    def extract_tables_columnar(self, soup, base_url):
+        """페이지의 모든 표를 ColumnarTable 목록으로 (메모리를 적게 쓰는 형태, JSON으로 직렬화되지 않음)"""
         tables = []
         for table in soup.find_all('table'):
             try:
-                parsed_table = self.parse_table(table, base_url)
+                parsed_table = self.parse_table_columnar(table, base_url)
                 tables.append(parsed_table)
             except Exception as e:
                 self.logger.error(f"테이블 파싱 오류 ({base_url}): {e}")
@@ -164,14 +238,11 @@ class Parser:
         return netloc == self.base_domain or netloc.endswith('.' + self.base_domain)
 
     def extract_and_merge_text(self, content, url):
-        try:
-            detected_encoding = chardet.detect(content)['encoding']
-            if not detected_encoding:
-                detected_encoding = 'utf-8'
-            text = content.decode(detected_encoding, errors='replace')
-        except Exception as e:
-            self.logger.error(f"컨텐츠 디코딩 오류 ({url}): {e}")
-            text = content.decode('utf-8', errors='replace')
+        """content: HTML 문자열 (Fetcher 결과). bytes면 호스트별 인코딩으로 디코딩한다."""
+        if isinstance(content, str):
+            text = content
+        else:
+            text = get_charset_cache().decode(urlparse(url).hostname or "", content)
 
         try:
             trafilatura_content = self.clean_text(trafilatura.extract(text))
@@ -179,16 +250,7 @@ class Parser:
             self.logger.error(f"Trafilatura 추출 오류 ({url}): {e}")
             trafilatura_content = ""
 
-        try:
-            # HTML 정제 과정 추가
-            soup = BeautifulSoup(text, 'html5lib')
-            cleaned_html = soup.prettify()
-
-            boilerpy_extractor = boilerpy_extractors.ArticleExtractor()
-            boilerpy_content = self.clean_text(boilerpy_extractor.get_content(cleaned_html))
-        except Exception as e:
-            self.logger.error(f"BoilerPy3 추출 오류 ({url}): {e}")
-            boilerpy_content = ""
+        boilerpy_content = self.extract_boilerpy_text(text, url)
 
         if boilerpy_content:
             merged_text = self.sliding_window_search_optimized(trafilatura_content, boilerpy_content)
@@ -197,43 +259,57 @@ class Parser:
 
         return merged_text
 
-    # KMP 알고리즘 관련 함수
-    def kmp_failure_function(self, pattern):
-        m = len(pattern)
-        pi = [0] * m
-        j = 0
-        for i in range(1, m):
-            while (j > 0 and pattern[i] != pattern[j]):
-                j = pi[j - 1]
-            if pattern[i] == pattern[j]:
-                j += 1
-                pi[i] = j
-        return pi
-
-    def kmp_search(self, text, pattern):
-        n, m = len(text), len(pattern)
-        pi = self.kmp_failure_function(pattern)
-        j = 0
-
-        for i in range(n):
-            while (j > 0 and text[i] != pattern[j]):
-                j = pi[j - 1]
-            if text[i] == pattern[j]:
-                if j == m - 1:
-                    return i - m + 1  # 첫 번째 매칭된 위치 반환
-                j += 1
-        return -1  # 패턴이 없으면 -1 반환
+    def extract_boilerpy_text(self, text, url):
+        """
+        BoilerPy3 본문 추출. 먼저 원본 HTML 그대로 시도하고,
+        파싱 오류가 나거나 결과가 비었을 때만 html5lib으로 정제(prettify)해서 다시 시도한다.
+        """
+        boilerpy_extractor = boilerpy_extractors.ArticleExtractor()
+        try:
+            boilerpy_content = self.clean_text(boilerpy_extractor.get_content(text))
+            if boilerpy_content.strip():
+                return boilerpy_content
+        except Exception:
+            pass
+
+        try:
+            # HTML 정제 과정 추가
+            soup = BeautifulSoup(text, 'html5lib')
+            cleaned_html = soup.prettify()
+            return self.clean_text(boilerpy_extractor.get_content(cleaned_html))
+        except Exception as e:
+            self.logger.error(f"BoilerPy3 추출 오류 ({url}): {e}")
+            return ""
 
     def sliding_window_search_optimized(self, trafilatura_text, boilerpy_text, window_size=5):
+        """
+        trafilatura 결과에서 boilerpy 결과에도 (단어 단위로) 있는 첫 window_size 단어 묶음을 찾아,
+        boilerpy 쪽에서 그 앞에 있던 텍스트를 끼워 넣는다.
+        보통은 본문 첫머리에서 바로 겹치므로 앞쪽 몇 개 창은 str.find로 찾고,
+        거기서 못 찾으면 boilerpy 쪽 단어 묶음 해시 인덱스로 나머지를 O(n + m)에 찾는다.
+        """
         trafilatura_words = trafilatura_text.split()
         boilerpy_words = boilerpy_text.split()
-        boilerpy_text_str = " ".join(boilerpy_words)
-
-        for i in range(len(trafilatura_words) - window_size + 1):
-            pattern = " ".join(trafilatura_words[i:i + window_size])
-            pattern_pos = self.kmp_search(boilerpy_text_str, pattern)
-            if pattern_pos != -1:
-                extra_text = boilerpy_text_str[:pattern_pos].strip()
-                trafilatura_words.insert(i, extra_text)
-                break
+        # 앞뒤 공백을 붙여 단어 경계에서만 일치하게
+        boilerpy_padded = " " + " ".join(boilerpy_words) + " "
+
+        first_positions = None
+        trafilatura_windows = zip(*(trafilatura_words[k:] for k in range(window_size)))
+        for i, window in enumerate(trafilatura_windows):
+            if i < DIRECT_SEARCH_WINDOWS:
+                pos = boilerpy_padded.find(" " + " ".join(window) + " ")
+                if pos == -1:
+                    continue
+                extra_text = boilerpy_padded[:pos].strip()
+            else:
+                if first_positions is None:
+                    # 단어 묶음 → boilerpy에서 처음 나온 단어 위치 (뒤에서부터 넣어 앞쪽 위치가 남게)
+                    boilerpy_windows = list(zip(*(boilerpy_words[k:] for k in range(window_size))))
+                    first_positions = dict(zip(reversed(boilerpy_windows), range(len(boilerpy_windows) - 1, -1, -1)))
+                j = first_positions.get(window)
+                if j is None:
+                    continue
+                extra_text = " ".join(boilerpy_words[:j])
+            trafilatura_words.insert(i, extra_text)
+            break
         return " ".join(trafilatura_words)
@@ -0,0 +1,182 @@
+# pipeline.py
+
+import time
+import atexit
+import logging
+import threading
+from collections import deque
+
+from config.fetch_config import INDEX_SINK_WORKERS, INDEX_SINK_QUEUE_SIZE
+
+
+class StageMeter:
+    """
+    파이프라인 단계(fetch / parse / sink) 하나의 계측.
+    - depth: 들어왔지만 아직 끝나지 않은 작업 수 (대기 + 처리 중), max_depth: 구간 중 최대값
+    - done / busy_seconds: 구간 동안 끝난 작업 수와 처리 시간 합
+    - blocked_seconds: 큐가 가득 차서 앞 단계가 기다린 시간 (backpressure)
+    snapshot(reset=True)는 구간 값만 0으로 되돌리고 depth는 유지한다.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._lock = threading.Lock()
+        self._depth = 0
+        self._reset_interval(time.time())
+
+    def _reset_interval(self, now):
+        self._started = now
+        self._max_depth = self._depth
+        self._done = 0
+        self._busy = 0.0
+        self._blocked = 0.0
+
+    def enter(self):
+        with self._lock:
+            self._depth += 1
+            self._max_depth = max(self._max_depth, self._depth)
+
+    def leave(self, busy_seconds):
+        with self._lock:
+            self._depth -= 1
+            self._done += 1
+            self._busy += busy_seconds
+
+    def blocked(self, seconds):
+        with self._lock:
+            self._blocked += seconds
+
+    def snapshot(self, reset=False):
+        now = time.time()
+        with self._lock:
+            data = {
+                "depth": self._depth,
+                "max_depth": self._max_depth,
+                "done": self._done,
+                "busy_seconds": self._busy,
+                "blocked_seconds": self._blocked,
+                "interval": now - self._started,
+            }
+            if reset:
+                self._reset_interval(now)
+            return data
+
+
+_meters = {}
+_meters_lock = threading.Lock()
+
+
+def stage_meter(name):
+    """이름별 StageMeter (없으면 만든다)"""
+    with _meters_lock:
+        meter = _meters.get(name)
+        if meter is None:
+            meter = StageMeter(name)
+            _meters[name] = meter
+        return meter
+
+
+class PipelineStage:
+    """
+    bounded 큐 + 워커 스레드로 된 파이프라인 단계.
+    - 작업은 key(사이트)별 FIFO에 쌓이고, 비어 있는 워커가 아무 key나 가져간다.
+      단 같은 key는 한 번에 한 워커만 처리 → key별 처리 순서 유지, 한 사이트가 몰려도 다른 사이트는 막히지 않음
+    - 전체 대기 작업이 maxsize에 닿으면 put()이 자리가 날 때까지 기다린다 (backpressure: 앞 단계가 그만큼 느려짐)
+    - handler 예외는 로그만 남기고 다음 작업으로 넘어간다
+    """
+
+    def __init__(self, name, handler, workers, maxsize, logger=None):
+        self.name = name
+        self.handler = handler
+        self.logger = logger or logging.getLogger("AnnouncementCrawler")
+        self.meter = stage_meter(name)
+        self._slots = threading.BoundedSemaphore(maxsize)
+        self._cond = threading.Condition()
+        self._items = {}        # key -> deque (처리 대기)
+        self._ready = deque()   # 대기 작업이 있고 처리 중이 아닌 key
+        self._active = set()    # 워커가 처리 중인 key
+        self._stopped = False
+        self._threads = []
+        for i in range(workers):
+            thread = threading.Thread(target=self._worker, name=f"{name}-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def put(self, key, item):
+        if not self._slots.acquire(blocking=False):
+            started = time.time()
+            self._slots.acquire()
+            self.meter.blocked(time.time() - started)
+        self.meter.enter()
+        with self._cond:
+            items = self._items.get(key)
+            if items is None:
+                items = self._items[key] = deque()
+            if not items and key not in self._active:
+                self._ready.append(key)
+            items.append(item)
+            self._cond.notify()
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while not self._ready and not self._stopped:
+                    self._cond.wait()
+                if not self._ready:
+                    return
+                key = self._ready.popleft()
+                item = self._items[key].popleft()
+                self._active.add(key)
+
+            started = time.time()
+            try:
+                self.handler(item)
+            except Exception as e:
+                self.logger.error(f"[{self.name}] 처리 중 오류: {e}")
+            self.meter.leave(time.time() - started)
+            self._slots.release()
+
+            with self._cond:
+                self._active.discard(key)
+                if self._items[key]:
+                    self._ready.append(key)
+                else:
+                    del self._items[key]
+                self._cond.notify_all()
+
+    def join(self):
+        """지금까지 넣은 작업이 모두 끝날 때까지 대기"""
+        with self._cond:
+            self._cond.wait_for(lambda: not self._items)
+
+    def close(self):
+        """남은 작업을 모두 처리한 뒤 워커 종료"""
+        self.join()
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join()
+
+
+def _index_document(item):
+    crawler, doc = item
+    crawler.index_to_issac(doc)
+
+
+_index_sink = None
+_index_sink_lock = threading.Lock()
+
+
+def get_index_sink():
+    """
+    원격 적재(ISSAC) 단계. put(source, (crawler, doc))로 넘기면 크롤러 스레드는 POST를 기다리지 않는다.
+    한 사이트의 문서는 한 번에 한 스레드만 보내므로 저장한 순서대로 전송된다.
+    프로세스 종료 시 남은 문서를 모두 보낸다.
+    """
+    global _index_sink
+    with _index_sink_lock:
+        if _index_sink is None:
+            _index_sink = PipelineStage("sink", _index_document, INDEX_SINK_WORKERS, INDEX_SINK_QUEUE_SIZE)
+            atexit.register(_index_sink.close)
+        return _index_sink
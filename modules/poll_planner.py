@@ -0,0 +1,259 @@
+# poll_planner.py
+
+import os
+import re
+import json
+import time
+import threading
+from datetime import datetime, timedelta
+
+from pytz import timezone
+
+from config.fetch_config import (
+    POLL_HISTORY_DAYS, POLL_HISTORY_MAX, POLL_MIN_OBSERVED_DAYS, POLL_TARGET_POSTS,
+    POLL_PRIOR_WEEKS, POLL_MIN_INTERVAL, POLL_MAX_INTERVAL,
+)
+from .metrics import METRICS
+
+KST = timezone('Asia/Seoul')
+
+HOURS_PER_WEEK = 7 * 24
+WEEK_SECONDS = 7 * 24 * 3600
+
+# 시간 없이 날짜만 있는 게시일은 그날 업무 시간(09~18시)에 고르게 나눠 넣는다
+WORK_HOURS = range(9, 18)
+
+_CREATED_DATE = re.compile(rb'"createdDate":\s*"([^"]*)"')
+_DATE = re.compile(r"(\d{4})\s*[.\-/]\s*(\d{1,2})\s*[.\-/]\s*(\d{1,2})(?:\D+(\d{1,2}):(\d{2}))?")
+
+
+def parse_created_date(text):
+    """createdDate 문자열 → (KST 타임스탬프, 시간까지 있는지). 모르는 형식이면 None"""
+    match = _DATE.search(text or "")
+    if not match:
+        return None
+    year, month, day, hour, minute = match.groups()
+    try:
+        created = datetime(int(year), int(month), int(day), int(hour or 0), int(minute or 0))
+    except ValueError:
+        return None
+    return KST.localize(created).timestamp(), hour is not None
+
+
+def _created_dates(lines, now):
+    """jsonl 줄들의 createdDate → [(KST 타임스탬프, 시간까지 있는지)] (없거나 모르는 형식, 미래 날짜는 건너뜀)"""
+    created = []
+    for line in lines:
+        match = _CREATED_DATE.search(line)
+        parsed = parse_created_date(match.group(1).decode("utf-8", "replace")) if match else None
+        if parsed and parsed[0] <= now:
+            created.append(parsed)
+    return created
+
+
+def _kst_date(timestamp):
+    return datetime.fromtimestamp(timestamp, KST).date()
+
+
+def hour_of_week(timestamp):
+    moment = datetime.fromtimestamp(timestamp, KST)
+    return moment.weekday() * 24 + moment.hour
+
+
+class PollPlanner:
+    """
+    사이트별 다음 확인 시각을 게시 이력으로 정한다.
+    - 이력: notices_*.jsonl 줄의 createdDate. 처음 보는 사이트는 기존 파일 전체로 채우고,
+      이후에는 실행 중 새로 추가된 줄만 읽는다.
+      (감지 시각을 쓰면 전체 역순 크롤링/첫 크롤링/재시도 몰림이 한 칸에 쌓이므로 쓰지 않는다)
+    - 요일-시간(168칸)별 시간당 게시 수를 추정하고 (이웃 칸으로 평활, 사이트 평균 쪽으로 당김),
+      지금부터 예상 게시 수를 더해 POLL_TARGET_POSTS에 닿는 시각을 다음 확인 시각으로 쓴다
+      (POLL_MIN_INTERVAL ~ POLL_MAX_INTERVAL로 제한).
+      → 하루에 여러 건 올라오는 게시판은 자주, 한 달에 한 건 올라오는 게시판은 드물게 확인한다.
+    - 이력이 POLL_MIN_OBSERVED_DAYS보다 짧은 사이트는 기존 시간표(fallback)를 쓴다.
+    - 이력과 jsonl 읽은 위치는 파일에 저장되어 재시작 후에도 이어진다.
+    """
+
+    def __init__(self, path="./output/crawler_state/poll_history.json"):
+        self.path = path
+        self._sites = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._sites = json.load(f)
+            except (OSError, ValueError):
+                self._sites = {}
+
+    def save(self):
+        with self._lock:
+            for site in self._sites.values():
+                self._prune(site, time.time())
+            data = json.loads(json.dumps(self._sites))
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def _site(self, source):
+        site = self._sites.get(source)
+        if site is None:
+            site = {"since": None, "offset": None, "arrivals": []}
+            self._sites[source] = site
+        return site
+
+    def _prune(self, site, now):
+        cutoff = now - POLL_HISTORY_DAYS * 86400
+        arrivals = [arrival for arrival in site["arrivals"] if arrival[0] >= cutoff]
+        site["arrivals"] = arrivals[-POLL_HISTORY_MAX:]
+
+    # --------------------------------------------------
+    # 이력 기록
+    # --------------------------------------------------
+    def record(self, source, timestamps, exact=True, now=None):
+        """게시 시각 기록. exact=False면 날짜만 맞는 시각 (업무 시간에 나눠 넣음)"""
+        now = time.time() if now is None else now
+        with self._lock:
+            site = self._site(source)
+            for timestamp in timestamps:
+                site["arrivals"].append([timestamp, 1 if exact else 0])
+                if site["since"] is None or timestamp < site["since"]:
+                    site["since"] = timestamp
+            if site["since"] is None:
+                site["since"] = now
+            site["arrivals"].sort()
+            self._prune(site, now)
+
+    def observe(self, source, jsonl_path, now=None):
+        """
+        사이트의 notices jsonl에서 지난번 이후 추가된 줄의 createdDate를 게시 시각으로 기록하고 기록한 개수를 반환.
+        이미 기록된 가장 최근 게시일보다 이전 날짜의 줄은 건너뛴다
+        (state 유실 후 전체 역순 크롤링 등으로 예전 글이 다시 추가된 경우 중복 기록 방지).
+        처음 보는 사이트는 파일 전체의 createdDate로 이력을 채운다 (이때는 0 반환).
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            site = self._site(source)
+            offset = site["offset"]
+        try:
+            size = os.path.getsize(jsonl_path)
+        except OSError:
+            size = 0
+
+        if offset is None:
+            created = []
+            if size:
+                with open(jsonl_path, "rb") as f:
+                    created = _created_dates(f, now)
+            self.record(source, [ts for ts, exact in created if exact], exact=True, now=now)
+            self.record(source, [ts for ts, exact in created if not exact], exact=False, now=now)
+            with self._lock:
+                site["offset"] = size
+            return 0
+
+        if size <= offset:
+            # 파일이 새로 만들어졌거나 줄었으면 위치만 맞춘다
+            with self._lock:
+                site["offset"] = size
+            return 0
+
+        with open(jsonl_path, "rb") as f:
+            f.seek(offset)
+            created = _created_dates(f.read(size - offset).splitlines(), now)
+        with self._lock:
+            newest = site["arrivals"][-1][0] if site["arrivals"] else None
+        if newest is not None:
+            newest_date = _kst_date(newest)
+            created = [(ts, exact) for ts, exact in created if _kst_date(ts) >= newest_date]
+        self.record(source, [ts for ts, exact in created if exact], exact=True, now=now)
+        self.record(source, [ts for ts, exact in created if not exact], exact=False, now=now)
+        with self._lock:
+            site["offset"] = size
+        METRICS.incr("poll.arrivals", len(created))
+        return len(created)
+
+    # --------------------------------------------------
+    # 게시율 / 다음 확인 시각
+    # --------------------------------------------------
+    def rates(self, source, now=None):
+        """요일-시간 칸별 시간당 예상 게시 수 (168개). 이력이 부족하면 None"""
+        now = time.time() if now is None else now
+        with self._lock:
+            site = self._sites.get(source)
+            if not site or site["since"] is None:
+                return None
+            since = site["since"]
+            arrivals = list(site["arrivals"])
+
+        window_start = max(since, now - POLL_HISTORY_DAYS * 86400)
+        observed = now - window_start
+        if observed < POLL_MIN_OBSERVED_DAYS * 86400:
+            return None
+        weeks = observed / WEEK_SECONDS
+
+        counts = [0.0] * HOURS_PER_WEEK
+        for timestamp, exact in arrivals:
+            if timestamp < window_start:
+                continue
+            if exact:
+                counts[hour_of_week(timestamp)] += 1
+            else:
+                day = datetime.fromtimestamp(timestamp, KST).weekday() * 24
+                for hour in WORK_HOURS:
+                    counts[day + hour] += 1 / len(WORK_HOURS)
+
+        # 이웃 칸으로 평활 (감지 시각은 실제 게시보다 조금 늦고, 게시 시각도 매주 정확히 같지 않음)
+        smoothed = [
+            0.25 * counts[h - 1] + 0.5 * counts[h] + 0.25 * counts[(h + 1) % HOURS_PER_WEEK]
+            for h in range(HOURS_PER_WEEK)
+        ]
+        mean = sum(counts) / HOURS_PER_WEEK
+        return [(smoothed[h] + POLL_PRIOR_WEEKS * mean) / (weeks + POLL_PRIOR_WEEKS) for h in range(HOURS_PER_WEEK)]
+
+    def next_due(self, source, fallback, now=None):
+        """다음 확인 시각(epoch 초). 이력이 부족하면 fallback() (기존 시간표)"""
+        now = time.time() if now is None else now
+        timetable_due = fallback()
+        rates = self.rates(source, now)
+        if rates is None:
+            METRICS.incr("poll.fallback")
+            return timetable_due
+
+        # 지금부터 칸별 게시율을 적분해 예상 게시 수가 목표에 닿는 시각
+        moment = now
+        expected = 0.0
+        limit = now + POLL_MAX_INTERVAL
+        while moment < limit:
+            current = datetime.fromtimestamp(moment, KST)
+            hour_end = (current.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)).timestamp()
+            rate = rates[current.weekday() * 24 + current.hour] / 3600
+            span = min(hour_end, limit) - moment
+            if rate > 0 and expected + rate * span >= POLL_TARGET_POSTS:
+                moment += (POLL_TARGET_POSTS - expected) / rate
+                break
+            expected += rate * span
+            moment += span
+
+        due = min(max(moment, now + POLL_MIN_INTERVAL), limit)
+        METRICS.incr("poll.planned")
+        METRICS.incr("poll.planned_seconds", due - now)
+        if timetable_due:
+            METRICS.incr("poll.timetable_seconds", max(timetable_due - now, 0))
+        return due
+
+
+_poll_planner = None
+_poll_planner_lock = threading.Lock()
+
+
+def get_poll_planner():
+    """프로세스 전체에서 공유하는 폴링 계획 반환"""
+    global _poll_planner
+    with _poll_planner_lock:
+        if _poll_planner is None:
+            _poll_planner = PollPlanner()
+        return _poll_planner
@@ -0,0 +1,86 @@
+# rate_limiter.py
+
+import asyncio
+import time
+
+from config.fetch_config import DEFAULT_HOST_RATE, DEFAULT_HOST_BURST, HOST_RATES, HOST_GROUP_RATES
+
+
+class TokenBucket:
+    """
+    예약(reservation) 방식 토큰 버킷.
+    reserve()는 토큰을 바로 차감하고, 토큰이 실제로 생길 때까지 기다려야 하는 시간을 돌려준다.
+    (토큰이 음수가 되는 것을 허용해 대기 순서대로 슬롯이 배정된다)
+    now에 미래 시각(실제로 보낼 시각)을 넘길 수 있다. 이미 더 늦은 시각까지 계산돼 있으면 그 이후로 배정한다.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def reserve(self, now=None):
+        now = time.monotonic() if now is None else now
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+        self.tokens -= 1
+        ready = self.updated + max(0.0, -self.tokens) / self.rate
+        return max(0.0, ready - now)
+
+
+class HostRateLimiter:
+    """
+    호스트별 + 호스트 그룹별 토큰 버킷.
+    - 호스트 버킷: 한 호스트로 가는 요청 간격을 맞춘다.
+    - 그룹 버킷: 같은 서버를 공유하는 하위 도메인들(예: *.yonsei.ac.kr)의 합계를 제한한다.
+    서로 다른 호스트/그룹은 버킷을 공유하지 않으므로 서로를 지연시키지 않는다.
+    엔진 이벤트 루프 안에서만 호출되므로 별도의 락은 두지 않는다.
+    """
+
+    def __init__(self, default_rate=DEFAULT_HOST_RATE, default_burst=DEFAULT_HOST_BURST, host_rates=None, group_rates=None):
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.host_rates = dict(HOST_RATES if host_rates is None else host_rates)
+        self.group_rates = dict(HOST_GROUP_RATES if group_rates is None else group_rates)
+        self._host_buckets = {}
+        self._group_buckets = {}
+
+    def group_of(self, host):
+        for group in self.group_rates:
+            if host == group or host.endswith("." + group):
+                return group
+        return None
+
+    def _host_bucket(self, host):
+        bucket = self._host_buckets.get(host)
+        if bucket is None:
+            rate, burst = self.host_rates.get(host, (self.default_rate, self.default_burst))
+            bucket = TokenBucket(rate, burst)
+            self._host_buckets[host] = bucket
+        return bucket
+
+    def _group_bucket(self, group):
+        bucket = self._group_buckets.get(group)
+        if bucket is None:
+            rate, burst = self.group_rates[group]
+            bucket = TokenBucket(rate, burst)
+            self._group_buckets[group] = bucket
+        return bucket
+
+    def reserve(self, host):
+        """
+        host로 보낼 요청 하나의 슬롯을 예약하고 대기 시간(초)을 반환.
+        그룹 대기가 있으면 호스트 슬롯은 그룹 슬롯 시각(now + 그룹 대기)에 예약한다.
+        (둘 다 now에 차감하면 그룹 대기 동안 호스트 버킷이 다시 차서, 대기가 끝난 뒤 같은 호스트 요청이 한꺼번에 나간다)
+        """
+        now = time.monotonic()
+        group = self.group_of(host)
+        group_wait = self._group_bucket(group).reserve(now) if group else 0.0
+        return group_wait + self._host_bucket(host).reserve(now + group_wait)
+
+    async def acquire(self, host):
+        wait = self.reserve(host)
+        if wait > 0:
+            await asyncio.sleep(wait)
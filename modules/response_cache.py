@@ -0,0 +1,166 @@
+# response_cache.py
+
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+
+from config.fetch_config import RESPONSE_CACHE_MAX_BYTES
+
+
+class ResponseCache:
+    """
+    output/http_cache 아래의 디스크 응답 캐시 (content-addressed).
+    - blobs/<해시 앞 2자리>/<sha256>: 응답 본문. 내용 해시로 저장하므로 같은 본문은 한 번만 저장된다.
+    - index.json: 요청 키 → {"digest", "size", "stored_at"}. 순서 = 최근 사용 순(LRU).
+    - get()은 TTL(사이트별)이 지난 항목을 미스로 처리하고,
+      put() 후 전체 크기가 max_bytes를 넘으면 가장 오래 쓰지 않은 항목부터 지운다.
+    """
+
+    def __init__(self, cache_dir="./output/http_cache", max_bytes=RESPONSE_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.blob_dir = os.path.join(cache_dir, "blobs")
+        self.index_file = os.path.join(cache_dir, "index.json")
+        self.max_bytes = max_bytes
+
+        self._index = OrderedDict()
+        self._refcount = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(self.blob_dir, exist_ok=True)
+        self._load_index()
+
+    # --------------------------------------------------
+    # 키 / 경로
+    # --------------------------------------------------
+    @staticmethod
+    def make_key(method, url, data=None):
+        """요청(메서드 + URL + form 데이터)을 식별하는 키"""
+        raw = f"{method} {url}"
+        if data:
+            raw += " " + "&".join(f"{k}={v}" for k, v in sorted(data.items()))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _blob_path(self, digest):
+        return os.path.join(self.blob_dir, digest[:2], digest)
+
+    # --------------------------------------------------
+    # 인덱스 로드 / 저장
+    # --------------------------------------------------
+    def _load_index(self):
+        if os.path.exists(self.index_file):
+            try:
+                with open(self.index_file, "r", encoding="utf-8") as f:
+                    for key, entry in json.load(f):
+                        self._index[key] = entry
+            except (OSError, ValueError):
+                self._index = OrderedDict()
+
+        for entry in self._index.values():
+            digest = entry["digest"]
+            if digest not in self._refcount:
+                self._total_bytes += entry["size"]
+            self._refcount[digest] = self._refcount.get(digest, 0) + 1
+
+        self._sweep_orphans()
+
+    def _sweep_orphans(self):
+        """인덱스 저장 전에 종료되어 남은, 어떤 키도 가리키지 않는 본문 파일 정리"""
+        for sub in os.listdir(self.blob_dir):
+            sub_dir = os.path.join(self.blob_dir, sub)
+            if not os.path.isdir(sub_dir):
+                continue
+            for digest in os.listdir(sub_dir):
+                if digest not in self._refcount:
+                    try:
+                        os.remove(os.path.join(sub_dir, digest))
+                    except OSError:
+                        pass
+
+    def save_index(self):
+        with self._lock:
+            data = list(self._index.items())
+        tmp_file = self.index_file + ".tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_file, self.index_file)
+
+    # --------------------------------------------------
+    # 조회 / 저장
+    # --------------------------------------------------
+    def get(self, key, ttl):
+        """캐시된 본문(bytes) 반환. 없거나 ttl(초)이 지났으면 None"""
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry["stored_at"] > ttl:
+                self._remove(key)
+                return None
+            self._index.move_to_end(key)
+            path = self._blob_path(entry["digest"])
+
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            with self._lock:
+                if key in self._index:
+                    self._remove(key)
+            return None
+
+    def put(self, key, content):
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._blob_path(digest)
+
+        # 본문 파일을 먼저 쓰고 인덱스에 등록 (get()이 등록된 항목의 파일을 못 찾는 일이 없도록)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+
+        with self._lock:
+            if key in self._index:
+                self._remove(key)
+            if digest not in self._refcount:
+                self._total_bytes += len(content)
+            self._refcount[digest] = self._refcount.get(digest, 0) + 1
+            self._index[key] = {"digest": digest, "size": len(content), "stored_at": time.time()}
+            self._evict()
+
+    def _remove(self, key):
+        # self._lock 안에서 호출
+        entry = self._index.pop(key)
+        digest = entry["digest"]
+        self._refcount[digest] -= 1
+        if self._refcount[digest] == 0:
+            del self._refcount[digest]
+            self._total_bytes -= entry["size"]
+            try:
+                os.remove(self._blob_path(digest))
+            except OSError:
+                pass
+
+    def _evict(self):
+        # self._lock 안에서 호출: 가장 오래 쓰지 않은 항목(OrderedDict 앞쪽)부터 제거
+        while self._total_bytes > self.max_bytes and self._index:
+            oldest_key = next(iter(self._index))
+            self._remove(oldest_key)
+
+
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache():
+    """프로세스 전체에서 공유하는 응답 캐시 반환"""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache()
+        return _response_cache
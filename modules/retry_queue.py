@@ -0,0 +1,128 @@
+# retry_queue.py
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+
+
+class RetryQueue:
+    """
+    지연 재시도 큐 (엔진 이벤트 루프에서 동작).
+    - 실패한 요청을 (재시도 시각, 소유 크롤러, 컨텍스트, 재시도 코루틴)으로 넣어두면
+      디스패처가 시각이 된 항목부터 실행한다. 워커 스레드는 백오프 동안 기다리지 않고 다음 일을 한다.
+    - 재시도가 성공하면 결과를 소유자(owner)별 완료 목록에 쌓아두고,
+      크롤러가 wait_result(owner, context, timeout)로 그 자리에서 기다리거나 pop_completed(owner)로 가져간다.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._seq = itertools.count()
+        self._wakeup = None
+        self._dispatcher = None
+
+        self._pending = {}      # owner -> {context: 진행 중인 재시도 수}
+        self._completed = {}
+        self._lock = threading.Lock()
+        self._done = threading.Condition(self._lock)
+
+    # --------------------------------------------------
+    # 엔진 루프 쪽
+    # --------------------------------------------------
+    def schedule(self, owner, context, run, delay):
+        """
+        delay초 뒤에 run()(코루틴 함수)을 실행하도록 등록. 엔진 루프 안에서만 호출한다.
+        run()이 truthy 값을 돌려주면 (context, 값)이 owner에게 전달된다.
+        """
+        due = time.monotonic() + delay
+        heapq.heappush(self._heap, (due, next(self._seq), owner, context, run))
+        with self._lock:
+            contexts = self._pending.setdefault(owner, {})
+            contexts[context] = contexts.get(context, 0) + 1
+
+        if self._dispatcher is None:
+            self._wakeup = asyncio.Event()
+            self._dispatcher = asyncio.get_running_loop().create_task(self._dispatch())
+        self._wakeup.set()
+
+    async def _dispatch(self):
+        while True:
+            if not self._heap:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            delay = self._heap[0][0] - time.monotonic()
+            if delay > 0:
+                # 다음 재시도 시각까지 대기 (더 이른 항목이 들어오면 깨어남)
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            _, _, owner, context, run = heapq.heappop(self._heap)
+            asyncio.get_running_loop().create_task(self._run(owner, context, run))
+
+    async def _run(self, owner, context, run):
+        try:
+            result = await run()
+        except Exception:
+            result = None
+        with self._lock:
+            contexts = self._pending[owner]
+            contexts[context] -= 1
+            if not contexts[context]:
+                del contexts[context]
+            if result:
+                self._completed.setdefault(owner, []).append((context, result))
+            self._done.notify_all()
+
+    # --------------------------------------------------
+    # 크롤러 쪽 (아무 스레드)
+    # --------------------------------------------------
+    def pop_completed(self, owner):
+        """owner의 재시도 성공 결과 [(context, content), ...]를 꺼내 반환"""
+        with self._lock:
+            return self._completed.pop(owner, [])
+
+    def wait_result(self, owner, context, timeout):
+        """
+        context의 재시도가 끝날 때까지 최대 timeout초 기다린다.
+        (True, content): 성공 / (True, None): 재시도까지 모두 실패 / (False, None): 아직 진행 중
+        """
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            while True:
+                completed = self._completed.get(owner, [])
+                for i, (done_context, content) in enumerate(completed):
+                    if done_context == context:
+                        del completed[i]
+                        return True, content
+                if not self._pending.get(owner, {}).get(context):
+                    return True, None
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False, None
+                self._done.wait(remaining)
+
+    def pending_count(self, owner=None):
+        with self._lock:
+            if owner is None:
+                return sum(sum(contexts.values()) for contexts in self._pending.values())
+            return sum(self._pending.get(owner, {}).values())
+
+
+_retry_queue = None
+_retry_queue_lock = threading.Lock()
+
+
+def get_retry_queue():
+    """프로세스 전체에서 공유하는 재시도 큐 반환"""
+    global _retry_queue
+    with _retry_queue_lock:
+        if _retry_queue is None:
+            _retry_queue = RetryQueue()
+        return _retry_queue
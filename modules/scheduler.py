@@ -0,0 +1,144 @@
+# scheduler.py
+
+import time
+import heapq
+import itertools
+import threading
+import logging
+
+from .metrics import METRICS
+from .duration_history import predicted_makespan
+
+# 같은 시각에 due인 작업 중 먼저 꺼낼 순서 (정리 작업 → 사이트)
+PRIORITY_HOUSEKEEPING = 0
+PRIORITY_SITE = 1
+
+# next_due()가 시각을 주지 못했을 때 다시 시도할 간격(초)
+RETRY_DELAY = 60
+
+
+class _Job:
+    __slots__ = ("name", "func", "next_due", "priority")
+
+    def __init__(self, name, func, next_due, priority):
+        self.name = name
+        self.func = func
+        self.next_due = next_due
+        self.priority = priority
+
+
+class SiteScheduler:
+    """
+    사이트마다 다음 실행 시각을 따로 갖는 연속 스케줄러.
+    - (due 시각, 우선순위, 순번, 작업) 힙에서 워커 스레드가 가장 먼저 due가 되는 작업을 꺼내 실행한다.
+    - 작업이 끝나면 그 시점 기준 next_due()로 다음 시각을 다시 넣는다.
+      → 한 사이트가 오래 걸려도(전체 역순 크롤링, 재시도 중인 호스트 등) 다른 사이트의 다음 확인을 막지 않는다.
+    - 같은 작업은 실행 중에는 힙에 없으므로 동시에 두 번 돌지 않는다.
+    - durations(DurationHistory)가 있으면 같은 시각에 due인 작업은 예상 실행 시간이 긴 것부터 꺼내고(LPT),
+      그 묶음(wave)이 모두 끝나면 예상 makespan(LPT / 힙에 넣은 순서)과 실제 makespan을 로그로 남긴다.
+    next_due(): 다음 실행 시각(epoch 초) 또는 None을 돌려주는 함수.
+    """
+
+    def __init__(self, workers, logger=None, durations=None):
+        self.workers = workers
+        self.logger = logger or logging.getLogger("AnnouncementCrawler")
+        self.durations = durations
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._threads = []
+        # due 시각 -> {"pending": 남은 작업 수, "expected": [(순번, 예상 시간)], "finished": 마지막 종료 시각}
+        self._waves = {}
+
+    def add(self, name, func, next_due, first_due=None, priority=PRIORITY_SITE):
+        """작업 등록. first_due가 없으면 바로 실행 대상"""
+        job = _Job(name, func, next_due, priority)
+        self._push(job, time.time() if first_due is None else first_due)
+
+    def _push(self, job, due):
+        expected = self.durations.expected(job.name) if self.durations else 0.0
+        with self._cond:
+            seq = next(self._seq)
+            heapq.heappush(self._heap, (due, job.priority, -expected, seq, job))
+            wave = self._waves.setdefault(due, {"pending": 0, "expected": [], "finished": due})
+            wave["pending"] += 1
+            wave["expected"].append((seq, expected))
+            self._cond.notify()
+
+    def _pop_due(self):
+        """가장 먼저 due가 되는 작업을 due 시각까지 기다렸다가 꺼낸다 (중지되면 None)"""
+        with self._cond:
+            while not self._stopped:
+                if self._heap:
+                    due, _, _, _, job = self._heap[0]
+                    wait = due - time.time()
+                    if wait <= 0:
+                        heapq.heappop(self._heap)
+                        return due, job
+                    self._cond.wait(wait)
+                else:
+                    self._cond.wait()
+            return None
+
+    def _worker(self):
+        while True:
+            item = self._pop_due()
+            if item is None:
+                return
+            due, job = item
+            started = time.time()
+            # due보다 늦게 시작한 시간 (워커가 모자라면 커진다)
+            METRICS.incr("scheduler.runs")
+            METRICS.incr("scheduler.start_lag", started - due)
+            try:
+                job.func()
+            except Exception as e:
+                self.logger.error(f"[scheduler] {job.name} 실행 중 오류: {e}")
+            finished = time.time()
+            METRICS.incr("scheduler.busy_seconds", finished - started)
+            if self.durations:
+                self.durations.record(job.name, finished - started)
+            self._finish_wave(due, finished)
+
+            next_due = job.next_due()
+            if next_due is None:
+                self.logger.error(f"[scheduler] {job.name} 다음 실행 시간을 계산할 수 없습니다. {RETRY_DELAY}초 후 다시 계산합니다.")
+                next_due = time.time() + RETRY_DELAY
+            self._push(job, next_due)
+
+    def _finish_wave(self, due, finished):
+        with self._cond:
+            wave = self._waves[due]
+            wave["pending"] -= 1
+            wave["finished"] = max(wave["finished"], finished)
+            if wave["pending"]:
+                return
+            del self._waves[due]
+        if len(wave["expected"]) < 2:
+            return
+        lpt = predicted_makespan(sorted((e for _, e in wave["expected"]), reverse=True), self.workers)
+        in_order = predicted_makespan([e for _, e in sorted(wave["expected"])], self.workers)
+        self.logger.info(f"[scheduler] 동시 due {len(wave['expected'])}개: 예상 makespan {lpt:.1f}초 "
+                         f"(넣은 순서면 {in_order:.1f}초), 실제 {wave['finished'] - due:.1f}초")
+
+    def start(self):
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"scheduler-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def run_forever(self):
+        self.start()
+        for thread in self._threads:
+            thread.join()
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+
+    def pending(self):
+        """[(due 시각, 작업 이름)] due 순"""
+        with self._cond:
+            return [(due, job.name) for due, _, _, _, job in sorted(self._heap)]
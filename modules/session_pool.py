@@ -0,0 +1,86 @@
+# session_pool.py
+
+import threading
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config.fetch_config import SINK_POOL_MAXSIZE
+
+
+class SessionRegistry:
+    """
+    호스트별로 오래 유지되는 requests.Session 저장소.
+    ISSAC / OpenSearch 같은 원격 적재(sink) 요청이 매번 TCP/TLS 연결을 새로 맺지 않도록
+    모든 크롤러가 같은 세션(= 같은 urllib3 커넥션 풀)을 빌려 쓴다.
+    """
+
+    def __init__(self, pool_maxsize=SINK_POOL_MAXSIZE):
+        self.pool_maxsize = pool_maxsize
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def get(self, url):
+        """url의 호스트에 해당하는 공유 세션 반환 (없으면 생성)"""
+        parsed = urlparse(url)
+        key = f"{parsed.scheme}://{parsed.netloc}"
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                # 재시도는 호출부에서 처리하므로 어댑터 재시도는 끈다
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize, max_retries=0)
+                session.mount(f"{parsed.scheme}://", adapter)
+                self._sessions[key] = session
+            return session
+
+    def stats(self):
+        """
+        호스트별 연결 통계: {host: {"requests": n, "new_connections": n, "reused": n}}
+        urllib3 커넥션 풀의 요청 수 / 생성한 연결 수로 재사용 횟수를 계산한다.
+        """
+        with self._lock:
+            sessions = dict(self._sessions)
+
+        result = {}
+        for key, session in sessions.items():
+            num_requests = 0
+            num_connections = 0
+            for adapter in session.adapters.values():
+                pools = adapter.poolmanager.pools
+                for pool_key in pools.keys():
+                    pool = pools.get(pool_key)
+                    if pool is None:
+                        continue
+                    num_requests += pool.num_requests
+                    num_connections += pool.num_connections
+            result[key] = {
+                "requests": num_requests,
+                "new_connections": num_connections,
+                "reused": max(num_requests - num_connections, 0),
+            }
+        return result
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_session(url):
+    """프로세스 전체에서 공유하는 레지스트리에서 url 호스트용 세션을 빌린다"""
+    return get_session_registry().get(url)
+
+
+def get_session_registry():
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = SessionRegistry()
+        return _registry
@@ -0,0 +1,101 @@
+# site_plan.py
+
+from collections import namedtuple
+
+import soupsieve
+from bs4 import Tag
+
+from config.site_config import SITES
+
+# SIT 계열 사이트 판별용 날짜 선택자 (이 중 하나를 쓰면 offset 기반 목록 핸들러 사용)
+SIT_DATE_SELECTORS = (
+    "#jwxe_main_content > div > div.board-wrap > div > dl:nth-child(2) > dd",
+    "#jwxe_main_content > div > div.board-wrap > div > dl:nth-child(4) > dd",
+    "#jwxe_main_content > div > div > div > dl:nth-child(4) > dd",
+)
+
+# 사이트별 실행 계획 (불변). 선택자는 soupsieve로 미리 컴파일된 패턴, "null"/빈 값은 None.
+# 핸들러는 unbound 함수라서 인스턴스를 첫 인자로 넘겨 호출한다. 예) plan.source_handler(parser, soup, ...)
+SitePlan = namedtuple("SitePlan", [
+    "source",
+    "title", "date", "author", "content", "sub_category", "next_page",
+    "build_list_url",    # ListAnnouncementCrawler._build_list_url_* (없으면 None)
+    "parse_list_page",   # ListAnnouncementCrawler._parse_list_page_* (없으면 None)
+    "source_handler",    # AnnouncementParser.handle_* (없으면 None)
+    "file_handler",      # AnnouncementParser.handle_*_files (없으면 None)
+])
+
+SELECTOR_FIELDS = {
+    "title": "title_selector",
+    "date": "date_selector",
+    "author": "author_selector",
+    "content": "content_selector",
+    "sub_category": "sub_category_selector",
+    "next_page": "next_page_selector",
+}
+
+_plans = {}
+
+
+def compile_selector(selector, source="", field=""):
+    """CSS 선택자 컴파일. "null"/빈 값은 None, 문법 오류는 사이트/필드 이름을 붙여 ValueError"""
+    if not selector or selector == "null":
+        return None
+    try:
+        return soupsieve.compile(selector)
+    except soupsieve.SelectorSyntaxError as e:
+        raise ValueError(f"[{source}] {field} 선택자 오류: {selector!r} - {e}") from e
+
+
+def select_one(soup, pattern):
+    """컴파일된 선택자로 첫 요소 찾기 (pattern이 None이면 None)"""
+    if pattern is None:
+        return None
+    if isinstance(soup, Tag):
+        return pattern.select_one(soup)
+    # selectolax 어댑터(LexborNode) 등
+    return soup.select_one(pattern)
+
+
+def make_plan(source, config):
+    """사이트 설정 하나로 SitePlan 생성 (선택자 검증 포함)"""
+    # 핸들러 테이블이 있는 모듈들이 크롤러 쪽에서 이 모듈을 import하므로 순환을 피해 여기서 import
+    from .announcement_parser import SOURCE_HANDLERS, FILE_HANDLERS
+    from .announcement_crawler_for_notice_list import LIST_URL_BUILDERS, LIST_PAGE_PARSERS, SIT_LIST_HANDLERS
+
+    selectors = {
+        field: compile_selector(config.get(key), source, key)
+        for field, key in SELECTOR_FIELDS.items()
+    }
+
+    build_list_url = LIST_URL_BUILDERS.get(source)
+    parse_list_page = LIST_PAGE_PARSERS.get(source)
+    if config.get("date_selector") in SIT_DATE_SELECTORS:
+        build_list_url, parse_list_page = SIT_LIST_HANDLERS
+
+    return SitePlan(
+        source=source,
+        build_list_url=build_list_url,
+        parse_list_page=parse_list_page,
+        source_handler=SOURCE_HANDLERS.get(source),
+        file_handler=FILE_HANDLERS.get(source),
+        **selectors,
+    )
+
+
+def build_site_plans(sites=SITES):
+    """
+    시작 시 모든 사이트의 계획을 한 번에 만든다.
+    선택자 문법 오류가 있으면 첫 크롤링 전에 ValueError로 알린다.
+    """
+    for source, config in sites.items():
+        _plans[source] = make_plan(source, config)
+    return dict(_plans)
+
+
+def get_site_plan(source):
+    plan = _plans.get(source)
+    if plan is None:
+        plan = make_plan(source, SITES.get(source, {}))
+        _plans[source] = plan
+    return plan
@@ -0,0 +1,93 @@
+# validator_cache.py
+
+import os
+import json
+import threading
+
+
+class ValidatorCache:
+    """
+    URL별 HTTP 검증자(ETag / Last-Modified) 저장소.
+    - 조건부 요청(conditional=True)이 200을 받으면 stage()로 임시 보관하고,
+      크롤러가 해당 페이지 처리를 끝낸 뒤 commit()해야 조건부 요청에 사용된다.
+      (처리 도중 실패한 페이지가 304로 영영 건너뛰어지는 것을 막기 위함)
+    - 커밋된 검증자는 파일에 저장되어 재시작 후에도 유지된다.
+    """
+
+    def __init__(self, path="./output/http_cache/validators.json"):
+        self.path = path
+        self._validators = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._validators = json.load(f)
+            except (OSError, ValueError):
+                self._validators = {}
+
+    def save(self, discard_pending=True):
+        """
+        커밋된 검증자를 파일로 저장하고, 커밋되지 않은 임시 검증자는 버린다.
+        다른 사이트가 아직 처리 중일 때 저장하면(연속 스케줄러) discard_pending=False로 임시 검증자를 남겨둔다.
+        """
+        with self._lock:
+            data = dict(self._validators)
+            if discard_pending:
+                self._pending.clear()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    def request_headers(self, url):
+        """조건부 요청에 붙일 헤더 (검증자가 없으면 빈 dict)"""
+        with self._lock:
+            validator = self._validators.get(url)
+        headers = {}
+        if validator:
+            if validator.get("etag"):
+                headers["If-None-Match"] = validator["etag"]
+            if validator.get("last_modified"):
+                headers["If-Modified-Since"] = validator["last_modified"]
+        return headers
+
+    def stage(self, url, response_headers, size):
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        with self._lock:
+            self._pending[url] = {"etag": etag, "last_modified": last_modified, "size": size}
+
+    def commit(self, url):
+        with self._lock:
+            validator = self._pending.pop(url, None)
+            if validator:
+                self._validators[url] = validator
+
+    def discard(self, url):
+        """처리를 끝내지 못한 페이지의 임시 검증자를 버린다 (다음 요청은 조건 없이 보냄)"""
+        with self._lock:
+            self._pending.pop(url, None)
+
+    def size_of(self, url):
+        """마지막으로 받은 본문 크기 (304로 절약한 바이트 계산용)"""
+        with self._lock:
+            validator = self._validators.get(url)
+        return validator.get("size", 0) if validator else 0
+
+
+_validator_cache = None
+_validator_cache_lock = threading.Lock()
+
+
+def get_validator_cache():
+    """프로세스 전체에서 공유하는 검증자 저장소 반환"""
+    global _validator_cache
+    with _validator_cache_lock:
+        if _validator_cache is None:
+            _validator_cache = ValidatorCache()
+        return _validator_cache